@@ -29,14 +29,12 @@ from __future__ import annotations
 
 import asyncio
 import argparse
-import json
 import os
 import random
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -48,181 +46,13 @@ load_dotenv(project_root / ".env")
 from src.storage.database import Database
 from src.storage.models import ContentItem, ProcessedContent
 from src.processors.summarizer import Summarizer, MIN_WORD_COUNT
+from src.processors.gemini_client import AsyncGeminiClient
+from src.processors.openai_client import AsyncOpenAIClient
+from src.processors.logs import setup_logging
 from src.processors.prompts import build_summarization_prompt, PROMPT_VERSION
 from src.fetchers.rss import _is_paywall_content
 
 
-# ==============================================================================
-# Async LLM Callers
-# ==============================================================================
-
-class AsyncGeminiCaller:
-    """
-    Native async Gemini caller using google.genai aio interface.
-    Mirrors the retry logic from GeminiClient.generate().
-    """
-
-    MAX_INPUT_TOKENS = 900_000
-
-    def __init__(self):
-        from google import genai
-        from google.genai import types
-        self.client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-        self.model_name = "gemini-2.5-flash"
-        self._types = types
-
-    async def generate(self, prompt: str, max_retries: int = 3) -> Optional[dict]:
-        """Send a prompt to Gemini async and return parsed JSON, or None on failure."""
-        for attempt in range(max_retries):
-            try:
-                response = await self.client.aio.models.generate_content(
-                    model=self.model_name,
-                    contents=prompt,
-                    config=self._types.GenerateContentConfig(
-                        temperature=0.3,
-                        max_output_tokens=4096,
-                        response_mime_type="application/json",
-                    ),
-                )
-
-                text = response.text.strip()
-
-                # Strip markdown code blocks (Gemini sometimes wraps JSON)
-                if text.startswith("```json"):
-                    text = text[7:]
-                if text.startswith("```"):
-                    text = text[3:]
-                if text.endswith("```"):
-                    text = text[:-3]
-                text = text.strip()
-
-                return json.loads(text)
-
-            except json.JSONDecodeError as e:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-
-            except Exception as e:
-                error_str = str(e).lower()
-
-                if "429" in error_str or "rate" in error_str or "quota" in error_str:
-                    # Daily quota exhaustion — no point retrying
-                    if "free_tier" in error_str and "limit: 0" in error_str:
-                        print(f"  [Gemini] FREE TIER QUOTA EXHAUSTED — cannot retry")
-                        return None
-                    wait_time = 30 * (attempt + 1)
-                    print(f"  [Gemini] Rate limited, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
-
-                elif "500" in error_str or "503" in error_str:
-                    wait_time = 2 ** attempt
-                    await asyncio.sleep(wait_time)
-
-                else:
-                    print(f"  [Gemini] API error (attempt {attempt + 1}/{max_retries}): {e}")
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-
-        return None
-
-    @staticmethod
-    def estimate_tokens(text: str) -> int:
-        return len(text) // 4
-
-    @staticmethod
-    def truncate_for_context(text: str, max_tokens: int) -> str:
-        max_chars = max_tokens * 4
-        truncated = text[:max_chars]
-        last_period = truncated.rfind('. ')
-        if last_period > max_chars * 0.8:
-            truncated = truncated[:last_period + 1]
-        return truncated + "\n\n[Content truncated due to length]"
-
-
-class AsyncOpenAICaller:
-    """
-    Native async OpenAI caller using AsyncOpenAI.
-    Mirrors the retry logic from OpenAIClient.generate().
-    """
-
-    MAX_INPUT_TOKENS = 120_000
-
-    def __init__(self):
-        from openai import AsyncOpenAI
-        self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model_name = "gpt-4o"
-
-    async def generate(self, prompt: str, max_retries: int = 3) -> Optional[dict]:
-        """Send a prompt to OpenAI async and return parsed JSON, or None on failure."""
-        for attempt in range(max_retries):
-            try:
-                response = await self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a sharp tech/business analyst. Always respond with valid JSON only, no markdown formatting."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.3,
-                    max_tokens=4096,
-                    response_format={"type": "json_object"},
-                )
-
-                text = response.choices[0].message.content.strip()
-
-                # Strip markdown code blocks
-                if text.startswith("```json"):
-                    text = text[7:]
-                if text.startswith("```"):
-                    text = text[3:]
-                if text.endswith("```"):
-                    text = text[:-3]
-                text = text.strip()
-
-                return json.loads(text)
-
-            except json.JSONDecodeError as e:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-
-            except Exception as e:
-                error_str = str(e).lower()
-
-                if "429" in error_str or "rate" in error_str:
-                    wait_time = 30 * (attempt + 1)
-                    print(f"  [OpenAI] Rate limited, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
-
-                elif "500" in error_str or "503" in error_str:
-                    wait_time = 2 ** attempt
-                    await asyncio.sleep(wait_time)
-
-                else:
-                    print(f"  [OpenAI] API error (attempt {attempt + 1}/{max_retries}): {e}")
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-
-        return None
-
-    @staticmethod
-    def estimate_tokens(text: str) -> int:
-        return len(text) // 4
-
-    @staticmethod
-    def truncate_for_context(text: str, max_tokens: int) -> str:
-        max_chars = max_tokens * 4
-        truncated = text[:max_chars]
-        last_period = truncated.rfind('. ')
-        if last_period > max_chars * 0.8:
-            truncated = truncated[:last_period + 1]
-        return truncated + "\n\n[Content truncated due to length]"
-
-
 # ==============================================================================
 # Core Processing Logic
 # ==============================================================================
@@ -240,25 +70,19 @@ async def process_one(
     async with semaphore:
         try:
             # 1. Build prompt
-            prompt = build_summarization_prompt(item)
-
-            # 2. Truncate if needed
-            estimated_tokens = caller.estimate_tokens(prompt)
-            if estimated_tokens > caller.MAX_INPUT_TOKENS:
-                prompt_without_transcript = prompt.replace(item.transcript, "")
-                max_transcript_tokens = caller.MAX_INPUT_TOKENS - caller.estimate_tokens(
-                    prompt_without_transcript
-                )
-                truncated_transcript = caller.truncate_for_context(
-                    item.transcript, max_transcript_tokens
-                )
-                original_transcript = item.transcript
-                item.transcript = truncated_transcript
-                prompt = build_summarization_prompt(item)
-                item.transcript = original_transcript  # Restore original
+            system_prompt, header = build_summarization_prompt(item, transcript="")
+
+            # 2. Truncate the transcript to what the context window leaves
+            max_transcript_tokens = (
+                caller.MAX_INPUT_TOKENS
+                - caller.estimate_tokens(system_prompt)
+                - caller.estimate_tokens(header)
+            )
+            transcript = caller.truncate_for_context(item.transcript, max_transcript_tokens)
+            _, prompt = build_summarization_prompt(item, transcript=transcript)
 
             # 3. Call LLM (this is the async I/O we're parallelizing)
-            result = await caller.generate(prompt)
+            result = await caller.generate(prompt, system_prompt=system_prompt)
 
             # 4. Parse response using existing Summarizer logic
             processed = None
@@ -292,8 +116,9 @@ async def db_writer(db_queue: asyncio.Queue, db: Database, stats: dict):
 
         try:
             if processed is not None:
-                db.save_processed(processed)
-                db.update_content_status(item.id, "processed")
+                with db.transaction():
+                    db.save_processed(processed)
+                    db.update_content_status(item.id, "processed")
                 stats["processed"] += 1
                 stats[f"{provider_name}_ok"] += 1
             else:
@@ -352,21 +177,23 @@ async def run(args):
     processable = []
     skip_reasons = {"no_transcript": 0, "paywall": 0, "too_short": 0}
 
-    for item in pending:
-        if not item.transcript:
-            db.update_content_status(item.id, "no_transcript")
-            stats["skipped"] += 1
-            skip_reasons["no_transcript"] += 1
-        elif _is_paywall_content(item.transcript):
-            db.update_content_status(item.id, "paywall")
-            stats["skipped"] += 1
-            skip_reasons["paywall"] += 1
-        elif item.word_count < MIN_WORD_COUNT:
-            db.update_content_status(item.id, "skipped")
-            stats["skipped"] += 1
-            skip_reasons["too_short"] += 1
-        else:
-            processable.append(item)
+    # Status updates for skipped items share one commit
+    with db.transaction():
+        for item in pending:
+            if not item.transcript:
+                db.update_content_status(item.id, "no_transcript")
+                stats["skipped"] += 1
+                skip_reasons["no_transcript"] += 1
+            elif _is_paywall_content(item.transcript):
+                db.update_content_status(item.id, "paywall")
+                stats["skipped"] += 1
+                skip_reasons["paywall"] += 1
+            elif item.word_count < MIN_WORD_COUNT:
+                db.update_content_status(item.id, "skipped")
+                stats["skipped"] += 1
+                skip_reasons["too_short"] += 1
+            else:
+                processable.append(item)
 
     print(f"Processable: {len(processable)} | Skipped: {stats['skipped']}")
     if stats["skipped"] > 0:
@@ -399,14 +226,14 @@ async def run(args):
 
     if os.getenv("GEMINI_API_KEY") and args.gemini_share > 0:
         try:
-            gemini_caller = AsyncGeminiCaller()
+            gemini_caller = AsyncGeminiClient()
             print(f"  Gemini: {gemini_caller.model_name} (concurrency: {args.gemini_concurrency})")
         except Exception as e:
             print(f"  WARNING: Gemini init failed: {e}")
 
     if os.getenv("OPENAI_API_KEY") and args.gemini_share < 1.0:
         try:
-            openai_caller = AsyncOpenAICaller()
+            openai_caller = AsyncOpenAIClient()
             print(f"  OpenAI: {openai_caller.model_name} (concurrency: {args.openai_concurrency})")
         except Exception as e:
             print(f"  WARNING: OpenAI init failed: {e}")
@@ -590,6 +417,7 @@ Examples:
         help="Show what would be processed without calling APIs"
     )
     args = parser.parse_args()
+    setup_logging()
 
     # Validate gemini-share
     if not 0.0 <= args.gemini_share <= 1.0:
@@ -58,6 +58,7 @@ def fetch_source(db: Database, source: Source, transcript_delay: float,
             limit=1000,  # High limit to get full history
             include_transcripts=include_transcripts,
             transcript_delay=transcript_delay,
+            is_known=db.content_url_exists,
         ):
             if db.save_content(item):
                 stats["new"] += 1
@@ -106,13 +106,16 @@ class BriefingComposer:
         Call this after the briefing has been composed and
         (optionally) the email has been sent.
         """
-        self.db.save_briefing(briefing)
-        self.db.mark_delivered(briefing.item_ids)
+        # One transaction, so a briefing is never saved without its items
+        # being marked delivered (and it's one commit, not three)
+        with self.db.transaction():
+            self.db.save_briefing(briefing)
+            self.db.mark_delivered(briefing.item_ids)
 
-        # Update backlog progress
-        backlog_count = briefing.backlog_count
-        if backlog_count > 0:
-            self.db.update_backlog_progress(delivered_increment=backlog_count)
+            # Update backlog progress
+            backlog_count = briefing.backlog_count
+            if backlog_count > 0:
+                self.db.update_backlog_progress(delivered_increment=backlog_count)
 
     def get_briefing_items(self, briefing: DailyBriefing) -> list[dict]:
         """
@@ -121,9 +124,10 @@ class BriefingComposer:
         Returns a list of dicts with both ContentItem and ProcessedContent fields,
         in the briefing's display order.
         """
+        found = self.db.get_full_content_with_processed_many(briefing.item_ids)
         items = []
         for content_id in briefing.item_ids:
-            result = self.db.get_full_content_with_processed(content_id)
+            result = found.get(content_id)
             if result:
                 content, processed = result
                 items.append({
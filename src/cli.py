@@ -9,6 +9,7 @@ Usage:
     python -m src.cli stats
 """
 
+import asyncio
 import os
 import sys
 from datetime import datetime, date
@@ -26,6 +27,7 @@ from src.storage.database import Database
 from src.storage.models import Source, ContentItem
 from src.fetchers import get_fetcher
 from src.processors import Summarizer, GeminiClient, LLMClient
+from src.processors.logs import setup_logging
 from src.briefing import BriefingComposer, Emailer
 
 
@@ -67,8 +69,12 @@ def get_source_by_id(source_id: str) -> Source:
 @click.pass_context
 def cli(ctx, db_path):
     """Daily Briefing Tool - Content aggregation and summarization."""
+    setup_logging()
     ctx.ensure_object(dict)
     ctx.obj['db'] = Database(db_path)
+    # Closing checkpoints the WAL back into the database file, which is the
+    # only file the daily workflow persists
+    ctx.call_on_close(ctx.obj['db'].close)
 
 
 @cli.command()
@@ -120,7 +126,8 @@ def fetch(ctx, source, fetch_all, since, limit, no_transcripts):
             for item in fetcher.fetch_all(
                 since=since_date or src.fetch_since,
                 limit=limit,
-                include_transcripts=not no_transcripts
+                include_transcripts=not no_transcripts,
+                is_known=db.content_url_exists,
             ):
                 # Try to save (will fail silently if duplicate)
                 if db.save_content(item):
@@ -160,23 +167,8 @@ def list_content(ctx, status, source, limit):
     """
     db = ctx.obj['db']
     
-    # Get items based on filters
-    if status:
-        items = db.get_pending_content(limit=limit) if status == 'pending' else []
-        # For other statuses, we need to add a query method
-        if status != 'pending':
-            cursor = db.conn.cursor()
-            cursor.execute(
-                "SELECT * FROM content_items WHERE status = ? ORDER BY published_at DESC LIMIT ?",
-                (status, limit)
-            )
-            items = [db._row_to_content_item(row) for row in cursor.fetchall()]
-    elif source:
-        items = db.get_content_by_source(source)[:limit]
-    else:
-        cursor = db.conn.cursor()
-        cursor.execute("SELECT * FROM content_items ORDER BY published_at DESC LIMIT ?", (limit,))
-        items = [db._row_to_content_item(row) for row in cursor.fetchall()]
+    # Listing needs only a few columns, so skip loading transcripts
+    items = db.get_content_rows(status=status, source_id=source, limit=limit)
     
     if not items:
         click.echo("No items found.")
@@ -186,9 +178,9 @@ def list_content(ctx, status, source, limit):
     click.echo("-" * 90)
     
     for item in items:
-        title = item.title[:38] + ".." if len(item.title) > 40 else item.title
-        source_name = item.source_id[:18] + ".." if len(item.source_id) > 20 else item.source_id
-        click.echo(f"{item.id:<18} {item.status:<12} {source_name:<20} {title:<40}")
+        title = item["title"][:38] + ".." if len(item["title"]) > 40 else item["title"]
+        source_name = item["source_id"][:18] + ".." if len(item["source_id"]) > 20 else item["source_id"]
+        click.echo(f"{item['id']:<18} {item['status']:<12} {source_name:<20} {title:<40}")
     
     click.echo(f"\nTotal: {len(items)} items")
 
@@ -316,8 +308,12 @@ def sources(ctx):
 @click.option('--provider', type=click.Choice(['auto', 'gemini', 'openai']), default='auto',
               help='LLM provider: auto (Gemini + OpenAI fallback), gemini, or openai')
 @click.option('--delay', type=int, default=0, help='Delay in seconds between API calls (helps with rate limits)')
+@click.option('--batch-size', type=int, default=1,
+              help='Items to summarize per LLM call (1 = one call per item)')
+@click.option('--concurrency', type=int, default=1,
+              help='LLM calls in flight at once (with --delay, calls still start at most once per delay)')
 @click.pass_context
-def process(ctx, content_id, process_all, limit, provider, delay):
+def process(ctx, content_id, process_all, limit, provider, delay, batch_size, concurrency):
     """
     Process pending content through LLM for summarization.
 
@@ -327,12 +323,19 @@ def process(ctx, content_id, process_all, limit, provider, delay):
         python -m src.cli process --all
         python -m src.cli process --all --provider openai
         python -m src.cli process --all --limit 5 --delay 20
+        python -m src.cli process --all --batch-size 4
+        python -m src.cli process --all --concurrency 4
+
+    --batch-size and --concurrency can't be combined: batches are sent
+    one at a time.
     """
     db = ctx.obj['db']
 
     if not content_id and not process_all:
         click.echo("Error: Specify --id or --all", err=True)
         sys.exit(1)
+    if batch_size > 1 and concurrency > 1:
+        raise click.UsageError("--concurrency does not apply to batched mode (--batch-size > 1)")
 
     try:
         client = LLMClient(provider=provider)
@@ -368,7 +371,15 @@ def process(ctx, content_id, process_all, limit, provider, delay):
     else:
         # Process all pending
         click.echo(f"\nProcessing pending content (provider: {provider}, delay: {delay}s)...")
-        stats = summarizer.process_pending(limit=limit, delay=delay)
+        if batch_size > 1:
+            stats = summarizer.process_pending_batched(limit=limit, batch_size=batch_size, delay=delay)
+        elif concurrency > 1:
+            rpm_limit = 60 / delay if delay > 0 else None
+            stats = asyncio.run(summarizer.process_pending_async(
+                limit=limit, concurrency=concurrency, rpm_limit=rpm_limit
+            ))
+        else:
+            stats = summarizer.process_pending(limit=limit, delay=delay)
         click.echo(f"\n{'='*50}")
         click.echo(f"RESULTS")
         click.echo(f"  Processed: {stats['processed']}")
@@ -564,6 +575,25 @@ def init_db(ctx):
     click.echo("Tables created successfully.")
 
 
+@cli.command()
+@click.option('--vacuum', is_flag=True, help='Also VACUUM to compact the database file (slower)')
+@click.pass_context
+def maintain(ctx, vacuum):
+    """
+    Refresh query planner statistics (ANALYZE), optionally VACUUM.
+    
+    Examples:
+        python -m src.cli maintain
+        python -m src.cli maintain --vacuum
+    """
+    db = ctx.obj['db']
+    size_before = db.db_path.stat().st_size
+    db.maintenance(full=vacuum)
+    click.echo("Statistics refreshed.")
+    if vacuum:
+        click.echo(f"Vacuumed: {size_before / 1024:,.0f} KB -> {db.db_path.stat().st_size / 1024:,.0f} KB")
+
+
 @cli.command('enrich-durations')
 @click.pass_context
 def enrich_durations(ctx):
@@ -9,7 +9,7 @@ to treat all sources uniformly.
 from abc import ABC, abstractmethod
 import time
 from datetime import date
-from typing import Generator, Optional
+from typing import Callable, Generator, Optional
 
 from ..storage.models import ContentItem, Source
 
@@ -66,7 +66,14 @@ class BaseFetcher(ABC):
         """
         pass
     
-    def fetch_all(self, since: date = None, limit: int = None, include_transcripts: bool = True, transcript_delay: float = 2.0) -> Generator[ContentItem, None, None]:
+    def fetch_all(
+        self,
+        since: date = None,
+        limit: int = None,
+        include_transcripts: bool = True,
+        transcript_delay: float = 2.0,
+        is_known: Optional[Callable[[str], bool]] = None,
+    ) -> Generator[ContentItem, None, None]:
         """
         Fetch all content with transcripts.
 
@@ -81,13 +88,16 @@ class BaseFetcher(ABC):
             include_transcripts: If True, fetch transcripts (slower but complete)
             transcript_delay: Seconds to wait between transcript fetches
                 to avoid YouTube rate limiting (default 2.0)
+            is_known: Returns True for URLs that are already stored (e.g.
+                Database.content_url_exists). Those items are still yielded,
+                but without fetching their transcripts.
 
         Yields:
             Complete ContentItem objects with transcripts
         """
         is_first = True
         for item in self.fetch_content_list(since=since, limit=limit):
-            if include_transcripts:
+            if include_transcripts and not (is_known and is_known(item.url)):
                 # Throttle transcript fetches to avoid YouTube rate limiting
                 if not is_first and transcript_delay > 0:
                     time.sleep(transcript_delay)
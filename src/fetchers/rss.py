@@ -14,7 +14,7 @@ import re
 import time
 import requests
 from datetime import datetime, date
-from typing import Generator, Optional
+from typing import Callable, Generator, Optional
 
 import feedparser
 from bs4 import BeautifulSoup
@@ -351,14 +351,22 @@ class RSSFetcher(BaseFetcher):
             # Return whatever we got from RSS
             return item.transcript
     
-    def fetch_all(self, since: date = None, limit: int = None, include_transcripts: bool = True, transcript_delay: float = 0) -> Generator[ContentItem, None, None]:
+    def fetch_all(
+        self,
+        since: date = None,
+        limit: int = None,
+        include_transcripts: bool = True,
+        transcript_delay: float = 0,
+        is_known: Optional[Callable[[str], bool]] = None,
+    ) -> Generator[ContentItem, None, None]:
         """
         Fetch all articles with full content.
         
         Overridden to handle RSS articles which may already have content.
+        Articles whose URL is_known are yielded without a full-content fetch.
         """
         for item in self.fetch_content_list(since=since, limit=limit):
-            if include_transcripts:
+            if include_transcripts and not (is_known and is_known(item.url)):
                 # Always try to get full content for articles
                 full_content = self.fetch_transcript(item)
                 if full_content:
@@ -12,33 +12,104 @@ Supports three video discovery strategies (in priority order):
 3. Page scraping (~30 most recent videos)
 """
 
+import functools
+import gzip
+import hashlib
+import operator
 import os
+import queue
+import random
 import re
 import json
-import signal
+import threading
 import time
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, date
-from typing import Generator, Optional
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Generator, Optional
 from urllib.parse import urlparse, parse_qs
 
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
+    RequestBlocked,
     VideoUnavailable,
 )
 
 from .base import BaseFetcher
 from ..storage.models import ContentItem, Source
 
+# orjson parses the multi-MB ytInitialData blob several times faster than
+# stdlib json. Optional: fall back to json if it isn't installed.
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError, so except clauses
+# work unchanged with either.)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _json_loads = json.loads
+
 # YouTube Data API v3 base URL
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
 
-# Timeout for transcript fetch operations (seconds).
+# Timeout for each transcript HTTP request (seconds).
 # Prevents the pipeline from hanging if YouTube is slow or partially responding.
 TRANSCRIPT_TIMEOUT_SECONDS = 60
 
+# On-disk transcript cache. Transcripts don't change once published, so a hit
+# skips every YouTube request for that video on later runs.
+DEFAULT_TRANSCRIPT_CACHE_DIR = "~/.cache/daily-briefing/transcripts"
+
+# On-disk validators (ETag / Last-Modified) and parsed results for the
+# channel page and RSS feed, so unchanged pages come back as 304s.
+DEFAULT_HTTP_CACHE_DIR = "~/.cache/daily-briefing/http"
+
+# How long a "transcripts disabled / video unavailable" result is trusted
+# before we ask YouTube again (seconds).
+TRANSCRIPT_NEGATIVE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# C-level accessor for joining transcript snippets without an intermediate list
+_snippet_text = operator.attrgetter("text")
+
+
+class _TimeoutSession(requests.Session):
+    """requests.Session that applies TRANSCRIPT_TIMEOUT_SECONDS to every request."""
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", TRANSCRIPT_TIMEOUT_SECONDS)
+        return super().request(*args, **kwargs)
+
+
+class _SlidingWindowLimiter:
+    """
+    Thread-safe limiter allowing at most max_calls per window_seconds.
+
+    acquire() blocks until a slot is free in the trailing window.
+    """
+
+    def __init__(self, max_calls: int, window_seconds: float = 60.0):
+        self.max_calls = max_calls
+        self.window_seconds = window_seconds
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window_seconds:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.window_seconds - (now - self._calls[0])
+            time.sleep(wait)
+
 
 class YouTubeFetcher(BaseFetcher):
     """
@@ -61,12 +132,41 @@ class YouTubeFetcher(BaseFetcher):
         r'youtube\.com/user/([^/]+)',       # youtube.com/user/name
     ]
 
-    # Delay between YouTube Data API calls (seconds) to be respectful
+    # YouTube Data API pacing. The API enforces a daily quota rather than a
+    # per-second rate, so calls aren't pre-emptively spaced out. Instead a
+    # limiter caps bursts at API_MAX_CALLS_PER_SECOND, and 429/5xx responses
+    # are retried with exponential backoff (API_CALL_DELAY is the base),
+    # honoring Retry-After when YouTube sends it.
     API_CALL_DELAY = 0.5
+    API_MAX_RETRIES = 3
+    API_MAX_CALLS_PER_SECOND = 30
+
+    # yt-dlp duration enrichment: concurrent lookups, bounded to stay under
+    # YouTube's (undocumented) rate limits. The shared backoff delay doubles
+    # on each failure and shrinks by one step on each success.
+    YTDLP_MAX_WORKERS = 8
+    YTDLP_BACKOFF_STEP_SECONDS = 0.5
+    YTDLP_MAX_BACKOFF_SECONDS = 10.0
+
+    # Transcript fetching: concurrent workers, an overall request budget
+    # (sliding one-minute window), and retries for rate-limit errors.
+    TRANSCRIPT_MAX_WORKERS = 6
+    TRANSCRIPT_MAX_CALLS_PER_MINUTE = 60
+    TRANSCRIPT_MAX_RETRIES = 4
 
     def __init__(self, source: Source):
         super().__init__(source)
         self.channel_id = self._extract_channel_identifier()
+        self._session = requests.Session()
+        self._api_limiter = _SlidingWindowLimiter(self.API_MAX_CALLS_PER_SECOND, window_seconds=1.0)
+        self._transcript_api_pool = queue.SimpleQueue()
+        self._transcript_limiter = _SlidingWindowLimiter(self.TRANSCRIPT_MAX_CALLS_PER_MINUTE)
+        self._transcript_cache_dir = Path(
+            os.getenv("TRANSCRIPT_CACHE_DIR", DEFAULT_TRANSCRIPT_CACHE_DIR)
+        ).expanduser()
+        self._http_cache_dir = Path(
+            os.getenv("HTTP_CACHE_DIR", DEFAULT_HTTP_CACHE_DIR)
+        ).expanduser()
 
     def _extract_channel_identifier(self) -> str:
         """Extract channel handle or ID from URL."""
@@ -113,6 +213,35 @@ class YouTubeFetcher(BaseFetcher):
         seconds = int(match.group(3) or 0)
         return hours * 3600 + minutes * 60 + seconds
 
+    def _api_get(self, endpoint: str, params: dict) -> dict:
+        """
+        GET a YouTube Data API endpoint and return the parsed JSON body.
+
+        Retries 429 and 5xx responses with exponential backoff (or the
+        server's Retry-After). Raises requests.HTTPError once retries are
+        exhausted or for any other error status.
+        """
+        for attempt in range(self.API_MAX_RETRIES + 1):
+            self._api_limiter.acquire()
+            resp = self._session.get(
+                f"{YOUTUBE_API_BASE}/{endpoint}",
+                params=params,
+                timeout=15,
+            )
+
+            if resp.status_code in (429, 500, 503) and attempt < self.API_MAX_RETRIES:
+                wait_time = self.API_CALL_DELAY * 2 ** attempt
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    wait_time = max(wait_time, int(retry_after))
+                print(f"  API: {endpoint} returned {resp.status_code}, retrying in {wait_time:.1f}s "
+                      f"(attempt {attempt + 1}/{self.API_MAX_RETRIES})")
+                time.sleep(wait_time)
+                continue
+
+            resp.raise_for_status()
+            return _json_loads(resp.content)
+
     def _resolve_channel_id(self, api_key: str) -> Optional[str]:
         """
         Resolve a channel handle (e.g. 'DwarkeshPatel') or channel ID to a
@@ -127,20 +256,17 @@ class YouTubeFetcher(BaseFetcher):
         if identifier.startswith("UC") and len(identifier) == 24:
             return identifier
 
-        # Use forHandle parameter (works for @handle URLs)
+        # Use forHandle parameter (works for @handle URLs).
+        # Only the ID is needed — the uploads playlist is derived from it —
+        # so `fields` trims the response down to just that.
         params = {
-            "part": "id,contentDetails",
+            "part": "id",
+            "fields": "items(id)",
             "forHandle": identifier,
             "key": api_key,
         }
         try:
-            resp = requests.get(
-                f"{YOUTUBE_API_BASE}/channels",
-                params=params,
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._api_get("channels", params)
 
             items = data.get("items", [])
             if items:
@@ -149,13 +275,7 @@ class YouTubeFetcher(BaseFetcher):
             # forHandle didn't work — try forUsername as fallback
             params.pop("forHandle")
             params["forUsername"] = identifier
-            resp = requests.get(
-                f"{YOUTUBE_API_BASE}/channels",
-                params=params,
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._api_get("channels", params)
             items = data.get("items", [])
             if items:
                 return items[0]["id"]
@@ -211,6 +331,8 @@ class YouTubeFetcher(BaseFetcher):
         while len(raw_videos) < limit:
             params = {
                 "part": "snippet",
+                # Partial response: skip thumbnails, descriptions, etc.
+                "fields": "items(snippet(resourceId/videoId,title,publishedAt)),nextPageToken",
                 "playlistId": uploads_playlist_id,
                 "maxResults": 50,
                 "key": api_key,
@@ -219,13 +341,7 @@ class YouTubeFetcher(BaseFetcher):
                 params["pageToken"] = next_page_token
 
             try:
-                resp = requests.get(
-                    f"{YOUTUBE_API_BASE}/playlistItems",
-                    params=params,
-                    timeout=15,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+                data = self._api_get("playlistItems", params)
             except Exception as e:
                 print(f"  API: playlistItems request failed: {e}")
                 break
@@ -254,9 +370,6 @@ class YouTubeFetcher(BaseFetcher):
             if not next_page_token:
                 break
 
-            # Throttle between pages
-            time.sleep(self.API_CALL_DELAY)
-
         print(f"  API: Found {len(raw_videos)} videos in uploads playlist")
 
         if not raw_videos:
@@ -271,18 +384,13 @@ class YouTubeFetcher(BaseFetcher):
             batch = video_ids[batch_start:batch_start + 50]
             params = {
                 "part": "contentDetails",
+                "fields": "items(id,contentDetails/duration)",
                 "id": ",".join(batch),
                 "key": api_key,
             }
 
             try:
-                resp = requests.get(
-                    f"{YOUTUBE_API_BASE}/videos",
-                    params=params,
-                    timeout=15,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+                data = self._api_get("videos", params)
             except Exception as e:
                 print(f"  API: videos.list request failed for batch at {batch_start}: {e}")
                 continue
@@ -292,10 +400,6 @@ class YouTubeFetcher(BaseFetcher):
                 iso_duration = item.get("contentDetails", {}).get("duration", "")
                 duration_map[vid] = self._parse_iso8601_duration(iso_duration)
 
-            # Throttle between batches
-            if batch_start + 50 < len(video_ids):
-                time.sleep(self.API_CALL_DELAY)
-
         # Step 5: Merge durations and filter Shorts
         videos = []
         shorts_filtered = 0
@@ -332,6 +436,67 @@ class YouTubeFetcher(BaseFetcher):
     # RSS + scrape methods (fallback)
     # ------------------------------------------------------------------
 
+    def _conditional_get(self, url: str, parse, headers: dict = None, timeout: int = 30):
+        """
+        GET a page with ETag / Last-Modified revalidation.
+
+        The parsed result of the last full response is cached on disk along
+        with its validators. When YouTube answers 304 Not Modified, the
+        cached result is returned without re-downloading or re-parsing the
+        page. Servers that ignore the validators just return 200 as usual.
+
+        Args:
+            url: URL to fetch
+            parse: Callable turning a 200 response into a JSON-serializable result
+            headers: Extra request headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            parse(response), or the cached result on 304
+        """
+        # The same page can be parsed different ways (the channel page gives
+        # both a channel ID and a scraped video list), so key on the parser too.
+        parser_name = getattr(parse, "__name__", "parse")
+        key = hashlib.sha256(f"{parser_name}\0{url}".encode()).hexdigest()[:16]
+        cache_path = self._http_cache_dir / f"{key}.json"
+        entry = None
+        try:
+            if cache_path.exists():
+                entry = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            entry = None
+
+        request_headers = dict(headers or {})
+        if entry:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._session.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and entry:
+            return entry["result"]
+        response.raise_for_status()
+
+        result = parse(response)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if result and (etag or last_modified):
+            try:
+                self._http_cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps({
+                    "url": url,
+                    "parser": parser_name,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "result": result,
+                }))
+            except OSError as e:
+                print(f"  HTTP cache write failed for {url}: {e}")
+
+        return result
+
     def _get_channel_videos_via_rss(self, limit: int = 50) -> list[dict]:
         """
         Get recent videos via YouTube's RSS feed.
@@ -348,46 +513,49 @@ class YouTubeFetcher(BaseFetcher):
             channel_url = channel_url.rstrip('/') + '/videos'
 
         try:
-            response = requests.get(channel_url, timeout=30)
-            response.raise_for_status()
-
-            # Extract channel ID from page
-            # Look for "channelId":"UC..." in the page source
-            channel_id_match = re.search(r'"channelId":"(UC[^"]+)"', response.text)
-            if not channel_id_match:
-                # Try alternate pattern
-                channel_id_match = re.search(r'channel_id=([^"&]+)', response.text)
-
-            if channel_id_match:
-                channel_id = channel_id_match.group(1)
+            channel_id = self._conditional_get(channel_url, self._parse_channel_id)
+
+            if channel_id:
                 rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+                videos = self._conditional_get(rss_url, self._parse_rss_videos)
+                return videos[:limit]
 
-                rss_response = requests.get(rss_url, timeout=30)
-                rss_response.raise_for_status()
+        except Exception as e:
+            print(f"RSS fetch failed for {self.source.name}: {e}")
 
-                # Parse RSS (simple regex extraction, no feedparser dependency here)
-                videos = []
-                entries = re.findall(r'<entry>(.*?)</entry>', rss_response.text, re.DOTALL)
+        return []
 
-                for entry in entries[:limit]:
-                    video_id_match = re.search(r'<yt:videoId>([^<]+)</yt:videoId>', entry)
-                    title_match = re.search(r'<title>([^<]+)</title>', entry)
-                    published_match = re.search(r'<published>([^<]+)</published>', entry)
+    @staticmethod
+    def _parse_channel_id(response) -> Optional[str]:
+        """Extract the UC... channel ID from a channel page."""
+        # Look for "channelId":"UC..." in the page source
+        channel_id_match = re.search(r'"channelId":"(UC[^"]+)"', response.text)
+        if not channel_id_match:
+            # Try alternate pattern
+            channel_id_match = re.search(r'channel_id=([^"&]+)', response.text)
+        return channel_id_match.group(1) if channel_id_match else None
 
-                    if video_id_match and title_match:
-                        videos.append({
-                            'video_id': video_id_match.group(1),
-                            'title': title_match.group(1),
-                            'published': published_match.group(1) if published_match else None,
-                            'url': f"https://www.youtube.com/watch?v={video_id_match.group(1)}"
-                        })
+    @staticmethod
+    def _parse_rss_videos(response) -> list[dict]:
+        """Parse video entries from a channel RSS feed."""
+        # Parse RSS (simple regex extraction, no feedparser dependency here)
+        videos = []
+        entries = re.findall(r'<entry>(.*?)</entry>', response.text, re.DOTALL)
 
-                return videos
+        for entry in entries:
+            video_id_match = re.search(r'<yt:videoId>([^<]+)</yt:videoId>', entry)
+            title_match = re.search(r'<title>([^<]+)</title>', entry)
+            published_match = re.search(r'<published>([^<]+)</published>', entry)
 
-        except Exception as e:
-            print(f"RSS fetch failed for {self.source.name}: {e}")
+            if video_id_match and title_match:
+                videos.append({
+                    'video_id': video_id_match.group(1),
+                    'title': title_match.group(1),
+                    'published': published_match.group(1) if published_match else None,
+                    'url': f"https://www.youtube.com/watch?v={video_id_match.group(1)}"
+                })
 
-        return []
+        return videos
 
     def _get_channel_videos_via_scrape(self, limit: int = 50) -> list[dict]:
         """
@@ -406,53 +574,55 @@ class YouTubeFetcher(BaseFetcher):
                 'Accept-Language': 'en-US,en;q=0.9',
             }
 
-            response = requests.get(channel_url, headers=headers, timeout=30)
-            response.raise_for_status()
+            videos = self._conditional_get(channel_url, self._parse_scraped_videos, headers=headers)
+            return videos[:limit]
 
-            videos = []
+        except Exception as e:
+            print(f"Scrape failed for {self.source.name}: {e}")
+            return []
 
-            # YouTube embeds video data as JSON in the page
-            # Look for the initial data JSON
-            json_match = re.search(r'var ytInitialData = ({.*?});</script>', response.text)
-            if not json_match:
-                json_match = re.search(r'ytInitialData\s*=\s*({.*?});</script>', response.text)
+    def _parse_scraped_videos(self, response) -> list[dict]:
+        """Extract videos from a channel page's ytInitialData (or raw HTML as a fallback)."""
+        videos = []
 
-            if json_match:
-                try:
-                    data = json.loads(json_match.group(1))
+        # YouTube embeds video data as JSON in the page
+        # Look for the initial data JSON
+        json_match = re.search(r'var ytInitialData = ({.*?});</script>', response.text)
+        if not json_match:
+            json_match = re.search(r'ytInitialData\s*=\s*({.*?});</script>', response.text)
 
-                    # Navigate the nested structure to find videos
-                    # This structure can change, so we search recursively
-                    video_items = self._extract_video_items(data)
+        if json_match:
+            try:
+                data = _json_loads(json_match.group(1))
 
-                    for item in video_items[:limit]:
-                        if item.get('video_id'):
-                            videos.append(item)
+                # Navigate the nested structure to find videos
+                # This structure can change, so we search recursively
+                video_items = self._extract_video_items(data)
 
-                except json.JSONDecodeError:
-                    pass
+                for item in video_items:
+                    if item.get('video_id'):
+                        videos.append(item)
 
-            # Fallback: simple regex extraction
-            if not videos:
-                video_ids = re.findall(r'"videoId":"([a-zA-Z0-9_-]{11})"', response.text)
-                titles = re.findall(r'"title":\{"runs":\[\{"text":"([^"]+)"\}\]', response.text)
-
-                seen = set()
-                for vid in video_ids:
-                    if vid not in seen and len(videos) < limit:
-                        seen.add(vid)
-                        videos.append({
-                            'video_id': vid,
-                            'title': titles[len(videos)] if len(videos) < len(titles) else f"Video {vid}",
-                            'url': f"https://www.youtube.com/watch?v={vid}",
-                            'published': None
-                        })
+            except json.JSONDecodeError:
+                pass
 
-            return videos
+        # Fallback: simple regex extraction
+        if not videos:
+            video_ids = re.findall(r'"videoId":"([a-zA-Z0-9_-]{11})"', response.text)
+            titles = re.findall(r'"title":\{"runs":\[\{"text":"([^"]+)"\}\]', response.text)
+
+            seen = set()
+            for vid in video_ids:
+                if vid not in seen:
+                    seen.add(vid)
+                    videos.append({
+                        'video_id': vid,
+                        'title': titles[len(videos)] if len(videos) < len(titles) else f"Video {vid}",
+                        'url': f"https://www.youtube.com/watch?v={vid}",
+                        'published': None
+                    })
 
-        except Exception as e:
-            print(f"Scrape failed for {self.source.name}: {e}")
-            return []
+        return videos
 
     def _extract_video_items(self, data: dict, depth: int = 0) -> list[dict]:
         """Recursively extract video items from YouTube's JSON structure."""
@@ -552,7 +722,10 @@ class YouTubeFetcher(BaseFetcher):
         Batch-enrich videos missing duration_seconds using yt-dlp Python API.
 
         Uses yt-dlp's extract_info with download=False for fast,
-        metadata-only extraction.
+        metadata-only extraction. Lookups are independent network round-trips,
+        so they fan out across YTDLP_MAX_WORKERS threads. Each thread gets its
+        own YoutubeDL instance (it isn't safe to share across threads), and a
+        shared AIMD-style delay backs every worker off when failures pile up.
         """
         import yt_dlp
 
@@ -570,17 +743,57 @@ class YouTubeFetcher(BaseFetcher):
             'socket_timeout': 10,
         }
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            for video in to_enrich:
-                url = video.get('url', '')
-                try:
-                    info = ydl.extract_info(url, download=False)
-                    duration = info.get('duration')
-                    if duration:
-                        video['duration_seconds'] = int(duration)
-                        enriched += 1
-                except Exception as e:
-                    print(f"    yt-dlp failed for {video.get('title', url)[:50]}: {e}")
+        local = threading.local()
+        instances = []
+        lock = threading.Lock()
+        backoff = {'delay': 0.0}
+
+        def _extract_one(url: str) -> Optional[int]:
+            ydl = getattr(local, 'ydl', None)
+            if ydl is None:
+                ydl = local.ydl = yt_dlp.YoutubeDL(ydl_opts)
+                with lock:
+                    instances.append(ydl)
+
+            with lock:
+                delay = backoff['delay']
+            if delay > 0:
+                time.sleep(delay)
+
+            try:
+                info = ydl.extract_info(url, download=False)
+            except Exception:
+                # Multiplicative increase of the shared delay on failure
+                with lock:
+                    backoff['delay'] = min(
+                        self.YTDLP_MAX_BACKOFF_SECONDS,
+                        max(self.YTDLP_BACKOFF_STEP_SECONDS, backoff['delay'] * 2),
+                    )
+                raise
+
+            # Additive decrease on success
+            with lock:
+                backoff['delay'] = max(0.0, backoff['delay'] - self.YTDLP_BACKOFF_STEP_SECONDS)
+            return info.get('duration') if info else None
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.YTDLP_MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(_extract_one, v.get('url', '')): v
+                    for v in to_enrich
+                }
+                for future in as_completed(futures):
+                    video = futures[future]
+                    try:
+                        duration = future.result()
+                        if duration:
+                            video['duration_seconds'] = int(duration)
+                            enriched += 1
+                    except Exception as e:
+                        print(f"    yt-dlp failed for {video.get('title', video.get('url', ''))[:50]}: {e}")
+        finally:
+            for ydl in instances:
+                ydl.close()
 
         print(f"  Enriched {enriched}/{len(to_enrich)} durations")
         return videos
@@ -671,9 +884,12 @@ class YouTubeFetcher(BaseFetcher):
             if duration_filtered > 0:
                 print(f"  Filtered {duration_filtered} YouTube Shorts (< {self.MIN_VIDEO_DURATION_SECONDS // 60}m)")
 
-        # Convert to ContentItems and filter by date
+        # Convert to ContentItems and filter by date.
+        # Compare datetimes directly against midnight of `since` rather than
+        # calling .date() on every item.
         now = datetime.now()
-        for video in unique_videos[:limit]:
+        since_dt = datetime.combine(since, datetime.min.time()) if since else None
+        for video in islice(unique_videos, limit):
             # Parse published date
             published_at = None
             if video.get('published'):
@@ -694,7 +910,7 @@ class YouTubeFetcher(BaseFetcher):
                 published_at = published_at.replace(tzinfo=None)
 
             # Filter by date
-            if since and published_at.date() < since:
+            if since_dt and published_at < since_dt:
                 continue
 
             content_id = ContentItem.generate_id(self.source.id, video['url'])
@@ -718,12 +934,45 @@ class YouTubeFetcher(BaseFetcher):
     # Transcript methods
     # ------------------------------------------------------------------
 
+    def fetch_all(
+        self,
+        since: date = None,
+        limit: int = None,
+        include_transcripts: bool = True,
+        transcript_delay: float = 2.0,
+        is_known: Optional[Callable[[str], bool]] = None,
+    ) -> Generator[ContentItem, None, None]:
+        """
+        Fetch all videos with transcripts.
+
+        Overridden to fetch transcripts concurrently via fetch_transcripts_batch()
+        instead of one at a time. Pacing is handled by the batch method's
+        sliding-window rate limiter and 429 backoff, so transcript_delay is
+        accepted for interface compatibility but not applied between items.
+        Videos whose URL is_known are yielded without fetching a transcript.
+        """
+        items = list(self.fetch_content_list(since=since, limit=limit))
+
+        known = {item.id for item in items if is_known and is_known(item.url)}
+        to_fetch = [item for item in items if item.id not in known] if include_transcripts else []
+        transcripts = self.fetch_transcripts_batch(to_fetch) if to_fetch else {}
+
+        for item in items:
+            if include_transcripts and item.id not in known:
+                transcript = transcripts.get(item.id)
+                if transcript:
+                    item.transcript = transcript
+                    item.word_count = len(transcript.split())
+                    item.status = "pending"
+                else:
+                    item.status = "no_transcript"
+            yield item
+
     def fetch_transcript(self, item: ContentItem) -> Optional[str]:
         """
         Fetch transcript for a YouTube video.
 
-        Uses youtube-transcript-api which extracts transcripts
-        without requiring an API key.
+        Thin wrapper around fetch_transcripts_batch() for a single item.
 
         Args:
             item: ContentItem for the video
@@ -731,90 +980,229 @@ class YouTubeFetcher(BaseFetcher):
         Returns:
             Full transcript text, or None if unavailable
         """
+        return self.fetch_transcripts_batch([item]).get(item.id)
+
+    def fetch_transcripts_batch(self, items: list[ContentItem]) -> dict[str, Optional[str]]:
+        """
+        Fetch transcripts for many videos concurrently.
+
+        Each fetch is several HTTPS round-trips to YouTube, so the waits are
+        overlapped across TRANSCRIPT_MAX_WORKERS threads. Every request goes
+        through a sliding-window limiter (TRANSCRIPT_MAX_CALLS_PER_MINUTE),
+        and rate-limit errors are retried with exponential backoff + jitter.
+
+        Args:
+            items: ContentItems for the videos
+
+        Returns:
+            Dict of item.id -> transcript text (None if unavailable)
+        """
+        results: dict[str, Optional[str]] = {}
+        if not items:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.TRANSCRIPT_MAX_WORKERS, len(items))) as executor:
+            futures = {
+                executor.submit(self._fetch_transcript_with_backoff, item): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    results[item.id] = future.result()
+                except Exception as e:
+                    print(f"Transcript error for {item.title}: {e}")
+                    results[item.id] = None
+
+        return results
+
+    @contextmanager
+    def _transcript_api(self):
+        """
+        Check out a YouTubeTranscriptApi client from this fetcher's pool.
+
+        Each client wraps a requests.Session, which is not thread-safe, so a
+        client is only ever used by one thread at a time. Returning it to the
+        pool afterwards lets later fetches (including later batches and
+        single-item fetch_transcript calls) reuse its open connections.
+        """
+        try:
+            api = self._transcript_api_pool.get_nowait()
+        except queue.Empty:
+            api = YouTubeTranscriptApi(http_client=_TimeoutSession())
+        try:
+            yield api
+        finally:
+            self._transcript_api_pool.put(api)
+
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        """Check if a transcript error looks like YouTube throttling us."""
+        if isinstance(error, RequestBlocked):
+            return True
+        error_str = str(error).lower()
+        return "429" in error_str or "too many requests" in error_str or "toomanyrequests" in error_str
+
+    def _fetch_transcript_with_backoff(self, item: ContentItem) -> Optional[str]:
+        """
+        Fetch one transcript, retrying rate-limit errors with backoff.
+
+        Safe to call from worker threads (no signal-based timeout); each HTTP
+        request is bounded by TRANSCRIPT_TIMEOUT_SECONDS instead.
+        """
         # Extract video ID from URL
         video_id = self._extract_video_id(item.url)
         if not video_id:
             print(f"Could not extract video ID from: {item.url}")
             return None
 
-        # Set a timeout for the entire transcript fetch to prevent hanging
-        # if YouTube is slow or partially responding. signal.alarm() only
-        # works in the main thread on Unix, which is fine — this pipeline
-        # is single-threaded.
-        old_handler = signal.signal(
-            signal.SIGALRM,
-            lambda signum, frame: (_ for _ in ()).throw(
-                TimeoutError("Transcript fetch timed out")
-            ),
-        )
-        signal.alarm(TRANSCRIPT_TIMEOUT_SECONDS)
+        cache_hit, cached = self._read_cached_transcript(video_id)
+        if cache_hit:
+            return cached
 
-        try:
-            # youtube-transcript-api v1.x: instantiate, then fetch
-            api = YouTubeTranscriptApi()
+        for attempt in range(self.TRANSCRIPT_MAX_RETRIES + 1):
+            try:
+                full_text = self._fetch_transcript_text(video_id)
+                if full_text:
+                    self._write_cached_transcript(video_id, full_text)
+                return full_text
+
+            except requests.exceptions.Timeout:
+                print(f"  Transcript fetch timed out ({TRANSCRIPT_TIMEOUT_SECONDS}s): {item.title}")
+                return None
+            except TranscriptsDisabled:
+                print(f"Transcripts disabled for: {item.title}")
+                self._write_cached_transcript(video_id, None)
+                return None
+            except NoTranscriptFound:
+                print(f"No transcript found for: {item.title}")
+                return None
+            except VideoUnavailable:
+                print(f"Video unavailable: {item.title}")
+                self._write_cached_transcript(video_id, None)
+                return None
+            except Exception as e:
+                if self._is_rate_limit_error(e) and attempt < self.TRANSCRIPT_MAX_RETRIES:
+                    wait_time = min(30, 1.5 * 2 ** attempt) + random.uniform(0, 1)
+                    print(f"  Transcript rate limited, waiting {wait_time:.1f}s "
+                          f"(attempt {attempt + 1}/{self.TRANSCRIPT_MAX_RETRIES}): {item.title}")
+                    time.sleep(wait_time)
+                    continue
+                print(f"Transcript error for {item.title}: {e}")
+                return None
 
-            # Try to find the best transcript via list()
-            transcript_list = api.list(video_id)
+        return None
 
-            # Prefer manual English, fall back to auto-generated
-            transcript_meta = None
-            try:
-                transcript_meta = transcript_list.find_manually_created_transcript(['en'])
-            except Exception:
-                pass
+    def _read_cached_transcript(self, video_id: str) -> tuple[bool, Optional[str]]:
+        """
+        Look up a transcript in the on-disk cache.
 
-            if transcript_meta is None:
-                try:
-                    transcript_meta = transcript_list.find_generated_transcript(['en'])
-                except Exception:
-                    pass
+        Returns:
+            (hit, transcript) — transcript is None for a negative-cache hit
+            (transcripts disabled / video unavailable within the TTL).
+        """
+        cache_path = self._transcript_cache_dir / f"{video_id}.txt.gz"
+        negative_path = self._transcript_cache_dir / f"{video_id}.unavailable"
 
-            if transcript_meta is not None:
-                # Fetch the actual transcript data
-                fetched = transcript_meta.fetch()
-                full_text = ' '.join([snippet.text for snippet in fetched.snippets])
-            else:
-                # Last resort: just fetch directly (gets default transcript)
-                fetched = api.fetch(video_id)
-                full_text = ' '.join([snippet.text for snippet in fetched.snippets])
+        try:
+            if cache_path.exists():
+                return True, gzip.decompress(cache_path.read_bytes()).decode("utf-8")
+            if negative_path.exists():
+                age = time.time() - negative_path.stat().st_mtime
+                if age < TRANSCRIPT_NEGATIVE_CACHE_TTL_SECONDS:
+                    return True, None
+                negative_path.unlink(missing_ok=True)
+        except (OSError, EOFError, UnicodeDecodeError) as e:
+            # Corrupt or unreadable cache entry — treat as a miss and refetch
+            print(f"  Transcript cache read failed for {video_id}: {e}")
+
+        return False, None
+
+    def _write_cached_transcript(self, video_id: str, transcript: Optional[str]):
+        """
+        Store a transcript (or a negative-cache marker when None) on disk.
 
-            # Clean up the text
-            full_text = self._clean_transcript(full_text)
+        Cache failures are non-fatal: the transcript is still returned.
+        """
+        try:
+            self._transcript_cache_dir.mkdir(parents=True, exist_ok=True)
+            if transcript is None:
+                (self._transcript_cache_dir / f"{video_id}.unavailable").touch()
+                return
+
+            # Write to a temp file and rename so concurrent readers never
+            # see a partially written entry
+            cache_path = self._transcript_cache_dir / f"{video_id}.txt.gz"
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(gzip.compress(transcript.encode("utf-8")))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"  Transcript cache write failed for {video_id}: {e}")
+
+    def _fetch_transcript_text(self, video_id: str) -> str:
+        """
+        Fetch and clean the best available English transcript for a video.
 
-            return full_text
+        Raises youtube-transcript-api / requests exceptions on failure.
+        """
+        # youtube-transcript-api v1.x: reuse a pooled client, then fetch
+        with self._transcript_api() as api:
+            return self._clean_transcript(self._fetch_best_transcript(api, video_id))
+
+    def _fetch_best_transcript(self, api: YouTubeTranscriptApi, video_id: str) -> str:
+        """Fetch raw transcript text: manual English, then generated, then default."""
+        # Try to find the best transcript via list()
+        self._transcript_limiter.acquire()
+        transcript_list = api.list(video_id)
+
+        # Prefer manual English, fall back to auto-generated
+        transcript_meta = None
+        try:
+            transcript_meta = transcript_list.find_manually_created_transcript(['en'])
+        except Exception:
+            pass
 
-        except TimeoutError:
-            print(f"  Transcript fetch timed out ({TRANSCRIPT_TIMEOUT_SECONDS}s): {item.title}")
-            return None
-        except TranscriptsDisabled:
-            print(f"Transcripts disabled for: {item.title}")
-            return None
-        except NoTranscriptFound:
-            print(f"No transcript found for: {item.title}")
-            return None
-        except VideoUnavailable:
-            print(f"Video unavailable: {item.title}")
-            return None
-        except Exception as e:
-            print(f"Transcript error for {item.title}: {e}")
-            return None
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
+        if transcript_meta is None:
+            try:
+                transcript_meta = transcript_list.find_generated_transcript(['en'])
+            except Exception:
+                pass
 
-    def _extract_video_id(self, url: str) -> Optional[str]:
-        """Extract video ID from YouTube URL."""
-        # Handle various URL formats
-        patterns = [
-            r'youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/shorts/([a-zA-Z0-9_-]{11})',
-            r'youtu\.be/([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/v/([a-zA-Z0-9_-]{11})',
-        ]
+        self._transcript_limiter.acquire()
+        if transcript_meta is not None:
+            # Fetch the actual transcript data
+            fetched = transcript_meta.fetch()
+            full_text = ' '.join(map(_snippet_text, fetched.snippets))
+        else:
+            # Last resort: just fetch directly (gets default transcript)
+            fetched = api.fetch(video_id)
+            full_text = ' '.join(map(_snippet_text, fetched.snippets))
+
+        return full_text
+
+    # Video URL formats other than watch?v= (checked after the fast path)
+    VIDEO_ID_PATTERNS = [
+        re.compile(r'youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})'),
+        re.compile(r'youtube\.com/shorts/([a-zA-Z0-9_-]{11})'),
+        re.compile(r'youtu\.be/([a-zA-Z0-9_-]{11})'),
+        re.compile(r'youtube\.com/embed/([a-zA-Z0-9_-]{11})'),
+        re.compile(r'youtube\.com/v/([a-zA-Z0-9_-]{11})'),
+    ]
+    VIDEO_ID_RE = re.compile(r'[a-zA-Z0-9_-]{11}')
 
-        for pattern in patterns:
-            match = re.search(pattern, url)
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_video_id(url: str) -> Optional[str]:
+        """Extract video ID from YouTube URL (memoized — URLs repeat across code paths)."""
+        # Fast path: nearly every URL we build or fetch is youtube.com/watch?v=ID
+        if 'watch?v=' in url:
+            video_id = parse_qs(urlparse(url).query).get('v', [None])[0]
+            if video_id and YouTubeFetcher.VIDEO_ID_RE.fullmatch(video_id):
+                return video_id
+
+        # Handle other URL formats
+        for pattern in YouTubeFetcher.VIDEO_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
 
@@ -828,14 +1216,11 @@ class YouTubeFetcher(BaseFetcher):
 
     def _clean_transcript(self, text: str) -> str:
         """Clean up transcript text."""
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        # Collapse all whitespace runs (including newlines) to single spaces.
+        # str.split() with no args does this in one C pass, no regex needed.
+        text = ' '.join(text.split())
 
         # Remove [Music], [Applause], etc.
         text = re.sub(r'\[.*?\]', '', text)
 
-        # Fix common transcript issues
-        text = text.replace('\n', ' ')
-        text = text.strip()
-
-        return text
+        return text.strip()
@@ -1,5 +1,16 @@
-from .gemini_client import GeminiClient
-from .openai_client import OpenAIClient
 from .llm_client import LLMClient
 from .summarizer import Summarizer
 from .prompts import PROMPT_VERSION
+from .response_parsing import strip_json_fence
+
+
+def __getattr__(name):
+    # Provider clients load lazily so importing the package doesn't pull in
+    # an SDK that this run may never use.
+    if name == "GeminiClient":
+        from .gemini_client import GeminiClient
+        return GeminiClient
+    if name == "OpenAIClient":
+        from .openai_client import OpenAIClient
+        return OpenAIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
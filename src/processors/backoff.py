@@ -0,0 +1,51 @@
+"""
+Retry timing for LLM API calls.
+
+Fixed sleeps make concurrent callers retry in lockstep and re-trip the
+same rate limit, so waits are fully jittered. When the provider says how
+long to wait (Retry-After header, or Gemini's retry_delay in the error
+body), that hint is used instead of guessing.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from typing import Optional
+
+# Gemini puts a RetryInfo detail in the error body, rendered either as
+# JSON ('retryDelay': '27s') or proto text (retry_delay { seconds: 27 }).
+_RETRY_DELAY_RE = re.compile(r"retry_?delay\W+(?:seconds\W+)?(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# Never sleep longer than this on a server hint
+MAX_RETRY_AFTER_SECONDS = 120
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Extract the provider's suggested retry delay from an API error.
+
+    Checks a Retry-After header on error.response (OpenAI, and Gemini errors
+    that carry the HTTP response), then a retry_delay in the message.
+
+    Returns:
+        Seconds to wait, or None if the error carries no hint
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        value = headers.get("retry-after")
+        if value:
+            try:
+                return min(float(value), MAX_RETRY_AFTER_SECONDS)
+            except ValueError:
+                pass  # HTTP-date form; fall through to the message
+
+    match = _RETRY_DELAY_RE.search(str(error))
+    if match:
+        return min(float(match.group(1)), MAX_RETRY_AFTER_SECONDS)
+    return None
+
+
+def full_jitter(base: float) -> float:
+    """A uniformly random wait in [0, base] seconds."""
+    return random.uniform(0, base)
@@ -8,18 +8,32 @@ rate limiting, retries, timeout protection, and response parsing.
 
 from __future__ import annotations
 
+import logging
 import os
 import json
 import time
-import signal
+import asyncio
 from typing import Optional
 
-from google import genai
-from google.genai import types
+import httpx
+
+from .backoff import full_jitter, retry_after_seconds
+from .http_client import get_shared_http_client
+from .response_cache import ResponseCache, get_response_cache
+from .response_parsing import (
+    JsonStreamBuffer,
+    json_loads,
+    parse_json_response,
+    parse_json_response_async,
+)
+from .tokens import count_tokens, fits_without_counting, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
 
 
 # Per-request timeout for LLM API calls (seconds).
-# Prevents the pipeline from hanging indefinitely on a single request.
+# Prevents the pipeline from hanging indefinitely on a single request: it
+# bounds both each read (a stalled stream) and the call as a whole.
 # 120s is generous — most calls complete in 10-30s even for long transcripts.
 REQUEST_TIMEOUT_SECONDS = 120
 
@@ -29,11 +43,55 @@ class LLMTimeoutError(Exception):
     pass
 
 
-def _timeout_handler(signum, frame):
-    """Signal handler that raises LLMTimeoutError on SIGALRM."""
-    raise LLMTimeoutError(
-        f"Gemini API call timed out after {REQUEST_TIMEOUT_SECONDS}s"
-    )
+def _http_options(types):
+    """
+    SDK HTTP options: the request timeout, plus the shared connection pool.
+
+    Older google-genai releases have no HttpOptions.httpx_client, and
+    HttpOptions rejects unknown fields, so the pool is only passed when the
+    installed SDK supports it (otherwise the SDK builds its own client).
+    """
+    options = {"timeout": REQUEST_TIMEOUT_SECONDS * 1000}
+    if "httpx_client" in types.HttpOptions.model_fields:
+        options["httpx_client"] = get_shared_http_client()
+    return types.HttpOptions(**options)
+
+
+def _retry_wait(error: Exception, attempt: int, max_retries: int) -> Optional[float]:
+    """
+    Decide how long to wait after a failed Gemini call.
+
+    Returns:
+        Seconds to sleep before the next attempt, or None if retrying
+        is pointless (daily quota exhausted).
+    """
+    error_str = str(error).lower()
+
+    # Rate limit or quota exceeded
+    if "429" in error_str or "rate" in error_str or "quota" in error_str:
+        # Check if it's a daily quota exhaustion (no point retrying)
+        if "free_tier" in error_str and "limit: 0" in error_str:
+            logger.error(f"  ERROR: Free tier daily quota exhausted.")
+            logger.error(f"  Enable billing at https://ai.google.dev or wait for quota reset.")
+            return None
+
+        # Trust the server's hint; otherwise jitter up to 30s, 60s, 90s
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            wait_time = retry_after + full_jitter(1)
+        else:
+            wait_time = full_jitter(30 * (attempt + 1))
+        logger.warning(f"  Rate limited, waiting {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
+        return wait_time
+
+    # Server error (5xx) - retry
+    if "500" in error_str or "503" in error_str:
+        wait_time = retry_after_seconds(error) or full_jitter(2 ** attempt)
+        logger.warning(f"  Server error, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
+        return wait_time
+
+    logger.warning(f"  Gemini API error (attempt {attempt + 1}/{max_retries}): {error}")
+    return full_jitter(2 ** attempt) if attempt < max_retries - 1 else 0
 
 
 class GeminiClient:
@@ -47,9 +105,17 @@ class GeminiClient:
     - Token counting for cost tracking
     """
 
+    PROVIDER_NAME = "gemini"
+
     # Gemini 2.5 Flash has a 1M token context window
     MAX_INPUT_TOKENS = 900_000  # Leave room for the prompt template
 
+    # Generation settings (also part of the response cache key)
+    TEMPERATURE = 0.3
+    MAX_OUTPUT_TOKENS = 4096
+    # Model ceiling for a raised per-call budget (see generate)
+    MAX_OUTPUT_TOKENS_LIMIT = 65_536
+
     def __init__(self, api_key: str = None, model: str = "gemini-2.5-flash"):
         """
         Initialize the Gemini client.
@@ -66,102 +132,186 @@ class GeminiClient:
             )
 
         self.model_name = model
-        self.client = genai.Client(api_key=self.api_key)
-
-    def generate(self, prompt: str, max_retries: int = 3) -> Optional[dict]:
+        # The timeout is enforced by the SDK's HTTP stack (milliseconds), so
+        # it works from any thread (no signal handlers involved).
+        # SDK imported here, not at module level: google.genai takes ~0.5s
+        # to import and isn't needed when only OpenAI is used.
+        from google import genai
+        from google.genai import types
+
+        self.client = genai.Client(api_key=self.api_key, http_options=_http_options(types))
+
+        # Built once: GenerateContentConfig is a pydantic model, so building
+        # it per call would re-run validation. Shared by the async subclass.
+        self._gen_config = types.GenerateContentConfig(
+            temperature=self.TEMPERATURE,
+            max_output_tokens=self.MAX_OUTPUT_TOKENS,
+            response_mime_type="application/json",
+        )
+        # (system prompt, output budget) → copy of _gen_config (see _config_for)
+        self._system_configs = {}
+
+    def generate(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        system_prompt: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> Optional[dict]:
         """
         Send a prompt to Gemini and get a parsed JSON response.
 
         Args:
-            prompt: The full prompt text
+            prompt: The full prompt text (the user turn)
             max_retries: Number of retries on failure
+            system_prompt: Optional static instructions, sent as the system
+                instruction so Gemini's implicit caching can reuse them
+            max_output_tokens: Output budget for this call (defaults to
+                MAX_OUTPUT_TOKENS, capped at MAX_OUTPUT_TOKENS_LIMIT) — for
+                prompts that ask for several summaries at once
 
         Returns:
             Parsed JSON dict, or None if all retries fail
         """
+        max_output_tokens = self._output_budget(max_output_tokens)
+
+        # Exact-match response cache (opt-in via LLM_CACHE_PATH)
+        cache = get_response_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(prompt, system_prompt, max_output_tokens)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return json_loads(cached)
+
         for attempt in range(max_retries):
             try:
-                # Set a per-request timeout using SIGALRM to prevent hangs.
-                # This is critical: without it, a single stuck API call can
-                # block the entire pipeline for hours (happened 2026-02-17
-                # on a 19,600-word transcript).
-                old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
-                signal.alarm(REQUEST_TIMEOUT_SECONDS)
+                # A stuck call must not block the pipeline for hours (happened
+                # 2026-02-17 on a 19,600-word transcript), hence the client's
+                # read timeout plus _stream_text's deadline for the whole call.
                 try:
-                    response = self.client.models.generate_content(
-                        model=self.model_name,
-                        contents=prompt,
-                        config=types.GenerateContentConfig(
-                            temperature=0.3,
-                            max_output_tokens=4096,
-                            response_mime_type="application/json",
-                        ),
-                    )
-                finally:
-                    # Always cancel the alarm and restore the old handler
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
-
-                # Parse the JSON response
-                text = response.text.strip()
-
-                # Sometimes Gemini wraps JSON in markdown code blocks
-                if text.startswith("```json"):
-                    text = text[7:]
-                if text.startswith("```"):
-                    text = text[3:]
-                if text.endswith("```"):
-                    text = text[:-3]
-                text = text.strip()
-
-                result = json.loads(text)
+                    response_text = self._stream_text(prompt, system_prompt, max_output_tokens)
+                except httpx.TimeoutException as e:
+                    raise LLMTimeoutError(
+                        f"Gemini API call stalled (no data for {REQUEST_TIMEOUT_SECONDS}s)"
+                    ) from e
+
+                result, text = parse_json_response(response_text)
+                if cache is not None:
+                    cache.put(cache_key, text)
                 return result
 
             except json.JSONDecodeError as e:
-                print(f"  JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.warning(f"  JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    time.sleep(full_jitter(2 ** attempt))
 
             except LLMTimeoutError as e:
-                print(f"  TIMEOUT (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.warning(f"  TIMEOUT (attempt {attempt + 1}/{max_retries}): {e}")
                 # Don't retry timeouts — they'll likely time out again.
                 # Let the caller (LLMClient) fall back to OpenAI instead.
                 raise
 
             except Exception as e:
-                error_str = str(e).lower()
-
-                # Rate limit or quota exceeded
-                if "429" in error_str or "rate" in error_str or "quota" in error_str:
-                    # Check if it's a daily quota exhaustion (no point retrying)
-                    if "free_tier" in error_str and "limit: 0" in error_str:
-                        print(f"  ERROR: Free tier daily quota exhausted.")
-                        print(f"  Enable billing at https://ai.google.dev or wait for quota reset.")
-                        return None
-
-                    wait_time = 30 * (attempt + 1)  # 30s, 60s, 90s
-                    print(f"  Rate limited, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-
-                # Server error (5xx) - retry
-                elif "500" in error_str or "503" in error_str:
-                    wait_time = 2 ** attempt
-                    print(f"  Server error, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-
-                else:
-                    print(f"  Gemini API error (attempt {attempt + 1}/{max_retries}): {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
+                wait_time = _retry_wait(e, attempt, max_retries)
+                if wait_time is None:
+                    return None
+                time.sleep(wait_time)
 
         return None
 
+    def _stream_text(
+        self, prompt: str, system_prompt: Optional[str] = None, max_output_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Stream a response and return its text once the JSON object closes.
+
+        Reading stops at the closing brace instead of waiting on the stream
+        tail. The SDK's read timeout only catches a stalled stream, so a
+        response that keeps trickling in is cut off at REQUEST_TIMEOUT_SECONDS
+        overall.
+
+        Raises:
+            LLMTimeoutError: If the response is still streaming at the deadline
+        """
+        deadline = time.monotonic() + REQUEST_TIMEOUT_SECONDS
+        buffer = JsonStreamBuffer()
+        stream = self.client.models.generate_content_stream(
+            model=self.model_name,
+            contents=prompt,
+            config=self._config_for(system_prompt, max_output_tokens),
+        )
+        try:
+            for chunk in stream:
+                if buffer.feed(chunk.text or ""):
+                    break
+                if time.monotonic() > deadline:
+                    raise LLMTimeoutError(
+                        f"Gemini API call timed out after {REQUEST_TIMEOUT_SECONDS}s"
+                    )
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        return buffer.text()
+
+    def _output_budget(self, max_output_tokens: Optional[int]) -> int:
+        """Per-call output budget: the default, or a raised one within the model's limit."""
+        if max_output_tokens is None:
+            return self.MAX_OUTPUT_TOKENS
+        return min(max_output_tokens, self.MAX_OUTPUT_TOKENS_LIMIT)
+
+    def _config_for(self, system_prompt: Optional[str], max_output_tokens: Optional[int] = None):
+        """
+        Generation config carrying system_prompt as the system instruction.
+
+        Built once per distinct system prompt and output budget (there is
+        normally just the one summarization preamble) rather than per call.
+        """
+        if max_output_tokens == self.MAX_OUTPUT_TOKENS:
+            max_output_tokens = None
+        if system_prompt is None and max_output_tokens is None:
+            return self._gen_config
+        key = (system_prompt, max_output_tokens)
+        config = self._system_configs.get(key)
+        if config is None:
+            update = {"system_instruction": system_prompt}
+            if max_output_tokens is not None:
+                update["max_output_tokens"] = max_output_tokens
+            config = self._gen_config.model_copy(update=update)
+            self._system_configs[key] = config
+        return config
+
+    def _cache_key(
+        self, prompt: str, system_prompt: Optional[str] = None, max_output_tokens: Optional[int] = None
+    ) -> str:
+        """Response cache key for a prompt under this client's settings."""
+        if system_prompt is not None:
+            prompt = f"{system_prompt}\0{prompt}"
+        return ResponseCache.make_key(
+            self.PROVIDER_NAME, self.model_name, self.TEMPERATURE,
+            max_output_tokens or self.MAX_OUTPUT_TOKENS, prompt,
+        )
+
     def estimate_tokens(self, text: str) -> int:
         """
-        Rough estimate of token count.
-        Gemini uses ~1 token per 4 characters for English text.
+        Local estimate of token count (tiktoken o200k_base as a proxy).
+
+        Avoids a count_tokens round-trip per call; truncate_for_context
+        confirms with the real tokenizer only for texts that look too long.
+        """
+        return count_tokens(text)
+
+    def count_tokens(self, text: str) -> Optional[int]:
+        """
+        Exact Gemini token count via the API, or None if the call fails.
         """
-        return len(text) // 4
+        try:
+            response = self.client.models.count_tokens(model=self.model_name, contents=text)
+            return response.total_tokens
+        except Exception as e:
+            logger.warning(f"  Warning: Gemini count_tokens failed ({e}); using local estimate")
+            return None
 
     def truncate_for_context(self, text: str, max_tokens: int = None) -> str:
         """
@@ -177,17 +327,92 @@ class GeminiClient:
         if max_tokens is None:
             max_tokens = self.MAX_INPUT_TOKENS
 
+        if fits_without_counting(text, max_tokens):
+            return text
+
         estimated = self.estimate_tokens(text)
         if estimated <= max_tokens:
             return text
 
-        # Truncate to fit, leaving some margin
-        max_chars = max_tokens * 4
-        truncated = text[:max_chars]
+        # Over budget by the local estimate — check with Gemini's own
+        # tokenizer once, and scale the local budget to match it.
+        actual = self.count_tokens(text)
+        if actual is not None:
+            if actual <= max_tokens:
+                return text
+            max_tokens = int(max_tokens * estimated / actual)
 
-        # Try to break at a sentence boundary
-        last_period = truncated.rfind('. ')
-        if last_period > max_chars * 0.8:
-            truncated = truncated[:last_period + 1]
+        return truncate_to_tokens(text, max_tokens)
 
-        return truncated + "\n\n[Content truncated due to length]"
+
+class AsyncGeminiClient(GeminiClient):
+    """
+    Async variant of GeminiClient for concurrent fan-out (LLMClient.generate_many).
+
+    Same settings, cache, and retry policy as GeminiClient, but generate() is a
+    coroutine using the SDK's aio interface. asyncio.wait_for caps the total
+    duration of each call on top of the client's HTTP timeout.
+    """
+
+    async def generate(
+        self, prompt: str, max_retries: int = 3, system_prompt: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Send a prompt to Gemini asynchronously and get a parsed JSON response.
+
+        Args:
+            prompt: The full prompt text (the user turn)
+            max_retries: Number of retries on failure
+            system_prompt: Optional static instructions (see GeminiClient.generate)
+
+        Returns:
+            Parsed JSON dict, or None if all retries fail
+
+        Raises:
+            LLMTimeoutError: If a call exceeds REQUEST_TIMEOUT_SECONDS
+        """
+        cache = get_response_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(prompt, system_prompt)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return json_loads(cached)
+
+        for attempt in range(max_retries):
+            try:
+                try:
+                    response = await asyncio.wait_for(
+                        self.client.aio.models.generate_content(
+                            model=self.model_name,
+                            contents=prompt,
+                            config=self._config_for(system_prompt),
+                        ),
+                        timeout=REQUEST_TIMEOUT_SECONDS,
+                    )
+                except (asyncio.TimeoutError, httpx.TimeoutException) as e:
+                    raise LLMTimeoutError(
+                        f"Gemini API call timed out after {REQUEST_TIMEOUT_SECONDS}s"
+                    ) from e
+
+                result, text = await parse_json_response_async(response.text)
+                if cache is not None:
+                    cache.put(cache_key, text)
+                return result
+
+            except json.JSONDecodeError as e:
+                logger.warning(f"  JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(full_jitter(2 ** attempt))
+
+            except LLMTimeoutError as e:
+                logger.warning(f"  TIMEOUT (attempt {attempt + 1}/{max_retries}): {e}")
+                raise
+
+            except Exception as e:
+                wait_time = _retry_wait(e, attempt, max_retries)
+                if wait_time is None:
+                    return None
+                await asyncio.sleep(wait_time)
+
+        return None
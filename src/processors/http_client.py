@@ -0,0 +1,47 @@
+"""
+Process-wide HTTP connection pool for the LLM provider SDKs.
+
+By default every genai.Client and OpenAI client builds its own httpx pool,
+so a cold pool (or a freshly created client) pays a full TCP+TLS handshake
+per host. Sharing one client keeps connections warm across both providers
+and every client instance, and multiplexes requests over HTTP/2 when the
+optional `h2` package is installed (pip install "httpx[http2]").
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from typing import Optional
+
+import httpx
+
+# Pool sizing: enough for the concurrent processing paths without letting a
+# runaway caller open hundreds of sockets to one host.
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.Client:
+    """
+    Get the shared sync httpx.Client (created on first use).
+
+    No client-level timeout is set: both SDKs pass their own per-request
+    timeout (REQUEST_TIMEOUT_SECONDS) on every call.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        return _client
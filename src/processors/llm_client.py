@@ -8,9 +8,37 @@ or fails.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+import sys
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+
+# Default number of items packed into one generate_batch() call (override with
+# LLM_BATCH_SIZE). 4-16 is the useful range: bigger batches save more
+# requests but each call gets slower and one bad item costs more to isolate.
+DEFAULT_BATCH_SIZE = 8
+
+
+def _timeout_errors() -> tuple:
+    """
+    Exception types that mean "this provider timed out".
+
+    openai's APITimeoutError is only included once the SDK has been
+    imported (i.e. an OpenAIClient exists) — it can't be raised otherwise,
+    and importing it here would load the SDK for Gemini-only runs.
+    """
+    from .gemini_client import LLMTimeoutError
+
+    errors = [LLMTimeoutError, asyncio.TimeoutError]
+    openai = sys.modules.get("openai")
+    if openai is not None:
+        errors.append(openai.APITimeoutError)
+    return tuple(errors)
+
 
 class LLMClient:
     """
@@ -34,6 +62,10 @@ class LLMClient:
         self._fallback = None
         self._active_provider_name = None
 
+        # Single-flight map for generate_many: (system_prompt, prompt) → the
+        # task already sending it, so concurrent duplicates share one API call.
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
         if provider == "auto":
             # Try to init both — gracefully handle missing keys
             self._primary = self._try_init_gemini()
@@ -74,7 +106,7 @@ class LLMClient:
             from .gemini_client import GeminiClient
             return GeminiClient()
         except Exception as e:
-            print(f"  Warning: Gemini init failed: {e}")
+            logger.warning(f"  Warning: Gemini init failed: {e}")
             return None
 
     def _try_init_openai(self):
@@ -85,7 +117,7 @@ class LLMClient:
             from .openai_client import OpenAIClient
             return OpenAIClient()
         except Exception as e:
-            print(f"  Warning: OpenAI init failed: {e}")
+            logger.warning(f"  Warning: OpenAI init failed: {e}")
             return None
 
     @property
@@ -98,7 +130,13 @@ class LLMClient:
         """Return max input tokens for the active provider."""
         return self._primary.MAX_INPUT_TOKENS
 
-    def generate(self, prompt: str, max_retries: int = 3) -> Optional[dict]:
+    def generate(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        system_prompt: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> Optional[dict]:
         """
         Send a prompt to the LLM with automatic fallback.
 
@@ -106,8 +144,12 @@ class LLMClient:
         or other error), falls back to the secondary provider.
 
         Args:
-            prompt: The full prompt text
+            prompt: The full prompt text (the user turn)
             max_retries: Number of retries per provider
+            system_prompt: Optional static instructions, sent separately so
+                the provider can cache them across calls
+            max_output_tokens: Output budget for this call (each provider
+                defaults to, and caps at, its own limits)
 
         Returns:
             Parsed JSON dict, or None if all providers fail
@@ -118,37 +160,43 @@ class LLMClient:
                 for retry later.
         """
         from .gemini_client import LLMTimeoutError
-        from openai import APITimeoutError
 
+        timeout_errors = _timeout_errors()
         primary_timed_out = False
 
         # Try primary
         try:
-            result = self._primary.generate(prompt, max_retries=max_retries)
+            result = self._primary.generate(
+                prompt, max_retries=max_retries, system_prompt=system_prompt,
+                max_output_tokens=max_output_tokens,
+            )
             if result is not None:
                 return result
-        except (LLMTimeoutError, APITimeoutError) as e:
-            print(f"  Primary ({self._active_provider_name}) timed out: {e}")
+        except timeout_errors as e:
+            logger.warning(f"  Primary ({self._active_provider_name}) timed out: {e}")
             primary_timed_out = True
 
         # Primary failed (or timed out) — try fallback
         if self._fallback is not None:
             fallback_name = "openai" if self._active_provider_name == "gemini" else "gemini"
             reason = "timed out" if primary_timed_out else "failed"
-            print(f"  Primary ({self._active_provider_name}) {reason} → falling back to {fallback_name}")
+            logger.warning(f"  Primary ({self._active_provider_name}) {reason} → falling back to {fallback_name}")
             self._active_provider_name = fallback_name
 
             try:
-                result = self._fallback.generate(prompt, max_retries=max_retries)
-            except (LLMTimeoutError, APITimeoutError):
+                result = self._fallback.generate(
+                    prompt, max_retries=max_retries, system_prompt=system_prompt,
+                    max_output_tokens=max_output_tokens,
+                )
+            except timeout_errors:
                 # Both providers timed out — re-raise so item stays pending
-                print(f"  Fallback ({fallback_name}) also timed out")
+                logger.warning(f"  Fallback ({fallback_name}) also timed out")
                 raise
 
             if result is not None:
                 # Fallback worked — swap it to primary for remaining items
                 # to avoid hammering the rate-limited/timed-out provider
-                print(f"  Switching to {fallback_name} for remaining items")
+                logger.info(f"  Switching to {fallback_name} for remaining items")
                 self._primary, self._fallback = self._fallback, self._primary
                 return result
 
@@ -160,6 +208,188 @@ class LLMClient:
 
         return None
 
+    def generate_batch(
+        self,
+        items: list[dict],
+        template: str,
+        batch_size: Optional[int] = None,
+        max_retries: int = 3,
+    ) -> list[Optional[dict]]:
+        """
+        Run many small prompts through as few LLM calls as possible.
+
+        Each item renders template (str.format fields), and up to batch_size
+        rendered items are packed into one numbered prompt whose answer is a
+        JSON array of per-item results. This shares one request (and one
+        rate-limit slot) across the batch.
+
+        If a batch comes back malformed or with the wrong number of results,
+        it is split in half and each half retried, down to single items sent
+        on their own — so one bad item doesn't sink the rest.
+
+        Args:
+            items: Format fields for each prompt
+            template: Per-item prompt template
+            batch_size: Items per call (defaults to LLM_BATCH_SIZE or 8)
+            max_retries: Number of retries per provider
+
+        Returns:
+            One parsed dict (or None on failure) per item, in order
+        """
+        if batch_size is None:
+            batch_size = int(os.getenv("LLM_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+
+        prompts = [template.format(**item) for item in items]
+        results: list[Optional[dict]] = []
+        for start in range(0, len(prompts), batch_size):
+            results.extend(self._generate_packed(prompts[start:start + batch_size], max_retries))
+        return results
+
+    def _generate_packed(self, prompts: list[str], max_retries: int) -> list[Optional[dict]]:
+        """One packed call for prompts, bisecting on a bad response."""
+        if len(prompts) == 1:
+            return [self.generate(prompts[0], max_retries=max_retries)]
+
+        n = len(prompts)
+        parts = [
+            f"Answer each of the {n} numbered items below independently. "
+            f'Respond with a JSON object {{"results": [...]}} where "results" is an '
+            f"array of exactly {n} JSON objects, one per item, in item order."
+        ]
+        for i, prompt in enumerate(prompts, 1):
+            parts.append(f"=== Item {i} ===\n{prompt}")
+
+        result = self.generate("\n\n".join(parts), max_retries=max_retries)
+        if isinstance(result, dict):
+            result = result.get("results")
+        if isinstance(result, list) and len(result) == n and all(isinstance(r, dict) for r in result):
+            return result
+
+        logger.warning(f"  Batch of {n} came back malformed, splitting")
+        mid = n // 2
+        return self._generate_packed(prompts[:mid], max_retries) + self._generate_packed(prompts[mid:], max_retries)
+
+    async def generate_many(
+        self,
+        prompts: list[str],
+        concurrency: int = 16,
+        max_retries: int = 3,
+        return_exceptions: bool = False,
+        system_prompt: Optional[str] = None,
+    ) -> list[Optional[dict]]:
+        """
+        Send many prompts concurrently, with the same fallback as generate().
+
+        Requests fan out over the providers' async SDKs, with at most
+        `concurrency` in flight; duplicate prompts share a single request.
+        Run from sync code with
+        asyncio.run(client.generate_many(prompts)).
+
+        Args:
+            prompts: Full prompt texts
+            concurrency: Maximum simultaneous API calls
+            max_retries: Number of retries per provider
+            return_exceptions: If True, a prompt that timed out on every
+                provider yields its exception in place instead of raising
+            system_prompt: Optional static instructions shared by every prompt
+
+        Returns:
+            Parsed JSON dicts (or None where all providers failed), in
+            the same order as prompts. Duplicate prompts get the same dict
+            object — copy before mutating one.
+
+        Raises:
+            LLMTimeoutError or APITimeoutError: If a prompt times out on
+                every provider and return_exceptions is False.
+        """
+        # Fresh async clients per batch: their HTTP sessions are bound to
+        # the running event loop, and each asyncio.run() starts a new one.
+        chain = [self._make_async(c) for c in (self._primary, self._fallback) if c is not None]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send(prompt: str) -> Optional[dict]:
+            async with semaphore:
+                return await self._agenerate(prompt, chain, max_retries, system_prompt)
+
+        def _one(prompt: str) -> asyncio.Task:
+            # Identical prompts in flight (e.g. the same video in two feeds)
+            # await the first request instead of sending their own. The
+            # winner's result also lands in the response cache, if enabled.
+            key = (system_prompt, prompt)
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(_send(prompt))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _, k=key: self._inflight.pop(k, None))
+            return task
+
+        results = await asyncio.gather(
+            *(_one(p) for p in prompts), return_exceptions=return_exceptions
+        )
+        return list(results)
+
+    @staticmethod
+    def _make_async(client):
+        """Build the async counterpart of a sync provider client."""
+        from .gemini_client import AsyncGeminiClient, GeminiClient
+
+        if isinstance(client, GeminiClient):
+            return AsyncGeminiClient(api_key=client.api_key, model=client.model_name)
+
+        from .openai_client import AsyncOpenAIClient
+
+        return AsyncOpenAIClient(api_key=client.api_key, model=client.model_name)
+
+    async def _agenerate(
+        self, prompt: str, chain: list, max_retries: int, system_prompt: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        One prompt through the async provider chain (see generate()).
+
+        chain is shared by the whole batch: the first prompt to succeed on the
+        fallback swaps it to the front so the rest of the batch skips the
+        failing provider, and the sync clients are swapped to match.
+        """
+        from .gemini_client import LLMTimeoutError
+
+        timeout_errors = _timeout_errors()
+        primary = chain[0]
+        fallback = chain[1] if len(chain) > 1 else None
+        primary_timed_out = False
+
+        try:
+            result = await primary.generate(prompt, max_retries=max_retries, system_prompt=system_prompt)
+            if result is not None:
+                return result
+        except timeout_errors as e:
+            logger.warning(f"  Primary ({primary.PROVIDER_NAME}) timed out: {e}")
+            primary_timed_out = True
+
+        if fallback is not None:
+            reason = "timed out" if primary_timed_out else "failed"
+            logger.warning(f"  Primary ({primary.PROVIDER_NAME}) {reason} → falling back to {fallback.PROVIDER_NAME}")
+
+            try:
+                result = await fallback.generate(prompt, max_retries=max_retries, system_prompt=system_prompt)
+            except timeout_errors:
+                logger.warning(f"  Fallback ({fallback.PROVIDER_NAME}) also timed out")
+                raise
+
+            if result is not None:
+                if chain[0] is primary:
+                    logger.info(f"  Switching to {fallback.PROVIDER_NAME} for remaining items")
+                    chain.reverse()
+                    self._primary, self._fallback = self._fallback, self._primary
+                    self._active_provider_name = fallback.PROVIDER_NAME
+                return result
+
+        if primary_timed_out:
+            raise LLMTimeoutError(
+                f"LLM call timed out and no fallback provider available"
+            )
+
+        return None
+
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count using the active provider."""
         return self._primary.estimate_tokens(text)
@@ -0,0 +1,67 @@
+"""
+Logging setup for the LLM processing modules.
+
+The provider clients log every retry, rate limit and fallback. Under the
+concurrent fan-out, writing those straight to stdout makes every producing
+thread/coroutine contend on the stdout lock, so records are handed to a
+queue and written by one background listener thread instead.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Parent logger of src.processors.* module loggers
+LOGGER_NAME = "src.processors"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route src.processors log records to stdout via a non-blocking queue.
+
+    Output matches the old print() lines (bare message, stdout). Safe to
+    call more than once; only the first call installs handlers.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    records: queue.Queue = queue.Queue(-1)
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.addHandler(QueueHandler(records))
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _listener = QueueListener(records, console)
+    _listener.start()
+    # Flush anything still queued before the interpreter exits
+    atexit.register(_stop_listener)
+
+
+def flush_logs() -> None:
+    """
+    Block until every queued record has been written to stdout.
+
+    Callers that print() their own progress lines call this first, so a
+    client's retry messages appear before the outcome they led to. No-op
+    when setup_logging() hasn't run.
+    """
+    if _listener is not None:
+        _listener.queue.join()
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -10,18 +10,73 @@ Used as a fallback when Gemini is rate-limited.
 
 from __future__ import annotations
 
+import logging
 import os
 import json
 import time
+import asyncio
+import functools
 from typing import Optional
 
 import httpx
-from openai import OpenAI, APITimeoutError
+
+from .backoff import full_jitter, retry_after_seconds
+from .http_client import get_shared_http_client
+from .response_cache import ResponseCache, get_response_cache
+from .response_parsing import (
+    JsonStreamBuffer,
+    json_loads,
+    parse_json_response,
+    parse_json_response_async,
+)
+from .tokens import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
 
 # Per-request timeout for LLM API calls (seconds).
 # Prevents the pipeline from hanging indefinitely on a single request.
 REQUEST_TIMEOUT_SECONDS = 120
 
+# Constant system turn, shared by every request (also keeps the prompt
+# prefix byte-identical for OpenAI's automatic prompt caching)
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a sharp tech/business analyst. Always respond with valid JSON only, no markdown formatting.",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _system_message(system_prompt: Optional[str]) -> dict:
+    """The system turn, with any static instructions appended (built once per prompt)."""
+    if system_prompt is None:
+        return _SYSTEM_MESSAGE
+    return {"role": "system", "content": f"{_SYSTEM_MESSAGE['content']}\n\n{system_prompt}"}
+
+
+def _retry_wait(error: Exception, attempt: int, max_retries: int) -> float:
+    """Decide how long to wait (seconds) after a failed OpenAI call."""
+    error_str = str(error).lower()
+
+    # Rate limit — OpenAI free tier can be strict
+    if "429" in error_str or "rate" in error_str:
+        # Trust the server's hint; otherwise jitter up to 30s, 60s, 90s
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            wait_time = retry_after + full_jitter(1)
+        else:
+            wait_time = full_jitter(30 * (attempt + 1))
+        logger.warning(f"  Rate limited, waiting {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
+        return wait_time
+
+    # Server error
+    if "500" in error_str or "503" in error_str:
+        wait_time = retry_after_seconds(error) or full_jitter(2 ** attempt)
+        logger.warning(f"  Server error, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
+        return wait_time
+
+    logger.warning(f"  OpenAI API error (attempt {attempt + 1}/{max_retries}): {error}")
+    return full_jitter(2 ** attempt) if attempt < max_retries - 1 else 0
+
 
 class OpenAIClient:
     """
@@ -30,9 +85,17 @@ class OpenAIClient:
     Implements the same interface as GeminiClient so they're interchangeable.
     """
 
+    PROVIDER_NAME = "openai"
+
     # GPT-4o has 128K context window
     MAX_INPUT_TOKENS = 120_000  # Leave room for the prompt template
 
+    # Generation settings (also part of the response cache key)
+    TEMPERATURE = 0.3
+    MAX_OUTPUT_TOKENS = 4096
+    # Model ceiling for a raised per-call budget (see generate)
+    MAX_OUTPUT_TOKENS_LIMIT = 16_384
+
     def __init__(self, api_key: str = None, model: str = "gpt-4o"):
         """
         Initialize the OpenAI client.
@@ -49,94 +112,152 @@ class OpenAIClient:
             )
 
         self.model_name = model
-        self.client = OpenAI(
+        self.client = self._build_client()
+
+    def _build_client(self):
+        """Create the SDK client (the async subclass builds AsyncOpenAI instead)."""
+        # SDK imported here, not at module level: openai (and pydantic)
+        # is slow to import and isn't needed when only Gemini is used.
+        from openai import OpenAI
+
+        return OpenAI(
             api_key=self.api_key,
             timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=10.0),
+            http_client=get_shared_http_client(),
         )
 
-    def generate(self, prompt: str, max_retries: int = 3) -> Optional[dict]:
+    def generate(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        system_prompt: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> Optional[dict]:
         """
         Send a prompt to OpenAI and get a parsed JSON response.
 
         Args:
-            prompt: The full prompt text
+            prompt: The full prompt text (the user turn)
             max_retries: Number of retries on failure
+            system_prompt: Optional static instructions, sent in the system
+                message so OpenAI's automatic prompt caching can reuse them
+            max_output_tokens: Output budget for this call (defaults to
+                MAX_OUTPUT_TOKENS, capped at MAX_OUTPUT_TOKENS_LIMIT)
 
         Returns:
             Parsed JSON dict, or None if all retries fail
         """
-        for attempt in range(max_retries):
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a sharp tech/business analyst. Always respond with valid JSON only, no markdown formatting."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.3,
-                    max_tokens=4096,
-                    response_format={"type": "json_object"},
-                )
+        from openai import APITimeoutError
+
+        from .gemini_client import LLMTimeoutError
 
-                text = response.choices[0].message.content.strip()
+        max_output_tokens = self._output_budget(max_output_tokens)
 
-                # Sometimes wraps JSON in markdown code blocks
-                if text.startswith("```json"):
-                    text = text[7:]
-                if text.startswith("```"):
-                    text = text[3:]
-                if text.endswith("```"):
-                    text = text[:-3]
-                text = text.strip()
+        # Exact-match response cache (opt-in via LLM_CACHE_PATH)
+        cache = get_response_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(prompt, system_prompt, max_output_tokens)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return json_loads(cached)
 
-                result = json.loads(text)
+        for attempt in range(max_retries):
+            try:
+                result, text = parse_json_response(
+                    self._stream_text(prompt, system_prompt, max_output_tokens)
+                )
+                if cache is not None:
+                    cache.put(cache_key, text)
                 return result
 
             except json.JSONDecodeError as e:
-                print(f"  JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.warning(f"  JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    time.sleep(full_jitter(2 ** attempt))
 
-            except APITimeoutError as e:
-                print(f"  TIMEOUT (attempt {attempt + 1}/{max_retries}): OpenAI API call timed out after {REQUEST_TIMEOUT_SECONDS}s")
+            except (APITimeoutError, LLMTimeoutError) as e:
+                # httpx's per-read timeout, or _stream_text's overall deadline
+                reason = e if isinstance(e, LLMTimeoutError) else (
+                    f"OpenAI API call stalled (no data for {REQUEST_TIMEOUT_SECONDS}s)"
+                )
+                logger.warning(f"  TIMEOUT (attempt {attempt + 1}/{max_retries}): {reason}")
                 # Don't retry timeouts — they'll likely time out again.
                 # Re-raise so the caller (LLMClient/Summarizer) can handle it.
                 raise
 
             except Exception as e:
-                error_str = str(e).lower()
+                time.sleep(_retry_wait(e, attempt, max_retries))
+
+        return None
 
-                # Rate limit — OpenAI free tier can be strict
-                if "429" in error_str or "rate" in error_str:
-                    wait_time = 30 * (attempt + 1)  # 30s, 60s, 90s
-                    print(f"  Rate limited, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
+    def _stream_text(
+        self, prompt: str, system_prompt: Optional[str] = None, max_output_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Stream a response and return its text once the JSON object closes.
 
-                # Server error
-                elif "500" in error_str or "503" in error_str:
-                    wait_time = 2 ** attempt
-                    print(f"  Server error, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
+        Reading stops at the closing brace instead of waiting on the stream
+        tail. httpx's read timeout only catches a stalled stream, so a
+        response that keeps trickling in is cut off at REQUEST_TIMEOUT_SECONDS
+        overall.
 
-                else:
-                    print(f"  OpenAI API error (attempt {attempt + 1}/{max_retries}): {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
+        Raises:
+            LLMTimeoutError: If the response is still streaming at the deadline
+        """
+        from .gemini_client import LLMTimeoutError
 
-        return None
+        deadline = time.monotonic() + REQUEST_TIMEOUT_SECONDS
+        buffer = JsonStreamBuffer()
+        stream = self.client.chat.completions.create(
+            **self._request_kwargs(prompt, system_prompt, max_output_tokens), stream=True
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and buffer.feed(chunk.choices[0].delta.content or ""):
+                    break
+                if time.monotonic() > deadline:
+                    raise LLMTimeoutError(
+                        f"OpenAI API call timed out after {REQUEST_TIMEOUT_SECONDS}s"
+                    )
+        finally:
+            stream.close()
+        return buffer.text()
+
+    def _output_budget(self, max_output_tokens: Optional[int]) -> int:
+        """Per-call output budget: the default, or a raised one within the model's limit."""
+        if max_output_tokens is None:
+            return self.MAX_OUTPUT_TOKENS
+        return min(max_output_tokens, self.MAX_OUTPUT_TOKENS_LIMIT)
+
+    def _cache_key(
+        self, prompt: str, system_prompt: Optional[str] = None, max_output_tokens: Optional[int] = None
+    ) -> str:
+        """Response cache key for a prompt under this client's settings."""
+        if system_prompt is not None:
+            prompt = f"{system_prompt}\0{prompt}"
+        return ResponseCache.make_key(
+            self.PROVIDER_NAME, self.model_name, self.TEMPERATURE,
+            max_output_tokens or self.MAX_OUTPUT_TOKENS, prompt,
+        )
+
+    def _request_kwargs(
+        self, prompt: str, system_prompt: Optional[str] = None, max_output_tokens: Optional[int] = None
+    ) -> dict:
+        """chat.completions.create arguments shared by the sync and async clients."""
+        return dict(
+            model=self.model_name,
+            messages=[_system_message(system_prompt), {"role": "user", "content": prompt}],
+            temperature=self.TEMPERATURE,
+            max_tokens=max_output_tokens or self.MAX_OUTPUT_TOKENS,
+            response_format={"type": "json_object"},
+        )
 
     def estimate_tokens(self, text: str) -> int:
         """
-        Rough estimate of token count.
-        GPT uses ~1 token per 4 characters for English text.
+        Token count for text (exact with tiktoken's GPT-4o encoding).
         """
-        return len(text) // 4
+        return count_tokens(text)
 
     def truncate_for_context(self, text: str, max_tokens: int = None) -> str:
         """
@@ -151,18 +272,76 @@ class OpenAIClient:
         """
         if max_tokens is None:
             max_tokens = self.MAX_INPUT_TOKENS
+        return truncate_to_tokens(text, max_tokens)
 
-        estimated = self.estimate_tokens(text)
-        if estimated <= max_tokens:
-            return text
 
-        # Truncate to fit, leaving some margin
-        max_chars = max_tokens * 4
-        truncated = text[:max_chars]
+class AsyncOpenAIClient(OpenAIClient):
+    """
+    Async variant of OpenAIClient for concurrent fan-out (LLMClient.generate_many).
 
-        # Try to break at a sentence boundary
-        last_period = truncated.rfind('. ')
-        if last_period > max_chars * 0.8:
-            truncated = truncated[:last_period + 1]
+    Same settings, cache, and retry policy as OpenAIClient, but generate() is a
+    coroutine backed by AsyncOpenAI.
+    """
+
+    def _build_client(self):
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=10.0),
+        )
+
+    async def generate(
+        self, prompt: str, max_retries: int = 3, system_prompt: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Send a prompt to OpenAI asynchronously and get a parsed JSON response.
+
+        Args:
+            prompt: The full prompt text (the user turn)
+            max_retries: Number of retries on failure
+            system_prompt: Optional static instructions (see OpenAIClient.generate)
+
+        Returns:
+            Parsed JSON dict, or None if all retries fail
+
+        Raises:
+            APITimeoutError or asyncio.TimeoutError: If a call exceeds
+                REQUEST_TIMEOUT_SECONDS
+        """
+        from openai import APITimeoutError
 
-        return truncated + "\n\n[Content truncated due to length]"
+        cache = get_response_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(prompt, system_prompt)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return json_loads(cached)
+
+        for attempt in range(max_retries):
+            try:
+                # httpx enforces the timeout per read; wait_for caps the whole call
+                response = await asyncio.wait_for(
+                    self.client.chat.completions.create(**self._request_kwargs(prompt, system_prompt)),
+                    timeout=REQUEST_TIMEOUT_SECONDS,
+                )
+
+                result, text = await parse_json_response_async(response.choices[0].message.content)
+                if cache is not None:
+                    cache.put(cache_key, text)
+                return result
+
+            except json.JSONDecodeError as e:
+                logger.warning(f"  JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(full_jitter(2 ** attempt))
+
+            except (APITimeoutError, asyncio.TimeoutError):
+                logger.warning(f"  TIMEOUT (attempt {attempt + 1}/{max_retries}): OpenAI API call timed out after {REQUEST_TIMEOUT_SECONDS}s")
+                raise
+
+            except Exception as e:
+                await asyncio.sleep(_retry_wait(e, attempt, max_retries))
+
+        return None
@@ -5,31 +5,34 @@ All prompts are versioned so we can track which prompt version
 produced each summary, enabling quality comparison over time.
 """
 
+from typing import Optional
+
 from ..storage.models import ContentItem
 
 
-PROMPT_VERSION = "v5.1"
+PROMPT_VERSION = "v5.3"
 
 
 # Shared blacklist: phrases the LLM must avoid. Used in both the prompt
 # (as instructions) and in post-processing (as a validation/replacement layer).
-# Maps banned phrase → replacement (empty string = just remove it).
-BLACKLISTED_PHRASES = {
-    "game-changer": "significant shift",
-    "game changer": "significant shift",
-    "non-negotiable": "essential",
-    "the message is clear": "",
-    "leveraging ai": "using AI",
-    "leveraging": "using",
-    "harnessing the power": "using",
-    "those who can't keep up will be left behind": "",
-    "those who can't keep up will be left behind": "",
-    "it's crucial": "it matters",
-    "the real deal": "",
-    "paradigm shift": "structural change",
-    "the landscape": "the market",
-    "in today's rapidly": "",
-}
+# (banned phrase, replacement) pairs (empty string = just remove it), sorted
+# longest first so a shorter overlapping phrase never wins the match
+# ("leveraging ai" is replaced whole before "leveraging" is tried).
+BLACKLISTED_PHRASES: tuple[tuple[str, str], ...] = tuple(sorted((
+    ("game-changer", "significant shift"),
+    ("game changer", "significant shift"),
+    ("non-negotiable", "essential"),
+    ("the message is clear", ""),
+    ("leveraging ai", "using AI"),
+    ("leveraging", "using"),
+    ("harnessing the power", "using"),
+    ("those who can't keep up will be left behind", ""),
+    ("it's crucial", "it matters"),
+    ("the real deal", ""),
+    ("paradigm shift", "structural change"),
+    ("the landscape", "the market"),
+    ("in today's rapidly", ""),
+), key=lambda pair: len(pair[0]), reverse=True))
 
 # Known entity misspellings → corrections
 ENTITY_CORRECTIONS = {
@@ -39,26 +42,10 @@ ENTITY_CORRECTIONS = {
 }
 
 
-def build_summarization_prompt(item: ContentItem) -> str:
-    """
-    Build the main summarization prompt for a content item.
-
-    Args:
-        item: The ContentItem to summarize
-
-    Returns:
-        Complete prompt string ready to send to the LLM
-    """
-    # Format duration or word count
-    if item.content_type == "video" and item.duration_seconds:
-        mins = item.duration_seconds // 60
-        length_str = f"{mins} minutes"
-    else:
-        length_str = f"{item.word_count:,} words"
-
-    content_text = item.transcript or "[No content available]"
-
-    return f"""You are writing a daily briefing for one reader: a former Director of Product now building an AI startup who also invests in tech stocks. He reads this in 5-10 minutes each morning.
+# The instructions are identical for every item and go out as the system
+# prompt, so the providers' automatic prefix caching can reuse them across
+# calls. Keep per-item values (title, dates, transcript) out of these constants.
+_TASK_INSTRUCTIONS = """You are writing a daily briefing for one reader: a former Director of Product now building an AI startup who also invests in tech stocks. He reads this in 5-10 minutes each morning.
 
 **YOUR VOICE:** You're a sharp analyst who writes like Matt Levine or Ben Thompson. You have strong opinions, you're occasionally funny, and you never sound like a press release. You write the way smart people talk at dinner — direct, specific, with an edge.
 
@@ -91,7 +78,7 @@ def build_summarization_prompt(item: ContentItem) -> str:
 
 INPUT: A 19,000-word podcast transcript about "vibe coding" and the new role of AI-assisted product builders
 OUTPUT:
-{{
+{
   "core_summary": "Forget 'prompt engineering' — the real emerging role is the vibe coder: someone with product taste and zero traditional coding ability who ships complete products using AI. The technical bar didn't just lower, it evaporated.",
   "key_insights": [
     "The PM/designer/engineer split is collapsing into one role. Job titles are lagging reality by ~2 years.",
@@ -99,18 +86,18 @@ OUTPUT:
     "Lovable and Replit are eating into agency revenue faster than agencies realize.",
     "Building in public creates a compounding credibility loop that traditional career paths can't match."
   ],
-  "concepts_explained": [{{"term": "Vibe coding", "explanation": "Writing software by describing what you want in natural language and iterating on AI output — like art direction, but for code."}}],
+  "concepts_explained": [{"term": "Vibe coding", "explanation": "Writing software by describing what you want in natural language and iterating on AI output — like art direction, but for code."}],
   "so_what": "Every SaaS company should be terrified: if a non-technical founder can ship a functional competitor in a weekend, your 18-month roadmap is your obituary. Watch Lovable ($LVBL) and Replit closely.",
   "topic_tags": ["vibe-coding", "solo-builders", "AI-tools"],
   "content_type": "interview",
   "freshness": "fresh",
   "tier": "deep_dive",
   "tier_rationale": "19K-word interview with genuine insight density — the transcript has 4+ non-obvious claims backed by concrete examples."
-}}
+}
 
 INPUT: A 725-word Stratechery newsletter update about Microsoft's AI earnings miss
 OUTPUT:
-{{
+{
   "core_summary": "Microsoft lost $357B in market cap because Wall Street doesn't understand the AI transition yet. The spending looks insane now; it'll look prescient in 18 months.",
   "key_insights": [
     "Azure growth slowed, but AI revenue within Azure is growing 150% YoY — the market is punishing the wrong metric.",
@@ -124,7 +111,7 @@ OUTPUT:
   "freshness": "fresh",
   "tier": "summary_sufficient",
   "tier_rationale": "725-word update — the summary captures the full argument. No need to read the original."
-}}
+}
 
 ---
 
@@ -171,7 +158,7 @@ OUTPUT:
 6. **CONTENT_TYPE** (choose one):
    market_call | news_analysis | industry_trend | framework | tutorial | interview | commentary
 
-7. **FRESHNESS** (given publication date {item.published_at.strftime('%Y-%m-%d')} and today's context):
+7. **FRESHNESS** (given the publication date in Content Details and today's context):
    fresh | evergreen | stale
 
 8. **RECOMMENDATION TIER**:
@@ -181,24 +168,13 @@ OUTPUT:
 
    Provide a one-sentence rationale.
 
-**Content Details:**
-- Title: {item.title}
-- Source: {item.source_name}
-- Published: {item.published_at.strftime('%Y-%m-%d')}
-- Length: {length_str}
-- Type: {"video" if item.content_type == "video" else "article"}
-
-**Content:**
-{content_text}
-
----
+"""
 
-Respond in this exact JSON format:
-{{
+_RESPONSE_FORMAT = """{
   "core_summary": "...",
   "key_insights": ["...", "..."],
   "concepts_explained": [
-    {{"term": "...", "explanation": "..."}}
+    {"term": "...", "explanation": "..."}
   ],
   "so_what": "...",
   "topic_tags": ["vibe-coding", "solo-builders", "AI-tools"],
@@ -206,7 +182,106 @@ Respond in this exact JSON format:
   "freshness": "evergreen",
   "tier": "worth_a_look",
   "tier_rationale": "..."
-}}"""
+}"""
+
+_BATCH_RESPONSE_FORMAT = """{
+  "results": [
+    {
+      "index": 1,
+      "core_summary": "...",
+      "key_insights": ["...", "..."],
+      "concepts_explained": [
+        {"term": "...", "explanation": "..."}
+      ],
+      "so_what": "...",
+      "topic_tags": ["vibe-coding", "solo-builders", "AI-tools"],
+      "content_type": "framework",
+      "freshness": "evergreen",
+      "tier": "worth_a_look",
+      "tier_rationale": "..."
+    }
+  ]
+}"""
+
+
+# System prompts, built once: single-item and batched summarization.
+_SYSTEM_PROMPT = f"{_TASK_INSTRUCTIONS}Respond in this exact JSON format:\n{_RESPONSE_FORMAT}"
+
+_BATCH_SYSTEM_PROMPT = (
+    f"{_TASK_INSTRUCTIONS}"
+    "You will summarize several separate items, numbered [1], [2], and so on. "
+    "Apply every rule above to each item independently — the variety rules apply across them.\n\n"
+    "Respond in this exact JSON format, with one entry per item in the \"results\" list "
+    "and \"index\" set to the item's number:\n"
+    f"{_BATCH_RESPONSE_FORMAT}"
+)
+
+
+def _item_header(item: ContentItem) -> str:
+    """Format the per-item metadata block that precedes the content text."""
+    # Format duration or word count
+    if item.content_type == "video" and item.duration_seconds:
+        mins = item.duration_seconds // 60
+        length_str = f"{mins} minutes"
+    else:
+        length_str = f"{item.word_count:,} words"
+
+    published = item.published_at.strftime('%Y-%m-%d')
+    content_type = "video" if item.content_type == "video" else "article"
+
+    return (
+        f"- Title: {item.title}\n"
+        f"- Source: {item.source_name}\n"
+        f"- Published: {published}\n"
+        f"- Length: {length_str}\n"
+        f"- Type: {content_type}\n\n"
+        "**Content:**\n"
+    )
+
+
+def build_summarization_prompt(item: ContentItem, transcript: Optional[str] = None) -> tuple[str, str]:
+    """
+    Build the main summarization prompt for a content item.
+
+    Args:
+        item: The ContentItem to summarize
+        transcript: Content text to use instead of item.transcript (e.g. a
+            truncated copy), so callers never need to mutate the item
+
+    Returns:
+        (system_prompt, user_prompt). The system prompt is the same for every
+        item; the user prompt holds only the item's details and content.
+    """
+    if transcript is None:
+        transcript = item.transcript
+    content_text = transcript or "[No content available]"
+    return _SYSTEM_PROMPT, "".join(("**Content Details:**\n", _item_header(item), content_text))
+
+
+def build_batch_summarization_prompt(items: list[ContentItem]) -> tuple[str, str]:
+    """
+    Build one summarization prompt covering several content items.
+
+    The shared voice/blacklist/example instructions go in the system prompt;
+    the user prompt has a numbered Content Details section per item. The LLM
+    is asked for one result per item, keyed by its [index].
+
+    Args:
+        items: The ContentItems to summarize, in order
+
+    Returns:
+        (system_prompt, user_prompt); the response is expected as
+        {"results": [{"index": 1, ...}, ...]}
+    """
+    sections = [
+        "".join((
+            f"**[{i}] Content Details:**\n",
+            _item_header(item),
+            item.transcript or "[No content available]",
+        ))
+        for i, item in enumerate(items, 1)
+    ]
+    return _BATCH_SYSTEM_PROMPT, "\n\n---\n\n".join(sections)
 
 
 def build_editorial_intro_prompt(item_summaries: list) -> str:
@@ -222,10 +297,10 @@ def build_editorial_intro_prompt(item_summaries: list) -> str:
     Returns:
         Prompt string for the LLM (expects JSON response with 'editorial_intro' key)
     """
-    items_text = ""
-    for i, item in enumerate(item_summaries, 1):
-        domains = ", ".join(item.get("topic_tags", []))
-        items_text += f"{i}. [{domains}] {item['title']}\n   {item['core_summary'][:150]}\n\n"
+    items_text = "".join(
+        f"{i}. [{', '.join(item.get('topic_tags', []))}] {item['title']}\n   {item['core_summary'][:150]}\n\n"
+        for i, item in enumerate(item_summaries, 1)
+    )
 
     return f"""You are writing a 1-2 sentence editorial intro for a daily tech/AI briefing newsletter.
 
@@ -0,0 +1,43 @@
+"""
+Client-side request rate limiting for concurrent LLM calls.
+
+With several requests in flight, a fixed sleep between calls no longer
+bounds the request rate. A token bucket does: each call takes a token, and
+tokens refill at the configured requests-per-minute.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket: at most `capacity` calls at once, refilled at rpm/60 per second.
+
+    Usage:
+        bucket = TokenBucket(rpm=15)
+        await bucket.acquire()  # before each API call
+    """
+
+    def __init__(self, rpm: float, capacity: int = 1):
+        if rpm <= 0:
+            raise ValueError("rpm must be positive")
+        self.rate = rpm / 60.0  # tokens per second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
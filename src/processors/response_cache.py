@@ -0,0 +1,111 @@
+"""
+Persistent exact-match cache for LLM responses.
+
+Re-running the pipeline on the same transcripts (common while debugging
+prompts or the parser) otherwise re-sends identical prompts to Gemini/OpenAI.
+This cache short-circuits those calls with a local SQLite lookup.
+
+Keys are a SHA-256 of (PROMPT_VERSION, provider, model, temperature,
+max_tokens, prompt), so any change to the prompt wording or generation
+settings is a cache miss, and bumping PROMPT_VERSION invalidates the whole
+cache. Whitespace in the prompt is normalized for the key only (CRLF vs LF
+transcripts, trailing newlines) — the prompt sent to the API is unchanged.
+
+Opt-in: the cache is only used when LLM_CACHE_PATH is set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .prompts import PROMPT_VERSION
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_for_key(prompt: str) -> str:
+    """Collapse whitespace runs so formatting-only differences share a key."""
+    return _WHITESPACE_RE.sub(" ", prompt).strip()
+
+
+class ResponseCache:
+    """
+    SQLite-backed key → raw JSON response text store.
+
+    One connection is shared across threads (guarded by a lock) so the
+    cache works from the concurrent processing paths too.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                response_json TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        prompt: str,
+        cache_salt: str = PROMPT_VERSION,
+    ) -> str:
+        """Build the cache key for a generation request."""
+        raw = f"{cache_salt}|{provider}|{model}|{temperature}|{max_tokens}|{_normalize_for_key(prompt)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response_json: str):
+        """Store a successfully parsed response's text."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response_json, created) VALUES (?, ?, ?)",
+                (key, response_json, time.time()),
+            )
+            self._conn.commit()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide response cache.
+
+    Returns None (caching disabled) unless LLM_CACHE_PATH is set.
+    """
+    global _cache
+    path = os.getenv("LLM_CACHE_PATH")
+    if not path:
+        return None
+
+    with _cache_lock:
+        if _cache is None or _cache.path != Path(path).expanduser():
+            _cache = ResponseCache(path)
+        return _cache
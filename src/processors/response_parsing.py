@@ -0,0 +1,167 @@
+"""
+Shared parsing for LLM JSON responses.
+
+Both providers are asked for bare JSON, but occasionally wrap it in a
+markdown code fence anyway. These helpers strip that and parse the body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+
+# orjson parses LLM-sized payloads 2-3x faster; fall back to stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+# `except json.JSONDecodeError` handlers cover both.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    json_loads = json.loads
+
+
+# Optional ```json fence around the whole body; the closing fence is optional
+# so a truncated response still gets its opening fence removed.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+
+
+def strip_json_fence(text: str) -> str:
+    """Remove a surrounding markdown code fence (and whitespace) from text."""
+    match = _FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
+
+
+def parse_json_response(text: str) -> tuple[dict, str]:
+    """
+    Parse an LLM response body as JSON.
+
+    Returns:
+        (parsed dict, cleaned JSON text) — the text is what gets cached.
+
+    Raises:
+        json.JSONDecodeError: If the body isn't valid JSON
+    """
+    text = strip_json_fence(text)
+    return json_loads(text), text
+
+
+# Responses above this size are parsed off the event loop thread
+ASYNC_PARSE_OFFLOAD_BYTES = 8192
+
+
+async def parse_json_response_async(text: str) -> tuple[dict, str]:
+    """
+    parse_json_response for the async clients.
+
+    Large bodies are parsed in a worker thread so a burst of completions
+    landing together doesn't stall the event loop; small ones aren't
+    worth the thread hop.
+    """
+    if len(text) > ASYNC_PARSE_OFFLOAD_BYTES:
+        return await asyncio.to_thread(parse_json_response, text)
+    return parse_json_response(text)
+
+
+# Characters that can change JSON nesting depth or string state
+_STRUCTURAL_RE = re.compile(r'[{}\[\]"\\]')
+
+# What may precede the opening brace: whitespace and an optional ```json fence
+_LEAD_RE = re.compile(r"\s*(?:```(?:json)?\s*)?")
+
+
+def _is_json_lead(text: str, final: bool) -> bool:
+    """Whether text can precede a JSON body (or, if not final, grow into something that can)."""
+    if _LEAD_RE.fullmatch(text):
+        return True
+    return not final and "```json".startswith(text.lstrip())
+
+
+class JsonStreamBuffer:
+    """
+    Accumulates a streamed JSON response and notices when it's complete.
+
+    Tracks nesting depth (ignoring brackets inside strings) so the caller
+    can stop reading as soon as the top-level value closes, instead of
+    waiting for the provider to finish the stream. Only structural
+    characters are visited, via a regex, so feeding is cheap.
+
+    A response that opens with anything other than an (optionally fenced)
+    object or array can never parse, so it is flagged `malformed` as soon
+    as that's visible and the caller can stop reading and retry without
+    waiting for the rest of the stream.
+    """
+
+    def __init__(self):
+        self._parts: list[str] = []
+        self._lead = ""
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escape_pending = False
+        self.complete = False
+        self.malformed = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Add a chunk of response text.
+
+        Returns True once reading can stop: the JSON value has closed, or
+        the response is already known to be malformed.
+        """
+        if not chunk:
+            return self.complete or self.malformed
+        self._parts.append(chunk)
+        if self.complete or self.malformed:
+            return True
+        if not self._started:
+            return self._feed_lead(chunk)
+        return self._scan(chunk)
+
+    def _feed_lead(self, chunk: str) -> bool:
+        """Check text before the opening brace, then scan from the brace on."""
+        match = _STRUCTURAL_RE.search(chunk)
+        if match is None:
+            self._lead += chunk
+            self.malformed = not _is_json_lead(self._lead, final=False)
+            return self.malformed
+
+        start = match.start()
+        if match.group() not in "{[" or not _is_json_lead(self._lead + chunk[:start], final=True):
+            self.malformed = True
+            return True
+        self._lead = ""
+        return self._scan(chunk[start:])
+
+    def _scan(self, chunk: str) -> bool:
+        """Track nesting through chunk, which lies at or after the opening brace."""
+        # Index below which characters are escaped (inside a string)
+        skip = 1 if self._escape_pending else 0
+        self._escape_pending = False
+
+        for match in _STRUCTURAL_RE.finditer(chunk):
+            i = match.start()
+            if i < skip:
+                continue
+            c = match.group()
+            if self._in_string:
+                if c == "\\":
+                    skip = i + 2
+                    self._escape_pending = skip > len(chunk)
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._depth += 1
+                self._started = True
+            elif c in "}]":
+                self._depth -= 1
+                if self._started and self._depth == 0:
+                    self.complete = True
+                    break
+        return self.complete
+
+    def text(self) -> str:
+        """All text received so far."""
+        return "".join(self._parts)
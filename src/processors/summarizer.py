@@ -10,29 +10,43 @@ Orchestrates the processing of content items through the LLM:
 6. Saves results
 """
 
+import asyncio
+import dataclasses
+import re
 from datetime import datetime
 from typing import Optional
 
-from .prompts import build_summarization_prompt, PROMPT_VERSION, BLACKLISTED_PHRASES, ENTITY_CORRECTIONS
+from .logs import flush_logs
+from .prompts import build_summarization_prompt, build_batch_summarization_prompt, PROMPT_VERSION, BLACKLISTED_PHRASES, ENTITY_CORRECTIONS
+from .rate_limit import TokenBucket
 from ..fetchers.rss import _is_paywall_content
 from ..storage.database import Database
 from ..storage.models import ContentItem, ProcessedContent, ConceptExplanation
 
+try:
+    import ahocorasick
+except ImportError:  # optional — falls back to the compiled alternation regex
+    ahocorasick = None
+
 
 # Minimum word count to process — skip YouTube Shorts, teasers, etc.
 MIN_WORD_COUNT = 500
 
+# Output budget per summary in a batched call (the clients' single-item
+# default), so a batch of b items asks for b times as much
+OUTPUT_TOKENS_PER_ITEM = 4096
+
 # Valid values for validation
-VALID_TIERS = {"deep_dive", "worth_a_look", "summary_sufficient"}
-VALID_FRESHNESS = {"fresh", "evergreen", "stale"}
-VALID_CONTENT_TYPES = {
+VALID_TIERS = frozenset({"deep_dive", "worth_a_look", "summary_sufficient"})
+VALID_FRESHNESS = frozenset({"fresh", "evergreen", "stale"})
+VALID_CONTENT_TYPES = frozenset({
     "market_call", "news_analysis", "industry_trend",
     "framework", "tutorial", "interview", "commentary",
-}
+})
 
 # Sources known for high-quality deep content (interviews, research, essays)
 # NOTE: greg-isenberg intentionally excluded — his content is tutorials, not deep research
-DEEP_SOURCES = {"dwarkesh-patel", "lennys-podcast", "stratechery"}
+DEEP_SOURCES = frozenset({"dwarkesh-patel", "lennys-podcast", "stratechery"})
 
 # Tier calibration thresholds
 # LLMs tend to default everything to worth_a_look, so we apply
@@ -42,6 +56,34 @@ DEEP_DIVE_LONG_FORM = 18000      # Very long content = deep dive regardless of s
 DEEP_DIVE_MIN_INSIGHTS = 5       # Many insights = dense content
 SUMMARY_SUFFICIENT_MAX_WORDS = 1500  # Short = limited depth
 
+# Post-processing patterns, compiled once. Each blacklisted phrase gets its own
+# group so the match's lastindex picks the replacement; BLACKLISTED_PHRASES is
+# sorted longest first, so "leveraging ai" wins over "leveraging".
+_BLACKLIST_RE = re.compile(
+    "|".join(f"({re.escape(phrase)})" for phrase, _ in BLACKLISTED_PHRASES),
+    re.IGNORECASE,
+)
+_BLACKLIST_REPLACEMENTS = [replacement for _, replacement in BLACKLISTED_PHRASES]
+
+
+def _build_blacklist_automaton():
+    """Build an Aho-Corasick automaton over the lowercased blacklist, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase, replacement in BLACKLISTED_PHRASES:
+        key = phrase.lower()
+        automaton.add_word(key, (len(key), replacement))
+    automaton.make_automaton()
+    return automaton
+
+
+_BLACKLIST_AUTOMATON = _build_blacklist_automaton()
+_ENTITY_RE = re.compile("|".join(map(re.escape, ENTITY_CORRECTIONS)))
+# Double spaces (group 1) and orphaned punctuation like "; ;" or ", ,"
+# left behind by removals, cleaned up in one scan
+_CLEANUP_RE = re.compile(r'(  +)|[;,]\s*[;,]')
+
 
 class Summarizer:
     """
@@ -61,55 +103,82 @@ class Summarizer:
             from .llm_client import LLMClient
             client = LLMClient(provider="auto")
         self.client = client
+        # Token counts of the static system prompts, computed once each
+        self._system_prompt_tokens: dict[str, int] = {}
 
-    def process_item(self, item: ContentItem) -> Optional[ProcessedContent]:
+    def process_item(
+        self, item: ContentItem, prechecked: bool = False, now: Optional[datetime] = None
+    ) -> Optional[ProcessedContent]:
         """
         Process a single content item through the LLM.
 
         Args:
             item: ContentItem with transcript to process
+            prechecked: True if the item already passed _skip_status (e.g.
+                it came from _load_pending), so the checks aren't repeated
+            now: Timestamp for processed_at and the backlog cutoff (defaults
+                to the current time; pending runs pass one for the whole run)
 
         Returns:
             ProcessedContent if successful, None if failed
         """
+        processed, status = self._summarize_item(item, prechecked=prechecked, now=now)
+        return self._record_result(item, processed, status)
+
+    @staticmethod
+    def _skip_status(item: ContentItem) -> Optional[str]:
+        """
+        Status for an item that shouldn't go to the LLM, or None if it should.
+
+        Run once per item: the paywall check scans the whole transcript.
+        """
         if not item.transcript:
             print(f"  Skipping (no transcript): {item.title}")
-            self.db.update_content_status(item.id, "no_transcript")
-            return None
+            return "no_transcript"
 
         # Paywall detection — catch stubs that slipped through the fetcher
         if _is_paywall_content(item.transcript):
             print(f"  Skipping (paywall content detected): {item.title}")
-            self.db.update_content_status(item.id, "paywall")
-            return None
+            return "paywall"
 
         if item.word_count < MIN_WORD_COUNT:
             print(f"  Skipping (too short: {item.word_count} words < {MIN_WORD_COUNT} min): {item.title}")
-            self.db.update_content_status(item.id, "skipped")
-            return None
+            return "skipped"
 
-        # Build the prompt
-        prompt = build_summarization_prompt(item)
+        return None
 
-        # Truncate content if it's too long for the context window
-        estimated_tokens = self.client.estimate_tokens(prompt)
-        if estimated_tokens > self.client.MAX_INPUT_TOKENS:
-            # Truncate just the transcript portion and rebuild
-            max_transcript_tokens = self.client.MAX_INPUT_TOKENS - self.client.estimate_tokens(
-                prompt.replace(item.transcript, "")
-            )
-            truncated_transcript = self.client.truncate_for_context(
-                item.transcript, max_transcript_tokens
-            )
-            # Rebuild prompt with truncated transcript
-            original_transcript = item.transcript
-            item.transcript = truncated_transcript
-            prompt = build_summarization_prompt(item)
-            item.transcript = original_transcript  # Restore original
+    def _summarize_item(
+        self, item: ContentItem, prechecked: bool = False, now: Optional[datetime] = None
+    ) -> tuple[Optional[ProcessedContent], Optional[str]]:
+        """
+        Run one item through the LLM without touching the database.
+
+        Safe to call from worker threads (see process_pending_async); the
+        caller records the outcome with _record_result.
+
+        Returns:
+            (ProcessedContent or None, status to record). A None status
+            leaves the item pending (timeouts are retried on a later run).
+        """
+        if not prechecked:
+            skip_status = self._skip_status(item)
+            if skip_status is not None:
+                return None, skip_status
+
+        # Build the prompt, truncating the transcript to whatever the context
+        # window leaves after the (cached) system prompt and the item header
+        system_prompt, header = build_summarization_prompt(item, transcript="")
+        max_transcript_tokens = (
+            self.client.MAX_INPUT_TOKENS
+            - self._static_prompt_tokens(system_prompt)
+            - self.client.estimate_tokens(header)
+        )
+        transcript = self.client.truncate_for_context(item.transcript, max_transcript_tokens)
+        _, prompt = build_summarization_prompt(item, transcript=transcript)
 
         # Send to LLM (with timeout protection)
         try:
-            result = self.client.generate(prompt)
+            result = self._generate(prompt, system_prompt)
         except Exception as e:
             # Check if this is a timeout error from either provider
             error_name = type(e).__name__
@@ -117,33 +186,45 @@ class Summarizer:
                 print(f"  TIMEOUT: {item.title} ({item.word_count} words) — "
                       f"LLM call exceeded time limit. Item stays pending for retry.")
                 # Do NOT mark as failed — leave as pending so it can be retried later
-                return None
+                return None, None
             # Non-timeout exceptions: mark as failed
             print(f"  Failed (unexpected error: {e}): {item.title}")
-            self.db.update_content_status(item.id, "failed")
-            return None
+            return None, "failed"
 
         if result is None:
             print(f"  Failed (API error): {item.title}")
-            self.db.update_content_status(item.id, "failed")
-            return None
+            return None, "failed"
 
         # Parse and validate the response
-        processed = self._parse_response(item, result)
+        processed = self._parse_response(item, result, now)
         if processed is None:
             print(f"  Failed (parse error): {item.title}")
-            self.db.update_content_status(item.id, "failed")
-            return None
-
-        # Save to database
-        self.db.save_processed(processed)
-        self.db.update_content_status(item.id, "processed")
-
+            return None, "failed"
+
+        return processed, "processed"
+
+    def _record_result(
+        self, item: ContentItem, processed: Optional[ProcessedContent], status: Optional[str]
+    ) -> Optional[ProcessedContent]:
+        """Save a _summarize_item outcome to the database, in one transaction."""
+        with self.db.transaction():
+            if processed is not None:
+                self.db.save_processed(processed)
+            if status is not None:
+                self.db.update_content_status(item.id, status)
         return processed
 
+    def _static_prompt_tokens(self, system_prompt: str) -> int:
+        """Token count of a system prompt; it never changes, so count it once."""
+        tokens = self._system_prompt_tokens.get(system_prompt)
+        if tokens is None:
+            tokens = self.client.estimate_tokens(system_prompt)
+            self._system_prompt_tokens[system_prompt] = tokens
+        return tokens
+
     def process_pending(self, limit: int = None, delay: int = 0) -> dict:
         """
-        Process all pending content items.
+        Process all pending content items, one at a time.
 
         Args:
             limit: Maximum number of items to process
@@ -152,33 +233,85 @@ class Summarizer:
         Returns:
             Dict with counts: {processed, failed, skipped, total}
         """
-        import time as _time
+        rpm_limit = 60 / delay if delay > 0 else None
+        return asyncio.run(self.process_pending_async(limit=limit, concurrency=1, rpm_limit=rpm_limit))
 
-        items = self.db.get_pending_content(limit=limit)
+    async def process_pending_async(
+        self, limit: int = None, concurrency: int = 4, rpm_limit: Optional[float] = None
+    ) -> dict:
+        """
+        Process pending content items with several LLM calls in flight.
 
-        stats = {"processed": 0, "failed": 0, "skipped": 0, "total": len(items)}
-        last_api_call = 0  # Track when we last made an API call
+        Each item's LLM work runs in a worker thread (the provider SDK calls
+        block); database writes stay on the event loop's thread, since the
+        SQLite connection belongs to it. Run from sync code with
+        asyncio.run(summarizer.process_pending_async()).
 
-        for i, item in enumerate(items, 1):
-            print(f"\n[{i}/{len(items)}] {item.title[:60]}")
+        Args:
+            limit: Maximum number of items to process
+            concurrency: Maximum items being summarized at once
+            rpm_limit: Maximum LLM calls started per minute (None = unlimited)
 
-            if not item.transcript:
-                print(f"  Skipped (no transcript)")
-                self.db.update_content_status(item.id, "no_transcript")
-                stats["skipped"] += 1
-                continue
+        Returns:
+            Dict with counts: {processed, failed, skipped, total}
+        """
+        items, skipped = self._load_pending(limit)
+
+        stats = {"processed": 0, "failed": 0, "skipped": skipped, "total": len(items) + skipped}
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        now = datetime.now()
+        # Created here, inside the running loop (asyncio primitives bind to it on 3.9)
+        bucket = TokenBucket(rpm_limit) if rpm_limit else None
+
+        async def _process(i: int, item: ContentItem):
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                print(f"\n[{i}/{len(items)}] {item.title[:60]}")
+                processed, status = await asyncio.to_thread(self._summarize_item, item, True, now)
+
+            result = self._record_result(item, processed, status)
+            if result:
+                print(f"  {result.tier_emoji} {result.tier} | {', '.join(result.domains)}")
+                stats["processed"] += 1
+            else:
+                stats["failed"] += 1
 
-            if _is_paywall_content(item.transcript):
-                print(f"  Skipped (paywall content)")
-                self.db.update_content_status(item.id, "paywall")
-                stats["skipped"] += 1
-                continue
+        await asyncio.gather(*(_process(i, item) for i, item in enumerate(items, 1)))
+        return stats
 
-            if item.word_count < MIN_WORD_COUNT:
-                print(f"  Skipped (too short: {item.word_count} words)")
-                self.db.update_content_status(item.id, "skipped")
-                stats["skipped"] += 1
-                continue
+    def process_pending_batched(self, limit: int = None, batch_size: int = 4, delay: int = 0) -> dict:
+        """
+        Process pending content items, several per LLM call.
+
+        Each batch shares one prompt (see build_batch_summarization_prompt), so
+        N items cost roughly N/batch_size round-trips. Transcripts are
+        pre-truncated to an equal share of the context window, and the output
+        budget grows with the batch. Items the LLM leaves out of its answer
+        (or all of them, if the batch call fails) are retried one at a time
+        via process_item.
+
+        Args:
+            limit: Maximum number of items to process
+            batch_size: Items per LLM call
+            delay: Seconds to wait between API calls (helps with rate limits)
+
+        Returns:
+            Dict with counts: {processed, failed, skipped, total}
+        """
+        import time as _time
+
+        ready, skipped = self._load_pending(limit)
+
+        stats = {"processed": 0, "failed": 0, "skipped": skipped, "total": len(ready) + skipped}
+        batch_size = max(1, batch_size)
+        now = datetime.now()
+
+        last_api_call = 0  # Track when we last made an API call
+
+        for start in range(0, len(ready), batch_size):
+            batch = ready[start:start + batch_size]
+            print(f"\n[{start + 1}-{start + len(batch)}/{len(ready)}] Batch of {len(batch)}")
 
             # Respect rate limit delay between API calls
             if delay > 0 and last_api_call > 0:
@@ -189,16 +322,136 @@ class Summarizer:
                     _time.sleep(wait)
 
             last_api_call = _time.time()
-            result = self.process_item(item)
-
-            if result:
-                print(f"  {result.tier_emoji} {result.tier} | {', '.join(result.domains)}")
-                stats["processed"] += 1
-            else:
-                stats["failed"] += 1
+            for item, processed in self._process_batch(batch, now):
+                if processed:
+                    print(f"  {processed.tier_emoji} {processed.tier} | {item.title[:60]}")
+                    stats["processed"] += 1
+                else:
+                    stats["failed"] += 1
 
         return stats
 
+    def _process_batch(self, batch: list[ContentItem], now: Optional[datetime] = None) -> list[tuple]:
+        """
+        Summarize a batch of items with a single LLM call.
+
+        Returns:
+            (item, ProcessedContent or None) pairs in batch order
+        """
+        # Give each item an equal share of the context window, leaving one
+        # share for the instructions and response format.
+        per_item_tokens = self.client.MAX_INPUT_TOKENS // (len(batch) + 1)
+        prompt_items = []
+        for item in batch:
+            if self.client.estimate_tokens(item.transcript) > per_item_tokens:
+                item = dataclasses.replace(
+                    item,
+                    transcript=self.client.truncate_for_context(item.transcript, per_item_tokens),
+                )
+            prompt_items.append(item)
+
+        try:
+            system_prompt, prompt = build_batch_summarization_prompt(prompt_items)
+            result = self._generate(
+                prompt, system_prompt, max_output_tokens=OUTPUT_TOKENS_PER_ITEM * len(batch)
+            )
+        except Exception as e:
+            if "Timeout" in type(e).__name__:
+                print(f"  TIMEOUT: batch of {len(batch)} — items stay pending for retry.")
+                return [(item, None) for item in batch]
+            print(f"  Batch failed (unexpected error: {e}) — retrying items individually")
+            result = {}
+
+        if result is None:
+            # Usually a response that never parsed (e.g. cut off mid-JSON);
+            # the items may well succeed on their own
+            print(f"  Batch failed (API error) — retrying items individually")
+
+        # JSON mode doesn't force a top-level object, so a bare array is
+        # taken as the results list itself
+        if isinstance(result, list):
+            results = result
+        elif isinstance(result, dict) and isinstance(result.get("results"), list):
+            results = result["results"]
+        else:
+            results = None
+
+        entries = {}
+        if results is not None:
+            for entry in results:
+                if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                    entries.setdefault(entry["index"], entry)
+        elif result:
+            print(f"  Batch response missing 'results' — retrying items individually")
+
+        outcomes = []
+        for i, item in enumerate(batch, 1):
+            entry = entries.get(i)
+            if entry is None:
+                outcomes.append((item, self.process_item(item, prechecked=True, now=now)))
+                continue
+
+            processed = self._parse_response(item, entry, now)
+            if processed is None:
+                print(f"  Failed (parse error): {item.title}")
+            self._record_result(item, processed, "failed" if processed is None else "processed")
+            outcomes.append((item, processed))
+
+        return outcomes
+
+    def _generate(
+        self, prompt: str, system_prompt: str, max_output_tokens: Optional[int] = None
+    ) -> Optional[dict]:
+        """
+        Send a prompt to the LLM client.
+
+        The client logs its retries through the queued logger while this
+        module prints, so the queue is drained before returning; otherwise
+        "Rate limited, waiting..." can land after the item's outcome line.
+        """
+        kwargs = {"system_prompt": system_prompt}
+        if max_output_tokens is not None:
+            kwargs["max_output_tokens"] = max_output_tokens
+        try:
+            return self.client.generate(prompt, **kwargs)
+        finally:
+            flush_logs()
+
+    def _load_pending(self, limit: int = None) -> tuple[list[ContentItem], int]:
+        """
+        Load the pending items worth sending to the LLM.
+
+        Only the newest `limit` pending items are considered. Those with no
+        transcript or too few words are marked in SQL without being loaded;
+        paywall stubs are filtered here and marked in one bulk update.
+
+        Returns:
+            (items to process, number of items skipped)
+        """
+        skipped_counts = self.db.skip_unprocessable_pending(MIN_WORD_COUNT, limit=limit)
+        # The rows just marked left the window; load only what remains of it
+        remaining = limit - sum(skipped_counts.values()) if limit else None
+
+        # Stream the rows and keep only the id and title of paywall stubs,
+        # so their transcripts are released as soon as they're scanned
+        ready, paywalled = [], {}
+        if remaining is None or remaining > 0:
+            for item in self.db.iter_pending_content(limit=remaining, min_word_count=MIN_WORD_COUNT):
+                if _is_paywall_content(item.transcript):
+                    paywalled[item.id] = item.title
+                else:
+                    ready.append(item)
+        self.db.bulk_update_status(list(paywalled), "paywall")
+
+        if skipped_counts["no_transcript"]:
+            print(f"  Skipped {skipped_counts['no_transcript']} (no transcript)")
+        if skipped_counts["skipped"]:
+            print(f"  Skipped {skipped_counts['skipped']} (too short: < {MIN_WORD_COUNT} words)")
+        for title in paywalled.values():
+            print(f"  Skipped (paywall content): {title[:60]}")
+
+        return ready, sum(skipped_counts.values()) + len(paywalled)
+
     def _enforce_blacklist(self, data: dict) -> dict:
         """
         Post-processing: replace blacklisted phrases and fix known entity errors
@@ -233,22 +486,43 @@ class Summarizer:
     @staticmethod
     def _clean_text(text: str) -> str:
         """Apply blacklist replacements and entity corrections to a string."""
-        import re
-
-        for phrase, replacement in BLACKLISTED_PHRASES.items():
-            pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-            text = pattern.sub(replacement, text)
+        text = Summarizer._replace_blacklisted(text)
+        text = _ENTITY_RE.sub(lambda m: ENTITY_CORRECTIONS[m.group(0)], text)
 
-        for wrong, correct in ENTITY_CORRECTIONS.items():
-            text = text.replace(wrong, correct)
+        # Clean up double spaces and orphaned punctuation left by removals
+        return _CLEANUP_RE.sub(lambda m: ' ' if m.group(1) else ',', text).strip()
 
-        # Clean up double spaces left by removals
-        text = re.sub(r'  +', ' ', text)
-        # Clean up orphaned punctuation from removals (e.g., "; ;" or ", ,")
-        text = re.sub(r'[;,]\s*[;,]', ',', text)
-        text = text.strip()
+    @staticmethod
+    def _replace_blacklisted(text: str) -> str:
+        """
+        Replace every blacklisted phrase (case-insensitive) in a single scan.
 
-        return text
+        Uses the Aho-Corasick automaton when pyahocorasick is installed:
+        matches are taken leftmost-longest and spliced in one join. Falls back
+        to the compiled alternation regex otherwise, or when lowercasing would
+        shift character offsets.
+        """
+        lower = text.lower()
+        if _BLACKLIST_AUTOMATON is None or len(lower) != len(text):
+            return _BLACKLIST_RE.sub(lambda m: _BLACKLIST_REPLACEMENTS[m.lastindex - 1], text)
+
+        matches = sorted(
+            (end - length + 1, -length, replacement)
+            for end, (length, replacement) in _BLACKLIST_AUTOMATON.iter(lower)
+        )
+        if not matches:
+            return text
+
+        pieces = []
+        pos = 0
+        for start, neg_length, replacement in matches:
+            if start < pos:
+                continue  # overlaps a phrase already replaced
+            pieces.append(text[pos:start])
+            pieces.append(replacement)
+            pos = start - neg_length
+        pieces.append(text[pos:])
+        return "".join(pieces)
 
     def _calibrate_tier(self, item: ContentItem, llm_tier: str, content_type: str,
                         key_insights: list, freshness: str) -> tuple:
@@ -263,57 +537,49 @@ class Summarizer:
             (tier, rationale_suffix) — the calibrated tier and an explanation
         """
         tier = llm_tier
-        reason = ""
-
-        # --- Promote to deep_dive ---
-        # Very long content (15K+) is almost certainly deep enough to warrant the original
-        if (item.word_count >= DEEP_DIVE_LONG_FORM
-                and tier != "deep_dive"):
-            tier = "deep_dive"
-            reason = f" [Calibrated: {item.word_count:,}-word long-form]"
-
-        # Long-form content from quality sources is almost always worth a deep dive
-        elif (item.word_count >= DEEP_DIVE_MIN_WORDS
-                and item.source_id in DEEP_SOURCES
-                and tier != "deep_dive"):
-            tier = "deep_dive"
-            reason = f" [Calibrated: {item.word_count:,} words from {item.source_id}]"
-
-        # Long-form interviews are worth the original
-        elif (item.word_count >= DEEP_DIVE_MIN_WORDS
-              and content_type == "interview"
-              and tier != "deep_dive"):
-            tier = "deep_dive"
-            reason = f" [Calibrated: {item.word_count:,}-word interview]"
-
-        # Long content (8K+) with many insights should be deep_dive
-        elif (item.word_count >= DEEP_DIVE_MIN_WORDS
-              and len(key_insights) >= DEEP_DIVE_MIN_INSIGHTS
-              and tier != "deep_dive"):
-            tier = "deep_dive"
-            reason = f" [Calibrated: {item.word_count:,} words, {len(key_insights)} insights]"
+        wc = item.word_count
 
         # --- Demote to summary_sufficient ---
-        # Very short content can't have much depth (even if LLM says "evergreen")
-        elif (item.word_count <= SUMMARY_SUFFICIENT_MAX_WORDS
-              and tier != "summary_sufficient"):
-            tier = "summary_sufficient"
-            reason = f" [Calibrated: only {item.word_count} words]"
+        # Very short content can't have much depth (even if LLM says "evergreen").
+        # Checked first: it's the common case for newsletters, and a short
+        # item can never qualify for any promotion below.
+        if wc <= SUMMARY_SUFFICIENT_MAX_WORDS:
+            if tier != "summary_sufficient":
+                return "summary_sufficient", f" [Calibrated: only {wc} words]"
+            return tier, ""
+
+        # --- Promote to deep_dive ---
+        if tier != "deep_dive" and wc >= DEEP_DIVE_MIN_WORDS:
+            # Very long content (15K+) is almost certainly deep enough to warrant the original
+            if wc >= DEEP_DIVE_LONG_FORM:
+                return "deep_dive", f" [Calibrated: {wc:,}-word long-form]"
+            # Long-form content from quality sources is almost always worth a deep dive
+            if item.source_id in DEEP_SOURCES:
+                return "deep_dive", f" [Calibrated: {wc:,} words from {item.source_id}]"
+            # Long-form interviews are worth the original
+            if content_type == "interview":
+                return "deep_dive", f" [Calibrated: {wc:,}-word interview]"
+            # Long content (8K+) with many insights should be deep_dive
+            if len(key_insights) >= DEEP_DIVE_MIN_INSIGHTS:
+                return "deep_dive", f" [Calibrated: {wc:,} words, {len(key_insights)} insights]"
 
         # Stale content that's not evergreen should be summary_sufficient at best
-        elif freshness == "stale" and tier == "deep_dive":
-            tier = "worth_a_look"
-            reason = " [Calibrated: stale content demoted]"
+        if freshness == "stale" and tier == "deep_dive":
+            return "worth_a_look", " [Calibrated: stale content demoted]"
 
-        return tier, reason
+        return tier, ""
 
-    def _parse_response(self, item: ContentItem, data: dict) -> Optional[ProcessedContent]:
+    def _parse_response(
+        self, item: ContentItem, data: dict, now: Optional[datetime] = None
+    ) -> Optional[ProcessedContent]:
         """
         Parse and validate the LLM response into a ProcessedContent object.
 
         Args:
             item: The original ContentItem
             data: Parsed JSON from the LLM
+            now: Timestamp for processed_at and the backlog cutoff
+                (defaults to the current time)
 
         Returns:
             ProcessedContent if valid, None if parsing fails
@@ -379,7 +645,9 @@ class Summarizer:
                 tier_rationale += calibration_note
 
             # Determine if this is backlog content
-            days_old = (datetime.now() - item.published_at).days
+            if now is None:
+                now = datetime.now()
+            days_old = (now - item.published_at).days
             is_backlog = days_old > 14  # More than 2 weeks old = backlog
 
             return ProcessedContent(
@@ -393,7 +661,7 @@ class Summarizer:
                 freshness=freshness,
                 tier=tier,
                 tier_rationale=tier_rationale,
-                processed_at=datetime.now(),
+                processed_at=now,
                 prompt_version=PROMPT_VERSION,
                 model_used=self.client.model_name,
                 is_backlog=is_backlog,
@@ -9,9 +9,11 @@ All data operations go through this module.
 
 import sqlite3
 import json
+import zlib
+from contextlib import contextmanager
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import os
 
 from .models import (
@@ -23,6 +25,60 @@ from .models import (
     BacklogProgress
 )
 
+# The list columns (key_insights, concepts_explained, domains, item_ids) are
+# JSON text, encoded on every write and decoded on every read. orjson does
+# both several times faster; fall back to stdlib json.
+try:
+    import orjson
+
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value).decode()
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+def _pack_transcript(transcript: Optional[str]):
+    """
+    Compress a transcript for storage.
+    
+    Transcripts are by far the largest column (often 50-100 KB of prose)
+    and compress 3-4x with zlib, which keeps the database file — and the
+    pages every content_items scan reads — small. Empty values are stored
+    as-is so the SQL "no transcript" checks still see them.
+    """
+    if not transcript:
+        return transcript
+    return zlib.compress(transcript.encode("utf-8"))
+
+
+def _unpack_transcript(value) -> Optional[str]:
+    """Inverse of _pack_transcript; rows written before compression are plain text."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+# Stay under SQLite's default limit of 999 bound parameters per statement
+_MAX_QUERY_PARAMS = 900
+
+# Column list and placeholders shared by the single and bulk inserts
+_CONTENT_COLUMNS = """
+    (id, source_id, source_name, content_type, title, url, 
+     published_at, fetched_at, duration_seconds, transcript, word_count, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_PROCESSED_INSERT = """
+    INSERT OR REPLACE INTO processed_content
+    (content_id, core_summary, key_insights, concepts_explained, so_what,
+     domains, content_category, freshness, tier, tier_rationale,
+     processed_at, prompt_version, model_used, is_backlog, delivered, delivered_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class Database:
     """
@@ -44,9 +100,29 @@ class Database:
         
         self.conn = sqlite3.connect(str(self.db_path))
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        self._transaction_depth = 0
         
+        self._configure_connection()
         self._create_tables()
     
+    def _configure_connection(self):
+        """
+        Tune SQLite for many small commits.
+
+        WAL with synchronous=NORMAL replaces the rollback journal's fsyncs on
+        every commit with an append to the log (still crash-safe; only the
+        last transactions can be lost on power failure), and lets readers
+        run alongside a writer. In-memory databases have no journal to tune.
+        """
+        if str(self.db_path) != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+            self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+        self.conn.execute("PRAGMA foreign_keys=ON")
+    
     def _create_tables(self):
         """Create all tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -63,7 +139,7 @@ class Database:
                 published_at TEXT NOT NULL,
                 fetched_at TEXT NOT NULL,
                 duration_seconds INTEGER,
-                transcript TEXT,
+                transcript BLOB,           -- zlib-compressed; older rows may be plain TEXT
                 word_count INTEGER DEFAULT 0,
                 status TEXT DEFAULT 'pending'
             )
@@ -137,48 +213,128 @@ class Database:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_content_published ON content_items(published_at)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_delivered ON processed_content(delivered)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_tier ON processed_content(tier)")
+        # Composition queries: the undelivered fresh/backlog filters, and a
+        # covering index so the join reads published_at and source_id
+        # without touching the transcript-heavy content rows
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_processed_undelivered
+            ON processed_content(is_backlog, freshness, tier) WHERE delivered = 0
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_content_id_published
+            ON content_items(id, published_at, source_id)
+        """)
         
-        self.conn.commit()
+        self._commit()
     
     def close(self):
-        """Close database connection."""
+        """
+        Close database connection.
+        
+        Runs PRAGMA optimize first, which refreshes planner statistics only
+        for tables whose queries would benefit, so it's cheap to do on
+        every close.
+        """
+        self.conn.execute("PRAGMA optimize")
         self.conn.close()
     
+    def maintenance(self, full: bool = False):
+        """
+        Refresh planner statistics, and with full=True also rebuild the file.
+        
+        ANALYZE is quick at this size. VACUUM rewrites the whole database to
+        drop free pages and defragment it, so it's meant for occasional use.
+        """
+        self.conn.commit()
+        self.conn.execute("ANALYZE")
+        if full:
+            self.conn.execute("VACUUM")
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into one transaction (and one commit).
+        
+        Write methods called inside the block skip their own commit; the
+        whole block commits on exit, or rolls back if it raises. Nested
+        blocks join the outermost one.
+        
+        Usage:
+            with db.transaction():
+                db.save_processed(processed)
+                db.update_content_status(processed.content_id, "processed")
+        """
+        if self._transaction_depth == 0:
+            if self.conn.in_transaction:
+                self.conn.commit()
+            self.conn.execute("BEGIN")
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self.conn.commit()
+    
+    def _commit(self):
+        """Commit, unless inside a transaction() block (which commits on exit)."""
+        if self._transaction_depth == 0:
+            self.conn.commit()
+    
     # =========================================
     # CONTENT ITEMS
     # =========================================
     
+    @staticmethod
+    def _content_row(item: ContentItem) -> tuple:
+        """Column values for a content_items insert."""
+        return (
+            item.id,
+            item.source_id,
+            item.source_name,
+            item.content_type,
+            item.title,
+            item.url,
+            item.published_at.isoformat(),
+            item.fetched_at.isoformat(),
+            item.duration_seconds,
+            _pack_transcript(item.transcript),
+            item.word_count,
+            item.status,
+        )
+    
     def save_content(self, item: ContentItem) -> bool:
         """
         Save a content item. Returns True if inserted, False if already exists.
         """
         cursor = self.conn.cursor()
         try:
-            cursor.execute("""
-                INSERT INTO content_items 
-                (id, source_id, source_name, content_type, title, url, 
-                 published_at, fetched_at, duration_seconds, transcript, word_count, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                item.id,
-                item.source_id,
-                item.source_name,
-                item.content_type,
-                item.title,
-                item.url,
-                item.published_at.isoformat(),
-                item.fetched_at.isoformat(),
-                item.duration_seconds,
-                item.transcript,
-                item.word_count,
-                item.status,
-            ))
-            self.conn.commit()
+            cursor.execute("INSERT INTO content_items" + _CONTENT_COLUMNS, self._content_row(item))
+            self._commit()
             return True
         except sqlite3.IntegrityError:
             # Already exists (duplicate URL)
             return False
     
+    def save_content_many(self, items: list[ContentItem]) -> int:
+        """
+        Save many content items in one transaction, skipping ones that already exist.
+        
+        Returns:
+            Number of items inserted
+        """
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "INSERT OR IGNORE INTO content_items" + _CONTENT_COLUMNS,
+            (self._content_row(item) for item in items),
+        )
+        self._commit()
+        return max(cursor.rowcount, 0)
+    
     def update_content_status(self, content_id: str, status: str, transcript: str = None):
         """Update the status (and optionally transcript) of a content item."""
         cursor = self.conn.cursor()
@@ -187,12 +343,59 @@ class Database:
                 UPDATE content_items 
                 SET status = ?, transcript = ?, word_count = ?
                 WHERE id = ?
-            """, (status, transcript, len(transcript.split()) if transcript else 0, content_id))
+            """, (status, _pack_transcript(transcript), len(transcript.split()) if transcript else 0, content_id))
         else:
             cursor.execute("""
                 UPDATE content_items SET status = ? WHERE id = ?
             """, (status, content_id))
-        self.conn.commit()
+        self._commit()
+    
+    def bulk_update_status(self, content_ids: list[str], status: str):
+        """Set the same status on many content items in one transaction."""
+        if not content_ids:
+            return
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "UPDATE content_items SET status = ? WHERE id = ?",
+            [(status, content_id) for content_id in content_ids],
+        )
+        self._commit()
+    
+    def skip_unprocessable_pending(self, min_word_count: int, limit: int = None) -> dict:
+        """
+        Mark pending items that can't be summarized, without loading them.
+        
+        Items with no transcript become 'no_transcript'; the rest under
+        min_word_count become 'skipped'. With a limit, only the newest
+        `limit` pending items (the window get_pending_content would load)
+        are considered.
+        
+        Returns:
+            Dict of status → number of items moved to it
+        """
+        window = """
+            id IN (SELECT id FROM content_items WHERE status = 'pending'
+                   ORDER BY published_at DESC LIMIT ?)
+        """
+        empty = "(transcript IS NULL OR transcript = '')"
+        params = (min_word_count, limit if limit else -1)
+        cursor = self.conn.cursor()
+        # Count before updating: the UPDATE moves rows out of 'pending',
+        # which would shift the window for a second statement
+        cursor.execute(f"""
+            SELECT COALESCE(SUM({empty}), 0),
+                   COALESCE(SUM(NOT {empty} AND word_count < ?), 0)
+            FROM content_items WHERE {window}
+        """, params)
+        no_transcript, skipped = cursor.fetchone()
+        if no_transcript or skipped:
+            cursor.execute(f"""
+                UPDATE content_items
+                SET status = CASE WHEN {empty} THEN 'no_transcript' ELSE 'skipped' END
+                WHERE ({empty} OR word_count < ?) AND {window}
+            """, params)
+            self._commit()
+        return {"no_transcript": no_transcript, "skipped": skipped}
     
     def get_content(self, content_id: str) -> Optional[ContentItem]:
         """Get a content item by ID."""
@@ -212,14 +415,52 @@ class Database:
             return self._row_to_content_item(row)
         return None
     
-    def get_pending_content(self, limit: int = None) -> list[ContentItem]:
-        """Get all content items with status='pending'."""
+    def content_url_exists(self, url: str) -> bool:
+        """
+        Whether a content item with this URL is already stored.
+        
+        Answered from the UNIQUE index on url alone, without reading the row.
+        """
         cursor = self.conn.cursor()
-        query = "SELECT * FROM content_items WHERE status = 'pending' ORDER BY published_at DESC"
-        if limit:
-            query += f" LIMIT {limit}"
-        cursor.execute(query)
-        return [self._row_to_content_item(row) for row in cursor.fetchall()]
+        cursor.execute("SELECT 1 FROM content_items WHERE url = ?", (url,))
+        return cursor.fetchone() is not None
+    
+    def get_pending_content(self, limit: int = None, min_word_count: int = None) -> list[ContentItem]:
+        """
+        Get content items with status='pending'.
+        
+        With min_word_count, only items that have a transcript of at least
+        that many words are returned.
+        """
+        return list(self.iter_pending_content(limit=limit, min_word_count=min_word_count))
+    
+    def iter_pending_content(
+        self, limit: int = None, min_word_count: int = None, batch_size: int = 500
+    ) -> Iterator[ContentItem]:
+        """
+        Like get_pending_content, but yields items as rows are fetched.
+        
+        Rows come out of SQLite batch_size at a time, so a caller that
+        filters as it goes never holds every pending transcript at once.
+        """
+        cursor = self.conn.cursor()
+        cursor.arraysize = batch_size
+        query = "SELECT * FROM content_items WHERE status = 'pending'"
+        params = []
+        if min_word_count is not None:
+            query += " AND transcript IS NOT NULL AND transcript != '' AND word_count >= ?"
+            params.append(min_word_count)
+        # A negative LIMIT means no limit, so the statement text doesn't
+        # depend on the limit value
+        query += " ORDER BY published_at DESC LIMIT ?"
+        params.append(limit if limit else -1)
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield self._row_to_content_item(row)
     
     def get_content_by_source(self, source_id: str, since: date = None) -> list[ContentItem]:
         """Get all content items from a specific source."""
@@ -236,6 +477,32 @@ class Database:
             """, (source_id,))
         return [self._row_to_content_item(row) for row in cursor.fetchall()]
     
+    def get_content_rows(
+        self, status: str = None, source_id: str = None, limit: int = None
+    ) -> list[sqlite3.Row]:
+        """
+        Get lightweight listing rows for content items, newest first.
+        
+        Selects only id, source_id, title, status and published_at, so
+        listings don't copy every transcript out of SQLite or build a
+        ContentItem per row.
+        """
+        cursor = self.conn.cursor()
+        query = "SELECT id, source_id, title, status, published_at FROM content_items"
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if source_id:
+            conditions.append("source_id = ?")
+            params.append(source_id)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY published_at DESC LIMIT ?"
+        params.append(limit if limit else -1)
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    
     def count_content_by_status(self) -> dict:
         """Get count of content items by status."""
         cursor = self.conn.cursor()
@@ -258,7 +525,7 @@ class Database:
             published_at=datetime.fromisoformat(row["published_at"]),
             fetched_at=datetime.fromisoformat(row["fetched_at"]),
             duration_seconds=row["duration_seconds"],
-            transcript=row["transcript"],
+            transcript=_unpack_transcript(row["transcript"]),
             word_count=row["word_count"] or 0,
             status=row["status"],
         )
@@ -267,22 +534,16 @@ class Database:
     # PROCESSED CONTENT
     # =========================================
     
-    def save_processed(self, processed: ProcessedContent):
-        """Save processed content."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO processed_content
-            (content_id, core_summary, key_insights, concepts_explained, so_what,
-             domains, content_category, freshness, tier, tier_rationale,
-             processed_at, prompt_version, model_used, is_backlog, delivered, delivered_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    @staticmethod
+    def _processed_row(processed: ProcessedContent) -> tuple:
+        """Column values for a processed_content insert."""
+        return (
             processed.content_id,
             processed.core_summary,
-            json.dumps(processed.key_insights),
-            json.dumps([{"term": c.term, "explanation": c.explanation} for c in processed.concepts_explained]),
+            _json_dumps(processed.key_insights),
+            _json_dumps([c.to_dict() for c in processed.concepts_explained]),
             processed.so_what,
-            json.dumps(processed.domains),
+            _json_dumps(processed.domains),
             processed.content_category,
             processed.freshness,
             processed.tier,
@@ -293,8 +554,19 @@ class Database:
             1 if processed.is_backlog else 0,
             1 if processed.delivered else 0,
             processed.delivered_at.isoformat() if processed.delivered_at else None,
-        ))
-        self.conn.commit()
+        )
+    
+    def save_processed(self, processed: ProcessedContent):
+        """Save processed content."""
+        cursor = self.conn.cursor()
+        cursor.execute(_PROCESSED_INSERT, self._processed_row(processed))
+        self._commit()
+    
+    def save_processed_many(self, processed_items: list[ProcessedContent]):
+        """Save many processed content rows in one transaction."""
+        cursor = self.conn.cursor()
+        cursor.executemany(_PROCESSED_INSERT, (self._processed_row(p) for p in processed_items))
+        self._commit()
     
     def get_processed(self, content_id: str) -> Optional[ProcessedContent]:
         """Get processed content by content_id."""
@@ -355,18 +627,20 @@ class Database:
         if delivered_at is None:
             delivered_at = datetime.now()
         
+        # One fixed statement per ID rather than an IN list sized to the
+        # call, so it's prepared once and has no bound-parameter limit
         cursor = self.conn.cursor()
-        placeholders = ",".join("?" * len(content_ids))
-        cursor.execute(f"""
+        delivered_at = delivered_at.isoformat()
+        cursor.executemany("""
             UPDATE processed_content 
             SET delivered = 1, delivered_at = ?
-            WHERE content_id IN ({placeholders})
-        """, [delivered_at.isoformat()] + content_ids)
-        self.conn.commit()
+            WHERE content_id = ?
+        """, [(delivered_at, content_id) for content_id in content_ids])
+        self._commit()
     
     def _row_to_processed(self, row) -> ProcessedContent:
         """Convert a database row to ProcessedContent."""
-        concepts_data = json.loads(row["concepts_explained"]) if row["concepts_explained"] else []
+        concepts_data = _json_loads(row["concepts_explained"]) if row["concepts_explained"] else []
         concepts = [ConceptExplanation(term=c["term"], explanation=c["explanation"]) for c in concepts_data]
 
         # source_id is available when we JOIN with content_items
@@ -380,10 +654,10 @@ class Database:
             content_id=row["content_id"],
             source_id=source_id,
             core_summary=row["core_summary"],
-            key_insights=json.loads(row["key_insights"]) if row["key_insights"] else [],
+            key_insights=_json_loads(row["key_insights"]) if row["key_insights"] else [],
             concepts_explained=concepts,
             so_what=row["so_what"] or "",
-            domains=json.loads(row["domains"]) if row["domains"] else [],
+            domains=_json_loads(row["domains"]) if row["domains"] else [],
             content_category=row["content_category"] or "",
             freshness=row["freshness"] or "fresh",
             tier=row["tier"] or "summary_sufficient",
@@ -415,11 +689,11 @@ class Database:
             briefing.fresh_count,
             briefing.backlog_count,
             briefing.total_count,
-            json.dumps(briefing.item_ids),
+            _json_dumps(briefing.item_ids),
             1 if briefing.email_sent else 0,
             briefing.email_sent_at.isoformat() if briefing.email_sent_at else None,
         ))
-        self.conn.commit()
+        self._commit()
     
     def get_briefing(self, briefing_date: date) -> Optional[DailyBriefing]:
         """Get briefing for a specific date."""
@@ -442,7 +716,7 @@ class Database:
             fresh_count=row["fresh_count"],
             backlog_count=row["backlog_count"],
             total_count=row["total_count"],
-            item_ids=json.loads(row["item_ids"]) if row["item_ids"] else [],
+            item_ids=_json_loads(row["item_ids"]) if row["item_ids"] else [],
             email_sent=bool(row["email_sent"]),
             email_sent_at=datetime.fromisoformat(row["email_sent_at"]) if row["email_sent_at"] else None,
         )
@@ -467,7 +741,7 @@ class Database:
             feedback.original_summary,
             feedback.prompt_version,
         ))
-        self.conn.commit()
+        self._commit()
     
     def get_feedback_stats(self) -> dict:
         """Get feedback statistics by reason."""
@@ -490,7 +764,7 @@ class Database:
             INSERT OR REPLACE INTO backlog_progress (id, total_items, delivered_items, last_updated)
             VALUES (1, ?, 0, ?)
         """, (total_items, datetime.now().isoformat()))
-        self.conn.commit()
+        self._commit()
     
     def update_backlog_progress(self, delivered_increment: int = 0):
         """Update backlog progress."""
@@ -500,7 +774,7 @@ class Database:
             SET delivered_items = delivered_items + ?, last_updated = ?
             WHERE id = 1
         """, (delivered_increment, datetime.now().isoformat()))
-        self.conn.commit()
+        self._commit()
     
     def get_backlog_progress(self) -> Optional[BacklogProgress]:
         """Get current backlog progress."""
@@ -540,7 +814,7 @@ class Database:
             "UPDATE processed_content SET tier = ? WHERE content_id = ?",
             (tier, content_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def update_content_duration(self, content_id: str, duration_seconds: int):
         """Update duration_seconds for a content item (backfill support)."""
@@ -549,7 +823,7 @@ class Database:
             "UPDATE content_items SET duration_seconds = ? WHERE id = ?",
             (duration_seconds, content_id),
         )
-        self.conn.commit()
+        self._commit()
 
     # =========================================
     # UTILITY
@@ -557,8 +831,32 @@ class Database:
     
     def get_full_content_with_processed(self, content_id: str) -> Optional[tuple[ContentItem, ProcessedContent]]:
         """Get both content item and its processed data."""
-        content = self.get_content(content_id)
-        if not content:
-            return None
-        processed = self.get_processed(content_id)
-        return (content, processed) if processed else None
+        return self.get_full_content_with_processed_many([content_id]).get(content_id)
+    
+    def get_full_content_with_processed_many(
+        self, content_ids: list[str]
+    ) -> dict[str, tuple[ContentItem, ProcessedContent]]:
+        """
+        Get content items and their processed data for many IDs at once.
+        
+        One JOIN query per chunk of IDs instead of two lookups per ID. The
+        two tables share no column names, so the joined row feeds both
+        row converters directly.
+        
+        Returns:
+            Dict of content_id → (ContentItem, ProcessedContent); IDs with no
+            processed row (or no content row) are left out.
+        """
+        cursor = self.conn.cursor()
+        results = {}
+        for start in range(0, len(content_ids), _MAX_QUERY_PARAMS):
+            chunk = content_ids[start:start + _MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT c.*, p.* FROM content_items c
+                JOIN processed_content p ON p.content_id = c.id
+                WHERE c.id IN ({placeholders})
+            """, chunk)
+            for row in cursor.fetchall():
+                results[row["id"]] = (self._row_to_content_item(row), self._row_to_processed(row))
+        return results
@@ -8,10 +8,9 @@ They're used both for in-memory operations and as the schema reference for SQLit
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Optional
 import hashlib
-import json
 
 
 @dataclass
@@ -64,6 +63,22 @@ class ConceptExplanation:
     """A technical concept with its accessible explanation."""
     term: str
     explanation: str
+    
+    def to_dict(self) -> dict:
+        return {"term": self.term, "explanation": self.explanation}
+
+
+# Tier display and sort order, built once rather than on every property access
+_TIER_EMOJI = {
+    "deep_dive": "🔴",
+    "worth_a_look": "🟡",
+    "summary_sufficient": "🟢",
+}
+_TIER_PRIORITY = {
+    "deep_dive": 1,
+    "worth_a_look": 2,
+    "summary_sufficient": 3,
+}
 
 
 @dataclass
@@ -107,20 +122,12 @@ class ProcessedContent:
     @property
     def tier_emoji(self) -> str:
         """Get emoji for the tier."""
-        return {
-            "deep_dive": "🔴",
-            "worth_a_look": "🟡",
-            "summary_sufficient": "🟢"
-        }.get(self.tier, "⚪")
+        return _TIER_EMOJI.get(self.tier, "⚪")
     
     @property
     def tier_priority(self) -> int:
         """Get numeric priority for sorting (lower = higher priority)."""
-        return {
-            "deep_dive": 1,
-            "worth_a_look": 2,
-            "summary_sufficient": 3
-        }.get(self.tier, 99)
+        return _TIER_PRIORITY.get(self.tier, 99)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -128,10 +135,7 @@ class ProcessedContent:
             "content_id": self.content_id,
             "core_summary": self.core_summary,
             "key_insights": self.key_insights,
-            "concepts_explained": [
-                {"term": c.term, "explanation": c.explanation}
-                for c in self.concepts_explained
-            ],
+            "concepts_explained": [c.to_dict() for c in self.concepts_explained],
             "so_what": self.so_what,
             "domains": self.domains,
             "content_category": self.content_category,
@@ -239,7 +243,6 @@ class BacklogProgress:
         if self.items_remaining <= 0:
             return date.today()
         days_remaining = int(self.items_remaining / daily_rate)
-        from datetime import timedelta
         return date.today() + timedelta(days=days_remaining)
 
 
@@ -266,7 +269,7 @@ class Source:
             name=data["name"],
             source_type=data["type"],
             url=data.get("channel_url") or data.get("feed_url", ""),
-            fetch_since=datetime.strptime(data["fetch_since"], "%Y-%m-%d").date(),
+            fetch_since=date.fromisoformat(data["fetch_since"]),
             active=data.get("active", True),
             notes=data.get("notes", ""),
             primary_domains=data.get("primary_domains", []),
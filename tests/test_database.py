@@ -0,0 +1,252 @@
+"""
+Tests for the SQLite storage layer.
+
+Each test works against a fresh database file under tmp_path.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from src.storage.database import Database
+from src.storage.models import ContentItem, ProcessedContent
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "briefing.db"))
+    yield database
+    database.close()
+
+
+def _item(name: str) -> ContentItem:
+    url = f"https://example.com/{name}"
+    return ContentItem(
+        id=ContentItem.generate_id("test-source", url),
+        source_id="test-source",
+        source_name="Test Source",
+        content_type="article",
+        title=f"Title {name}",
+        url=url,
+        published_at=datetime(2026, 3, 1),
+        fetched_at=datetime(2026, 3, 2),
+        transcript=f"transcript for {name}",
+        word_count=3,
+    )
+
+
+def _processed(item: ContentItem, summary: str = "A summary") -> ProcessedContent:
+    return ProcessedContent(
+        content_id=item.id,
+        core_summary=summary,
+        key_insights=["one"],
+        domains=["ai"],
+        processed_at=datetime(2026, 3, 3),
+    )
+
+
+def _pragma(db: Database, name: str):
+    return db.conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+# ── Connection setup ──────────────────────────────────────────────────────────
+
+
+def test_file_database_uses_wal_and_tuned_pragmas(db):
+    assert _pragma(db, "journal_mode") == "wal"
+    assert _pragma(db, "synchronous") == 1  # NORMAL
+    assert _pragma(db, "temp_store") == 2  # MEMORY
+    assert _pragma(db, "cache_size") == -20000
+    assert _pragma(db, "foreign_keys") == 1
+
+
+def test_in_memory_database_skips_journal_pragmas():
+    db = Database(":memory:")
+    assert _pragma(db, "journal_mode") == "memory"
+    assert _pragma(db, "foreign_keys") == 1
+    db.close()
+
+
+def test_close_folds_the_wal_back_into_the_database_file(tmp_path):
+    path = tmp_path / "briefing.db"
+    db = Database(str(path))
+    db.save_content(_item("alpha"))
+    assert (tmp_path / "briefing.db-wal").exists()
+
+    db.close()
+
+    assert not (tmp_path / "briefing.db-wal").exists()
+    reopened = Database(str(path))
+    assert [item.title for item in reopened.get_pending_content()] == ["Title alpha"]
+    reopened.close()
+
+
+def test_maintenance_analyzes_and_vacuums(db):
+    db.save_content_many([_item(name) for name in ("alpha", "beta")])
+
+    db.maintenance(full=True)
+
+    assert db.conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+    assert len(db.get_pending_content()) == 2
+
+
+# ── Transactions and bulk writes ──────────────────────────────────────────────
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(db):
+    alpha, beta = _item("alpha"), _item("beta")
+    db.save_content(alpha)
+
+    with db.transaction():
+        db.save_processed(_processed(alpha))
+        with db.transaction():
+            db.update_content_status(alpha.id, "processed")
+        assert db.conn.in_transaction
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.save_content(beta)
+            raise RuntimeError("boom")
+
+    assert db.get_content(alpha.id).status == "processed"
+    assert db.get_processed(alpha.id).core_summary == "A summary"
+    assert db.get_content(beta.id) is None
+
+
+def test_bulk_saves_skip_existing_content_and_replace_processed(db):
+    items = [_item("alpha"), _item("beta"), _item("gamma")]
+    db.save_content(items[0])
+
+    assert db.save_content_many(items) == 2
+    assert db.save_content_many(items) == 0
+
+    db.save_processed_many([_processed(item, "old") for item in items])
+    db.save_processed_many([_processed(items[1], "new")])
+
+    assert [db.get_processed(item.id).core_summary for item in items] == ["old", "new", "old"]
+
+
+# ── Transcript storage ────────────────────────────────────────────────────────
+
+
+def test_transcripts_are_stored_compressed_and_read_back(db):
+    item = _item("alpha")
+    item.transcript = "word " * 5000
+    db.save_content(item)
+
+    stored = db.conn.execute("SELECT transcript FROM content_items WHERE id = ?", (item.id,)).fetchone()[0]
+
+    assert isinstance(stored, bytes) and len(stored) < len(item.transcript) // 10
+    assert db.get_content(item.id).transcript == item.transcript
+    db.update_content_status(item.id, "pending", "fresh text")
+    assert db.get_content(item.id).transcript == "fresh text"
+
+
+def test_plain_text_transcripts_from_older_rows_still_read(db):
+    item = _item("alpha")
+    db.save_content(item)
+    db.conn.execute("UPDATE content_items SET transcript = ? WHERE id = ?", ("legacy text", item.id))
+
+    assert db.get_content(item.id).transcript == "legacy text"
+    assert [i.id for i in db.get_pending_content(min_word_count=1)] == [item.id]
+
+
+# ── Joined lookups ────────────────────────────────────────────────────────────
+
+
+def test_full_content_lookup_joins_processed_rows_in_chunks(db, monkeypatch):
+    from src.storage import database
+
+    monkeypatch.setattr(database, "_MAX_QUERY_PARAMS", 2)
+    items = [_item(name) for name in ("alpha", "beta", "gamma", "delta")]
+    db.save_content_many(items)
+    db.save_processed_many([_processed(item, item.title) for item in items[:3]])
+
+    found = db.get_full_content_with_processed_many([item.id for item in items] + ["missing"])
+
+    assert sorted(found) == sorted(item.id for item in items[:3])
+    content, processed = found[items[2].id]
+    assert content.url == items[2].url
+    assert processed.core_summary == "Title gamma"
+    assert processed.source_id == "test-source"
+    assert db.get_full_content_with_processed(items[0].id)[1].core_summary == "Title alpha"
+    assert db.get_full_content_with_processed(items[3].id) is None
+
+
+# ── Pending and delivery queries ──────────────────────────────────────────────
+
+
+def test_pending_limit_is_a_bound_parameter(db):
+    db.save_content_many([_item(name) for name in ("alpha", "beta", "gamma")])
+
+    assert len(db.get_pending_content()) == 3
+    assert len(db.get_pending_content(limit=2)) == 2
+    assert len(db.get_pending_content(limit=2, min_word_count=3)) == 2
+    assert db.get_pending_content(min_word_count=4) == []
+
+
+def test_skip_unprocessable_pending_only_touches_the_limit_window(db):
+    items = [_item(name) for name in ("empty", "short", "alpha", "old-empty", "old-short")]
+    items[0].transcript = items[3].transcript = None
+    items[1].word_count = items[4].word_count = 1
+    for day, item in zip((5, 4, 3, 2, 1), items):
+        item.published_at = datetime(2026, 3, day)
+    db.save_content_many(items)
+
+    assert db.skip_unprocessable_pending(min_word_count=3, limit=3) == {"no_transcript": 1, "skipped": 1}
+    assert [i.status for i in map(db.get_content, (item.id for item in items))] == [
+        "no_transcript", "skipped", "pending", "pending", "pending",
+    ]
+    assert db.skip_unprocessable_pending(min_word_count=3) == {"no_transcript": 1, "skipped": 1}
+    assert [item.id for item in db.get_pending_content()] == [items[2].id]
+
+
+def test_iter_pending_content_streams_in_batches(db):
+    items = [_item(name) for name in ("alpha", "beta", "gamma")]
+    db.save_content_many(items)
+
+    streamed = db.iter_pending_content(batch_size=2)
+
+    assert next(streamed).id in {item.id for item in items}
+    assert [item.id for item in db.iter_pending_content(batch_size=2)] == [
+        item.id for item in db.get_pending_content()
+    ]
+
+
+def test_mark_delivered_updates_every_id(db):
+    items = [_item(name) for name in ("alpha", "beta", "gamma")]
+    db.save_content_many(items)
+    db.save_processed_many([_processed(item) for item in items])
+
+    db.mark_delivered([items[0].id, items[2].id], delivered_at=datetime(2026, 3, 4))
+
+    delivered = [db.get_processed(item.id) for item in items]
+    assert [p.delivered for p in delivered] == [True, False, True]
+    assert delivered[0].delivered_at == datetime(2026, 3, 4)
+
+
+def test_content_url_exists(db):
+    item = _item("alpha")
+    db.save_content(item)
+
+    assert db.content_url_exists(item.url)
+    assert not db.content_url_exists("https://example.com/missing")
+
+
+def test_content_rows_select_listing_columns_with_filters(db):
+    items = [_item(name) for name in ("alpha", "beta", "gamma")]
+    items[2].source_id = "other-source"
+    db.save_content_many(items)
+    db.update_content_status(items[0].id, "processed")
+
+    rows = db.get_content_rows(status="pending")
+
+    assert sorted(row["title"] for row in rows) == ["Title beta", "Title gamma"]
+    assert "transcript" not in rows[0].keys()
+    assert [row["id"] for row in db.get_content_rows(status="pending", source_id="test-source")] == [items[1].id]
+    assert len(db.get_content_rows(limit=2)) == 2
+
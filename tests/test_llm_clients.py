@@ -0,0 +1,571 @@
+"""
+Tests for the LLM client wrappers (Gemini, OpenAI, and the fallback LLMClient).
+
+The provider SDK calls are replaced with fakes so no API keys or network
+access are needed.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.processors.gemini_client import GeminiClient, LLMTimeoutError
+from src.processors.http_client import get_shared_http_client
+from src.processors.llm_client import LLMClient
+from src.processors.openai_client import AsyncOpenAIClient, OpenAIClient
+from src.processors import gemini_client, openai_client, tokens
+from src.processors.backoff import retry_after_seconds
+from src.processors import response_parsing
+from src.processors.response_parsing import JsonStreamBuffer, strip_json_fence
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+def _chunks(text: str, size: int = 5):
+    """Stream text as generate_content_stream chunks."""
+    return iter([SimpleNamespace(text=text[i:i + size]) for i in range(0, len(text), size)])
+
+
+class _FakeModels:
+    """Stand-in for genai.Client().models that streams canned response texts."""
+
+    def __init__(self, texts):
+        self.texts = list(texts)
+        self.calls = 0
+
+    def generate_content_stream(self, model, contents, config=None):
+        self.calls += 1
+        return _chunks(self.texts.pop(0))
+
+
+@pytest.fixture
+def gemini(monkeypatch) -> GeminiClient:
+    monkeypatch.delenv("LLM_CACHE_PATH", raising=False)
+    return GeminiClient(api_key="test-key")
+
+
+# ── Response parsing ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ('{"a": 1}', '{"a": 1}'),
+    ('  {"a": 1}\n', '{"a": 1}'),
+    ('```json\n{"a": 1}\n```', '{"a": 1}'),
+    ('```\n{"a": 1}\n```  ', '{"a": 1}'),
+    ('```json\n{"a": "x"}', '{"a": "x"}'),
+])
+def test_strip_json_fence(raw, expected):
+    assert strip_json_fence(raw) == expected
+
+
+# ── Token budgets ─────────────────────────────────────────────────────────────
+
+
+def test_truncate_to_tokens_fits_budget_without_tiktoken(monkeypatch):
+    monkeypatch.setattr(tokens, "_encoding", lambda name="o200k_base": None)
+    text = "One sentence here. " * 100
+
+    assert tokens.truncate_to_tokens(text, 10_000) == text
+    truncated = tokens.truncate_to_tokens(text, 100)
+    assert truncated.endswith(tokens.TRUNCATION_NOTICE)
+    assert tokens.count_tokens(truncated[:-len(tokens.TRUNCATION_NOTICE)]) <= 100
+    assert truncated[:-len(tokens.TRUNCATION_NOTICE)].endswith(".")
+
+
+@pytest.mark.parametrize("text, max_tokens, expected", [
+    ("a" * 100, 100, True),
+    ("a" * 101, 100, False),
+    ("é" * 25, 100, True),
+    ("é" * 26, 100, False),
+])
+def test_fits_without_counting(text, max_tokens, expected):
+    assert tokens.fits_without_counting(text, max_tokens) is expected
+
+
+def test_gemini_truncation_trusts_api_count_when_it_fits(gemini, monkeypatch):
+    counted = []
+
+    def count_tokens(model, contents):
+        counted.append(contents)
+        return SimpleNamespace(total_tokens=50)
+
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=SimpleNamespace(count_tokens=count_tokens)))
+    short = "word " * 10
+    long = "word " * 400
+
+    assert gemini.truncate_for_context(short, max_tokens=100) == short
+    assert gemini.truncate_for_context(long, max_tokens=100) == long
+    assert counted == [long]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 100])
+def test_json_stream_buffer_completes_at_the_closing_brace(chunk_size):
+    body = '```json\n{"a": "x } \\" ] {", "b": [1, {"c": "\\\\"}]}\n```'
+    buffer = JsonStreamBuffer()
+    completed_after = None
+    for i in range(0, len(body), chunk_size):
+        if buffer.feed(body[i:i + chunk_size]) and completed_after is None:
+            completed_after = i + chunk_size
+
+    assert buffer.complete
+    assert completed_after >= body.rindex("}") + 1
+    assert completed_after - chunk_size <= body.rindex("}")
+
+
+@pytest.mark.parametrize("body, malformed", [
+    ('{"a": 1}', False),
+    ('  ```json\n{"a": 1}', False),
+    ('```\n[1]', False),
+    ('Here is the summary: {"a": 1}', True),
+    ('"a": 1}', True),
+    ('} {"a": 1}', True),
+])
+def test_json_stream_buffer_flags_malformed_leads(body, malformed):
+    buffer = JsonStreamBuffer()
+    for c in body:
+        if buffer.feed(c):
+            break
+
+    assert buffer.malformed is malformed
+    assert buffer.complete is not malformed
+
+
+def test_gemini_stops_reading_malformed_stream_and_retries(gemini, monkeypatch):
+    read = []
+    responses = [["Sure! ", "Here is the JSON:", ' {"a": 1}'], ['{"a": 2}']]
+
+    def stream(model, contents, config=None):
+        for piece in responses.pop(0):
+            read.append(piece)
+            yield SimpleNamespace(text=piece)
+
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=SimpleNamespace(generate_content_stream=stream)))
+    monkeypatch.setattr(gemini_client.time, "sleep", lambda s: None)
+
+    assert gemini.generate("prompt") == {"a": 2}
+    assert read == ["Sure! ", '{"a": 2}']
+
+
+def test_gemini_stops_reading_stream_after_json_closes(gemini, monkeypatch):
+    read = []
+
+    def stream(model, contents, config=None):
+        for piece in ['{"a": ', '[1, 2]}', "\n", "trailing"]:
+            read.append(piece)
+            yield SimpleNamespace(text=piece)
+
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=SimpleNamespace(generate_content_stream=stream)))
+
+    assert gemini.generate("prompt") == {"a": [1, 2]}
+    assert read == ['{"a": ', '[1, 2]}']
+
+
+def test_large_async_responses_parse_off_the_event_loop(monkeypatch):
+    offloaded = []
+
+    async def fake_to_thread(func, *args):
+        offloaded.append(len(args[0]))
+        return func(*args)
+
+    monkeypatch.setattr(response_parsing.asyncio, "to_thread", fake_to_thread)
+    small = '{"a": 1}'
+    large = '{"a": "' + "x" * 10_000 + '"}'
+
+    assert asyncio.run(response_parsing.parse_json_response_async(small))[0] == {"a": 1}
+    assert asyncio.run(response_parsing.parse_json_response_async(large))[0]["a"] == "x" * 10_000
+    assert offloaded == [len(large)]
+
+
+def test_openai_assembles_streamed_chunks(monkeypatch):
+    monkeypatch.delenv("LLM_CACHE_PATH", raising=False)
+    client = OpenAIClient(api_key="test-key")
+    closed = []
+
+    class FakeStream:
+        def __iter__(self):
+            yield SimpleNamespace(choices=[])
+            for piece in ['{"tier": ', None, '"deep_dive"}']:
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+        def close(self):
+            closed.append(True)
+
+    def create(stream=False, **kwargs):
+        assert stream is True
+        return FakeStream()
+
+    completions = SimpleNamespace(create=create)
+    monkeypatch.setattr(client, "client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+
+    assert client.generate("prompt") == {"tier": "deep_dive"}
+    assert closed == [True]
+
+
+# ── System prompts ────────────────────────────────────────────────────────────
+
+
+def test_gemini_sends_system_prompt_as_cached_system_instruction(gemini, monkeypatch):
+    configs = []
+
+    def stream(model, contents, config=None):
+        configs.append((contents, config))
+        return _chunks('{"a": 1}')
+
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=SimpleNamespace(generate_content_stream=stream)))
+
+    gemini.generate("item one", system_prompt="static rules")
+    gemini.generate("item two", system_prompt="static rules")
+    gemini.generate("plain")
+
+    assert [c for c, _ in configs] == ["item one", "item two", "plain"]
+    assert configs[0][1].system_instruction == "static rules"
+    assert configs[0][1] is configs[1][1]
+    assert configs[2][1] is gemini._gen_config
+    assert gemini._gen_config.system_instruction is None
+
+
+def test_openai_sends_system_prompt_in_the_system_turn(monkeypatch):
+    client = OpenAIClient(api_key="test-key")
+
+    messages = client._request_kwargs("item details", system_prompt="static rules")["messages"]
+
+    assert messages[0]["role"] == "system"
+    assert messages[0]["content"].endswith("\n\nstatic rules")
+    assert messages[1] == {"role": "user", "content": "item details"}
+    assert client._request_kwargs("other", system_prompt="static rules")["messages"][0] is messages[0]
+
+
+def test_response_cache_key_includes_system_prompt(gemini):
+    assert gemini._cache_key("user", "system a") != gemini._cache_key("user", "system b")
+    assert gemini._cache_key("user", "system a") != gemini._cache_key("system a user")
+
+
+def test_raised_output_budget_is_passed_through_and_capped(gemini, monkeypatch):
+    configs = []
+
+    def stream(model, contents, config=None):
+        configs.append(config)
+        return _chunks('{"a": 1}')
+
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=SimpleNamespace(generate_content_stream=stream)))
+    openai = OpenAIClient(api_key="test-key")
+
+    gemini.generate("batch", system_prompt="static rules", max_output_tokens=16_384)
+    gemini.generate("huge", max_output_tokens=10**6)
+    gemini.generate("plain", max_output_tokens=gemini.MAX_OUTPUT_TOKENS)
+
+    assert configs[0].max_output_tokens == 16_384
+    assert configs[0].system_instruction == "static rules"
+    assert configs[1].max_output_tokens == gemini.MAX_OUTPUT_TOKENS_LIMIT
+    assert configs[2] is gemini._gen_config
+    assert gemini._cache_key("p", None, 16_384) != gemini._cache_key("p")
+    assert openai._request_kwargs("p", None, openai._output_budget(10**6))["max_tokens"] == 16_384
+    assert openai._request_kwargs("p")["max_tokens"] == openai.MAX_OUTPUT_TOKENS
+
+
+# ── Response cache ────────────────────────────────────────────────────────────
+
+
+def test_response_cache_short_circuits_identical_prompts(gemini, tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    models = _FakeModels(['{"tier": "deep_dive"}'])
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=models))
+
+    assert gemini.generate("same prompt") == {"tier": "deep_dive"}
+    assert gemini.generate("same prompt") == {"tier": "deep_dive"}
+    assert models.calls == 1
+
+
+def test_response_cache_key_ignores_whitespace_but_not_prompt_version():
+    from src.processors.response_cache import ResponseCache
+
+    key = ResponseCache.make_key("gemini", "m", 0.3, 4096, "line one\r\nline  two\n")
+    assert key == ResponseCache.make_key("gemini", "m", 0.3, 4096, "line one\nline two")
+    assert key != ResponseCache.make_key("gemini", "m", 0.3, 4096, "line one\nline two", cache_salt="v0")
+    assert key != ResponseCache.make_key("gemini", "m", 0.3, 4096, "line one\nline three")
+
+
+def test_response_cache_disabled_without_env(gemini, monkeypatch):
+    models = _FakeModels(['{"a": 1}', '{"a": 2}'])
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=models))
+
+    assert gemini.generate("prompt") == {"a": 1}
+    assert gemini.generate("prompt") == {"a": 2}
+    assert models.calls == 2
+
+
+# ── Timeouts ──────────────────────────────────────────────────────────────────
+
+
+def test_gemini_client_sets_sdk_http_timeout(gemini):
+    assert gemini.client._api_client._http_options.timeout == 120_000
+
+
+def test_gemini_timeout_maps_to_llm_timeout_off_main_thread(gemini, monkeypatch):
+    class TimingOutModels:
+        def generate_content_stream(self, model, contents, config=None):
+            raise httpx.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=TimingOutModels()))
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(gemini.generate, "prompt")
+        with pytest.raises(LLMTimeoutError):
+            future.result()
+
+
+def test_streams_that_keep_trickling_hit_the_overall_deadline(gemini, monkeypatch):
+    read = []
+
+    def trickle():
+        for piece in ['{"a": ', '"b', 'c"}']:
+            read.append(piece)
+            yield piece
+
+    monkeypatch.setattr(gemini_client, "REQUEST_TIMEOUT_SECONDS", -1)
+    monkeypatch.setattr(openai_client, "REQUEST_TIMEOUT_SECONDS", -1)
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=SimpleNamespace(
+        generate_content_stream=lambda model, contents, config=None: (
+            SimpleNamespace(text=piece) for piece in trickle()
+        ),
+    )))
+    openai = OpenAIClient(api_key="test-key")
+
+    class FakeStream:
+        def __iter__(self):
+            for piece in trickle():
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+        def close(self):
+            pass
+
+    completions = SimpleNamespace(create=lambda stream=False, **kwargs: FakeStream())
+    monkeypatch.setattr(openai, "client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+
+    for client in (gemini, openai):
+        with pytest.raises(LLMTimeoutError):
+            client.generate("prompt")
+    assert read == ['{"a": ', '{"a": ']
+
+
+# ── Provider fallback ─────────────────────────────────────────────────────────
+
+
+class _FakeSyncProvider:
+    def __init__(self, name, outcome):
+        self.PROVIDER_NAME = name
+        self.outcome = outcome
+        self.calls = 0
+
+    def generate(self, prompt, max_retries=3, system_prompt=None, max_output_tokens=None):
+        self.calls += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def _sync_llm_client(primary, fallback=None) -> LLMClient:
+    client = LLMClient.__new__(LLMClient)
+    client._primary, client._fallback = primary, fallback
+    client._active_provider_name = primary.PROVIDER_NAME
+    return client
+
+
+def test_primary_timeout_falls_back_to_secondary():
+    gemini = _FakeSyncProvider("gemini", LLMTimeoutError("timed out"))
+    openai = _FakeSyncProvider("openai", {"ok": True})
+    client = _sync_llm_client(gemini, openai)
+
+    assert client.generate("prompt") == {"ok": True}
+    assert client._primary is openai
+
+
+def test_timeout_on_every_provider_is_raised_so_item_stays_pending():
+    client = _sync_llm_client(
+        _FakeSyncProvider("gemini", LLMTimeoutError("timed out")),
+        _FakeSyncProvider("openai", LLMTimeoutError("timed out")),
+    )
+
+    with pytest.raises(LLMTimeoutError):
+        client.generate("prompt")
+
+
+# ── Connection pooling ────────────────────────────────────────────────────────
+
+
+def test_providers_share_one_http_connection_pool(gemini):
+    shared = get_shared_http_client()
+    other = GeminiClient(api_key="test-key")
+    openai = OpenAIClient(api_key="test-key")
+
+    assert gemini.client._api_client._httpx_client is shared
+    assert other.client._api_client._httpx_client is shared
+    assert openai.client._client is shared
+
+
+def test_gemini_skips_the_shared_pool_on_sdks_without_httpx_client():
+    class OldHttpOptions:
+        model_fields = {"timeout": None}
+
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    options = gemini_client._http_options(SimpleNamespace(HttpOptions=OldHttpOptions))
+
+    assert options.kwargs == {"timeout": 120_000}
+
+
+def test_async_openai_client_builds_only_the_async_sdk_client(monkeypatch):
+    import openai
+
+    monkeypatch.setattr(openai, "OpenAI", lambda **kw: pytest.fail("sync client built"))
+
+    client = AsyncOpenAIClient(api_key="test-key")
+
+    assert isinstance(client.client, openai.AsyncOpenAI)
+
+
+# ── Retry backoff ─────────────────────────────────────────────────────────────
+
+
+class _ErrorWithHeaders(Exception):
+    def __init__(self, message, headers):
+        super().__init__(message)
+        self.response = SimpleNamespace(headers=headers)
+
+
+@pytest.mark.parametrize("error, expected", [
+    (_ErrorWithHeaders("429 Too Many Requests", {"retry-after": "7"}), 7.0),
+    (Exception("429 RESOURCE_EXHAUSTED ... 'retryDelay': '27s'"), 27.0),
+    (Exception("429 quota exceeded retry_delay { seconds: 13 }"), 13.0),
+    (Exception("503 Service Unavailable"), None),
+])
+def test_retry_after_seconds(error, expected):
+    assert retry_after_seconds(error) == expected
+
+
+def test_gemini_rate_limit_waits_for_server_hint(gemini, monkeypatch):
+    class RateLimitedOnce:
+        calls = 0
+
+        def generate_content_stream(self, model, contents, config=None):
+            self.calls += 1
+            if self.calls == 1:
+                raise Exception("429 RESOURCE_EXHAUSTED 'retryDelay': '4s'")
+            return _chunks('{"ok": true}')
+
+    sleeps = []
+    monkeypatch.setattr(gemini, "client", SimpleNamespace(models=RateLimitedOnce()))
+    monkeypatch.setattr(gemini_client.time, "sleep", sleeps.append)
+
+    assert gemini.generate("prompt") == {"ok": True}
+    assert len(sleeps) == 1 and 4 <= sleeps[0] <= 5
+
+
+# ── Async fan-out ─────────────────────────────────────────────────────────────
+
+
+class _FakeAsyncProvider:
+    """Async provider stand-in: echoes prompts, or fails every call."""
+
+    def __init__(self, name, fail=False):
+        self.PROVIDER_NAME = name
+        self.fail = fail
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, prompt, max_retries=3, system_prompt=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return None if self.fail else {"provider": self.PROVIDER_NAME, "prompt": prompt}
+
+
+def _llm_client(monkeypatch, primary, fallback=None) -> LLMClient:
+    client = LLMClient.__new__(LLMClient)
+    client.provider = "auto"
+    client._primary = "sync-primary"
+    client._fallback = "sync-fallback" if fallback else None
+    client._active_provider_name = primary.PROVIDER_NAME
+    client._inflight = {}
+    fakes = {"sync-primary": primary, "sync-fallback": fallback}
+    monkeypatch.setattr(LLMClient, "_make_async", staticmethod(fakes.get))
+    return client
+
+
+def test_generate_many_preserves_order_and_caps_concurrency(monkeypatch):
+    provider = _FakeAsyncProvider("gemini")
+    client = _llm_client(monkeypatch, provider)
+    prompts = [f"p{i}" for i in range(10)]
+
+    results = asyncio.run(client.generate_many(prompts, concurrency=3))
+
+    assert [r["prompt"] for r in results] == prompts
+    assert provider.max_in_flight == 3
+
+
+def test_generate_many_sends_duplicate_prompts_once(monkeypatch):
+    provider = _FakeAsyncProvider("gemini")
+    client = _llm_client(monkeypatch, provider)
+
+    results = asyncio.run(client.generate_many(["same", "other", "same", "same"]))
+
+    assert [r["prompt"] for r in results] == ["same", "other", "same", "same"]
+    assert provider.calls == 2
+    assert client._inflight == {}
+
+
+def test_generate_many_falls_back_and_switches_provider_once(monkeypatch):
+    primary = _FakeAsyncProvider("gemini", fail=True)
+    fallback = _FakeAsyncProvider("openai")
+    client = _llm_client(monkeypatch, primary, fallback)
+
+    results = asyncio.run(client.generate_many(["a", "b", "c", "d"], concurrency=1))
+
+    assert all(r["provider"] == "openai" for r in results)
+    assert primary.calls == 1
+    assert client._primary == "sync-fallback"
+    assert client._active_provider_name == "openai"
+
+
+# ── Batched prompts ───────────────────────────────────────────────────────────
+
+
+class _FakeBatchProvider:
+    """Sync provider stand-in: answers packed prompts, miscounting big batches."""
+
+    PROVIDER_NAME = "gemini"
+
+    def __init__(self, max_good_batch):
+        self.max_good_batch = max_good_batch
+        self.prompts = []
+
+    def generate(self, prompt, max_retries=3, system_prompt=None, max_output_tokens=None):
+        self.prompts.append(prompt)
+        titles = [line.split("title=")[1] for line in prompt.splitlines() if "title=" in line]
+        if len(titles) == 1 and "=== Item" not in prompt:
+            return {"title": titles[0]}
+        if len(titles) > self.max_good_batch:
+            return {"results": [{"title": titles[0]}]}
+        return {"results": [{"title": t} for t in titles]}
+
+
+def test_generate_batch_packs_items_and_bisects_bad_batches():
+    provider = _FakeBatchProvider(max_good_batch=2)
+    client = LLMClient.__new__(LLMClient)
+    client._primary, client._fallback = provider, None
+
+    items = [{"title": f"t{i}"} for i in range(5)]
+    results = client.generate_batch(items, "Summarize title={title}", batch_size=4)
+
+    assert [r["title"] for r in results] == ["t0", "t1", "t2", "t3", "t4"]
+    # [t0..t3] fails and splits into two good pairs; [t4] goes out alone
+    assert len(provider.prompts) == 4
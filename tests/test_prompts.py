@@ -0,0 +1,68 @@
+"""
+Tests for prompt construction.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from src.processors.prompts import (
+    build_batch_summarization_prompt,
+    build_editorial_intro_prompt,
+    build_summarization_prompt,
+)
+from src.storage.models import ContentItem
+
+
+def _item(title: str, transcript: str, published_at: datetime) -> ContentItem:
+    return ContentItem(
+        id=ContentItem.generate_id("test-source", title),
+        source_id="test-source",
+        source_name="Test Source",
+        content_type="article",
+        title=title,
+        url=f"https://example.com/{title}",
+        published_at=published_at,
+        fetched_at=datetime(2026, 3, 2),
+        transcript=transcript,
+        word_count=len(transcript.split()),
+    )
+
+
+def test_summarization_prompts_share_a_static_system_prompt():
+    first_system, first_user = build_summarization_prompt(_item("alpha", "first body", datetime(2026, 3, 1)))
+    second_system, second_user = build_summarization_prompt(_item("beta", "second body", datetime(2025, 1, 9)))
+
+    assert first_system == second_system
+    assert "**YOUR VOICE:**" in first_system
+    assert "first body" not in first_system
+    assert first_user.startswith("**Content Details:**")
+    assert "first body" in first_user
+    assert "**YOUR VOICE:**" not in first_user
+
+
+def test_batch_prompt_numbers_items_under_one_shared_system_prompt():
+    items = [
+        _item("alpha", "first body", datetime(2026, 3, 1)),
+        _item("beta", "second body", datetime(2025, 1, 9)),
+    ]
+    system, user = build_batch_summarization_prompt(items)
+    single_system, _ = build_summarization_prompt(items[0])
+
+    assert build_batch_summarization_prompt(items[:1])[0] == system
+    assert system.startswith(single_system[:single_system.index("Respond in this exact JSON format:")])
+    assert '"results"' in system
+    assert "**YOUR VOICE:**" not in user
+    assert user.index("**[1] Content Details:**") < user.index("first body")
+    assert user.index("first body") < user.index("**[2] Content Details:**")
+    assert user.index("**[2] Content Details:**") < user.index("second body")
+
+
+def test_editorial_intro_prompt_lists_each_item_once():
+    summaries = [
+        {"title": "Alpha", "core_summary": "x" * 200, "topic_tags": ["gpu-capex", "MSFT"]},
+        {"title": "Beta", "core_summary": "short"},
+    ]
+    prompt = build_editorial_intro_prompt(summaries)
+
+    assert f"1. [gpu-capex, MSFT] Alpha\n   {'x' * 150}\n\n2. [] Beta\n   short\n\n\nRespond" in prompt
+    assert "Today's 2 items:" in prompt
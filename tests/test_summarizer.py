@@ -0,0 +1,362 @@
+"""
+Tests for the Summarizer's orchestration paths.
+
+The database and LLM client are replaced with small in-memory fakes so these
+run offline.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.processors import summarizer
+from src.processors.summarizer import Summarizer
+from src.storage.database import Database
+from src.storage.models import ContentItem
+
+
+# ── Fakes ─────────────────────────────────────────────────────────────────────
+
+
+class _FakeDb:
+    def __init__(self, items):
+        self.items = items
+        self.statuses = {}
+        self.saved = {}
+
+    def transaction(self):
+        return contextlib.nullcontext(self)
+
+    def _pending(self):
+        return [item for item in self.items if item.id not in self.statuses]
+
+    def skip_unprocessable_pending(self, min_word_count, limit=None):
+        counts = {"no_transcript": 0, "skipped": 0}
+        pending = self._pending()
+        for item in pending[:limit] if limit else pending:
+            status = "no_transcript" if not item.transcript else "skipped"
+            if not item.transcript or item.word_count < min_word_count:
+                self.statuses[item.id] = status
+                counts[status] += 1
+        return counts
+
+    def get_pending_content(self, limit=None, min_word_count=None):
+        items = self._pending()
+        return items[:limit] if limit else items
+
+    def iter_pending_content(self, limit=None, min_word_count=None):
+        return iter(self.get_pending_content(limit, min_word_count))
+
+    def update_content_status(self, content_id, status, transcript=None):
+        self.statuses[content_id] = status
+
+    def bulk_update_status(self, content_ids, status):
+        for content_id in content_ids:
+            self.statuses[content_id] = status
+
+    def save_processed(self, processed):
+        self.saved[processed.content_id] = processed
+
+
+class _FakeClient:
+    MAX_INPUT_TOKENS = 1000
+    model_name = "fake-model"
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+        self.truncated = []
+        self.output_budgets = []
+
+    def estimate_tokens(self, text):
+        return len(text.split())
+
+    def truncate_for_context(self, text, max_tokens):
+        self.truncated.append(max_tokens)
+        return " ".join(text.split()[:max_tokens])
+
+    def generate(self, prompt, system_prompt=None, max_output_tokens=None):
+        self.prompts.append(prompt)
+        self.output_budgets.append(max_output_tokens)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _item(name: str, words: int = 600) -> ContentItem:
+    return ContentItem(
+        id=ContentItem.generate_id("test-source", name),
+        source_id="test-source",
+        source_name="Test Source",
+        content_type="article",
+        title=f"Title {name}",
+        url=f"https://example.com/{name}",
+        published_at=datetime(2026, 3, 1),
+        fetched_at=datetime(2026, 3, 2),
+        transcript=" ".join([name] * words),
+        word_count=words,
+    )
+
+
+def _entry(summary: str, index=None) -> dict:
+    entry = {"core_summary": summary, "key_insights": ["one"], "tier": "worth_a_look"}
+    if index is not None:
+        entry["index"] = index
+    return entry
+
+
+# ── Single-item processing ────────────────────────────────────────────────────
+
+
+def test_process_item_truncates_a_copy_and_counts_the_system_prompt_once():
+    items = [_item("alpha", words=5000), _item("beta", words=600)]
+    db = _FakeDb(items)
+    client = _FakeClient([_entry("A"), _entry("B")])
+    client.MAX_INPUT_TOKENS = 4000
+    estimated = []
+    estimate = client.estimate_tokens
+    client.estimate_tokens = lambda text: estimated.append(text) or estimate(text)
+    summarizer = Summarizer(db, client=client)
+
+    assert summarizer.process_item(items[0]) is not None
+    assert summarizer.process_item(items[1]) is not None
+
+    assert items[0].transcript.count("alpha") == 5000
+    assert client.truncated[0] < 5000
+    assert client.prompts[0].endswith("\n" + " ".join(["alpha"] * client.truncated[0]))
+    assert sum("**YOUR VOICE:**" in text for text in estimated) == 1
+    assert not any(item.transcript in text for item in items for text in estimated)
+
+
+# ── Batched processing ────────────────────────────────────────────────────────
+
+
+def test_batched_processing_dispatches_results_by_index():
+    items = [_item("alpha"), _item("beta"), _item("gamma")]
+    db = _FakeDb(items)
+    client = _FakeClient([
+        {"results": [_entry("B summary", index=2), _entry("A summary", index=1)]},
+        {"results": [_entry("C summary", index=1)]},
+    ])
+
+    stats = Summarizer(db, client=client).process_pending_batched(batch_size=2)
+
+    assert stats == {"processed": 3, "failed": 0, "skipped": 0, "total": 3}
+    assert len(client.prompts) == 2
+    assert [db.saved[item.id].core_summary for item in items] == ["A summary", "B summary", "C summary"]
+    assert set(db.statuses.values()) == {"processed"}
+
+
+def test_batched_processing_accepts_a_bare_results_array():
+    items = [_item("alpha"), _item("beta"), _item("gamma")]
+    db = _FakeDb(items)
+    client = _FakeClient([
+        [_entry("B summary", index=2), _entry("A summary", index=1)],
+        ["not an entry"],
+        _entry("C retried"),
+    ])
+
+    stats = Summarizer(db, client=client).process_pending_batched(batch_size=2)
+
+    assert stats == {"processed": 3, "failed": 0, "skipped": 0, "total": 3}
+    assert [db.saved[item.id].core_summary for item in items] == ["A summary", "B summary", "C retried"]
+
+
+def test_batched_processing_pretruncates_each_transcript():
+    items = [_item("alpha", words=900), _item("beta")]
+    db = _FakeDb(items)
+    client = _FakeClient([{"results": [_entry("A", index=1), _entry("B", index=2)]}])
+
+    Summarizer(db, client=client).process_pending_batched(batch_size=2)
+
+    assert client.truncated == [1000 // 3, 1000 // 3]
+    assert items[0].transcript.count("alpha") == 900
+
+
+def test_batched_processing_retries_missing_entries_individually():
+    items = [_item("alpha"), _item("beta"), _item("short", words=10)]
+    db = _FakeDb(items)
+    client = _FakeClient([
+        {"results": [_entry("A", index=1)]},
+        _entry("B retried"),
+    ])
+
+    stats = Summarizer(db, client=client).process_pending_batched(batch_size=4)
+
+    assert stats == {"processed": 2, "failed": 0, "skipped": 1, "total": 3}
+    assert db.saved[items[1].id].core_summary == "B retried"
+    assert db.statuses[items[2].id] == "skipped"
+
+
+def test_failed_batch_call_falls_back_to_items_one_at_a_time():
+    items = [_item("alpha"), _item("beta")]
+    db = _FakeDb(items)
+    client = _FakeClient([None, _entry("A retried"), None])
+
+    stats = Summarizer(db, client=client).process_pending_batched(batch_size=2)
+
+    assert stats == {"processed": 1, "failed": 1, "skipped": 0, "total": 2}
+    assert client.output_budgets == [2 * summarizer.OUTPUT_TOKENS_PER_ITEM, None, None]
+    assert db.saved[items[0].id].core_summary == "A retried"
+    assert db.statuses == {items[0].id: "processed", items[1].id: "failed"}
+
+
+def test_batched_processing_leaves_items_pending_on_timeout():
+    class LLMTimeoutError(Exception):
+        pass
+
+    items = [_item("alpha"), _item("beta")]
+    db = _FakeDb(items)
+    client = _FakeClient([LLMTimeoutError("too slow")])
+
+    stats = Summarizer(db, client=client).process_pending_batched(batch_size=2)
+
+    assert stats["failed"] == 2
+    assert db.statuses == {}
+
+
+# ── Concurrent processing ─────────────────────────────────────────────────────
+
+
+class _SlowClient(_FakeClient):
+    """Fake client whose generate() blocks briefly and tracks overlap."""
+
+    def __init__(self, responses, seconds=0.05):
+        super().__init__(responses)
+        self.seconds = seconds
+        self.active = 0
+        self.peak = 0
+        self.started = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, system_prompt=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.started.append(time.monotonic())
+            response = super().generate(prompt, system_prompt)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.active -= 1
+        return response
+
+
+def test_async_processing_overlaps_llm_calls_up_to_the_concurrency_cap():
+    items = [_item(name) for name in ("alpha", "beta", "gamma", "delta", "eps")]
+    db = _FakeDb(items)
+    client = _SlowClient([_entry(f"summary {i}") for i in range(5)])
+
+    stats = asyncio.run(Summarizer(db, client=client).process_pending_async(concurrency=2))
+
+    assert stats == {"processed": 5, "failed": 0, "skipped": 0, "total": 5}
+    assert client.peak == 2
+    assert len(db.saved) == 5
+    assert len({processed.processed_at for processed in db.saved.values()}) == 1
+
+
+def test_async_processing_spaces_calls_to_the_rpm_limit():
+    items = [_item(name) for name in ("alpha", "beta", "gamma")]
+    db = _FakeDb(items)
+    client = _SlowClient([_entry("A"), _entry("B"), _entry("C")], seconds=0)
+
+    asyncio.run(Summarizer(db, client=client).process_pending_async(concurrency=3, rpm_limit=1200))
+
+    gaps = [b - a for a, b in zip(client.started, client.started[1:])]
+    assert all(gap >= 0.04 for gap in gaps)
+
+
+# ── Pending-item filtering ────────────────────────────────────────────────────
+
+
+def test_unprocessable_items_are_filtered_in_sql_before_the_llm(tmp_path):
+    db = Database(str(tmp_path / "briefing.db"))
+    good, short, empty = _item("alpha"), _item("short", words=10), _item("empty", words=0)
+    empty.transcript = None
+    paywall = _item("paywall", words=600)
+    paywall.transcript = "Upgrade to paid. This post is for paid subscribers. " + paywall.transcript
+    for item in (good, short, empty, paywall):
+        db.save_content(item)
+
+    client = _FakeClient([_entry("A summary")])
+    stats = Summarizer(db, client=client).process_pending()
+
+    assert stats == {"processed": 1, "failed": 0, "skipped": 3, "total": 4}
+    assert len(client.prompts) == 1
+    assert db.count_content_by_status() == {
+        "processed": 1, "skipped": 1, "no_transcript": 1, "paywall": 1,
+    }
+    db.close()
+
+
+def test_limited_run_only_marks_items_in_its_window(tmp_path):
+    db = Database(str(tmp_path / "briefing.db"))
+    short, good, old_short = _item("short", words=10), _item("alpha"), _item("old-short", words=10)
+    for day, item in zip((3, 2, 1), (short, good, old_short)):
+        item.published_at = datetime(2026, 3, day)
+        db.save_content(item)
+
+    client = _FakeClient([_entry("A summary")])
+    stats = Summarizer(db, client=client).process_pending(limit=2)
+
+    assert stats == {"processed": 1, "failed": 0, "skipped": 1, "total": 2}
+    assert db.get_content(old_short.id).status == "pending"
+    db.close()
+
+
+def test_pending_items_are_paywall_scanned_once(monkeypatch):
+    items = [_item("alpha"), _item("beta")]
+    scanned = []
+    monkeypatch.setattr(summarizer, "_is_paywall_content", lambda text: scanned.append(text) or False)
+    client = _FakeClient([_entry("A"), _entry("B")])
+
+    Summarizer(_FakeDb(items), client=client).process_pending()
+
+    assert len(scanned) == 2
+
+
+# ── Blacklist post-processing ─────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_clean_text_replaces_phrases_and_entities_in_one_pass(monkeypatch, use_automaton):
+    if use_automaton and summarizer._BLACKLIST_AUTOMATON is None:
+        pytest.skip("pyahocorasick not installed")
+    if not use_automaton:
+        monkeypatch.setattr(summarizer, "_BLACKLIST_AUTOMATON", None)
+
+    text = "Leveraging AI is a Game-Changer for Enthropic; the message is clear ;  really."
+
+    assert Summarizer._clean_text(text) == (
+        "using AI is a significant shift for Anthropic, really."
+    )
+
+
+# ── Tier calibration ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("words, source_id, llm_tier, content_type, insights, freshness, expected", [
+    (800, "test-source", "deep_dive", "interview", 6, "fresh", "summary_sufficient"),
+    (800, "test-source", "summary_sufficient", "interview", 6, "stale", "summary_sufficient"),
+    (20000, "test-source", "worth_a_look", "framework", 3, "fresh", "deep_dive"),
+    (13000, "stratechery", "worth_a_look", "framework", 3, "fresh", "deep_dive"),
+    (13000, "test-source", "worth_a_look", "interview", 3, "fresh", "deep_dive"),
+    (13000, "test-source", "worth_a_look", "framework", 5, "fresh", "deep_dive"),
+    (13000, "test-source", "worth_a_look", "framework", 4, "fresh", "worth_a_look"),
+    (13000, "test-source", "deep_dive", "framework", 4, "stale", "worth_a_look"),
+    (5000, "test-source", "deep_dive", "framework", 4, "fresh", "deep_dive"),
+])
+def test_calibrate_tier(words, source_id, llm_tier, content_type, insights, freshness, expected):
+    item = _item("alpha", words=words)
+    item.source_id = source_id
+    summarizer_ = Summarizer(_FakeDb([]), client=_FakeClient([]))
+
+    tier, reason = summarizer_._calibrate_tier(item, llm_tier, content_type, ["x"] * insights, freshness)
+
+    assert tier == expected
+    assert bool(reason) == (tier != llm_tier)
@@ -0,0 +1,268 @@
+"""
+Tests for the YouTube fetcher's network-free helpers.
+
+Network calls (yt-dlp, youtube-transcript-api, the Data API) are replaced
+with small fakes so these run offline.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+
+import pytest
+import requests
+
+from src.fetchers import youtube
+from src.fetchers.youtube import YouTubeFetcher
+from src.storage.models import ContentItem, Source
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch) -> YouTubeFetcher:
+    monkeypatch.setenv("TRANSCRIPT_CACHE_DIR", str(tmp_path / "transcripts"))
+    monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path / "http"))
+    source = Source(
+        id="test-channel",
+        name="Test Channel",
+        source_type="youtube_channel",
+        url="https://www.youtube.com/@TestChannel",
+        fetch_since=date(2026, 1, 1),
+    )
+    return YouTubeFetcher(source)
+
+
+class _FakeYoutubeDL:
+    """Stand-in for yt_dlp.YoutubeDL that returns canned durations."""
+
+    durations = {}
+    closed = 0
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def extract_info(self, url, download=False):
+        duration = self.durations[url]
+        if isinstance(duration, Exception):
+            raise duration
+        return {"duration": duration}
+
+    def close(self):
+        type(self).closed += 1
+
+
+# ── yt-dlp duration enrichment ────────────────────────────────────────────────
+
+
+def test_enrich_durations_fills_missing_and_survives_failures(fetcher, monkeypatch):
+    import yt_dlp
+
+    _FakeYoutubeDL.durations = {
+        "https://www.youtube.com/watch?v=aaaaaaaaaaa": 600,
+        "https://www.youtube.com/watch?v=bbbbbbbbbbb": RuntimeError("HTTP Error 429"),
+        "https://www.youtube.com/watch?v=ccccccccccc": 1800.0,
+    }
+    _FakeYoutubeDL.closed = 0
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeYoutubeDL)
+    monkeypatch.setattr(YouTubeFetcher, "YTDLP_BACKOFF_STEP_SECONDS", 0.0)
+
+    videos = [
+        {"video_id": url[-11:], "title": url[-11:], "url": url}
+        for url in _FakeYoutubeDL.durations
+    ]
+    videos.append({"video_id": "ddddddddddd", "title": "known", "url": "unused", "duration_seconds": 300})
+
+    result = fetcher._enrich_durations_via_ytdlp(videos)
+
+    assert [v.get("duration_seconds") for v in result] == [600, None, 1800, 300]
+    assert _FakeYoutubeDL.closed >= 1
+
+
+# ── Transcript batch fetching ─────────────────────────────────────────────────
+
+
+def _make_item(video_id: str):
+    url = f"https://www.youtube.com/watch?v={video_id}"
+    return ContentItem(
+        id=ContentItem.generate_id("test-channel", url),
+        source_id="test-channel",
+        source_name="Test Channel",
+        content_type="video",
+        title=f"Video {video_id}",
+        url=url,
+        published_at=datetime(2026, 3, 1),
+        fetched_at=datetime(2026, 3, 2),
+    )
+
+
+def test_fetch_transcripts_batch_retries_rate_limits(fetcher, monkeypatch):
+    calls = {}
+
+    def fake_fetch(video_id):
+        calls[video_id] = calls.get(video_id, 0) + 1
+        if video_id == "aaaaaaaaaaa" and calls[video_id] == 1:
+            raise RuntimeError("HTTP 429: Too Many Requests")
+        if video_id == "bbbbbbbbbbb":
+            raise youtube.TranscriptsDisabled(video_id)
+        return f"transcript for {video_id}"
+
+    monkeypatch.setattr(fetcher, "_fetch_transcript_text", fake_fetch)
+    monkeypatch.setattr(youtube.time, "sleep", lambda s: None)
+
+    items = [_make_item("aaaaaaaaaaa"), _make_item("bbbbbbbbbbb"), _make_item("ccccccccccc")]
+    results = fetcher.fetch_transcripts_batch(items)
+
+    assert results == {
+        items[0].id: "transcript for aaaaaaaaaaa",
+        items[1].id: None,
+        items[2].id: "transcript for ccccccccccc",
+    }
+    assert calls["aaaaaaaaaaa"] == 2
+    assert fetcher.fetch_transcript(items[2]) == "transcript for ccccccccccc"
+
+
+def test_transcript_cache_skips_network_on_repeat(fetcher, monkeypatch):
+    calls = []
+
+    def fake_fetch(video_id):
+        calls.append(video_id)
+        if video_id == "bbbbbbbbbbb":
+            raise youtube.VideoUnavailable(video_id)
+        return f"transcript for {video_id}"
+
+    monkeypatch.setattr(fetcher, "_fetch_transcript_text", fake_fetch)
+
+    items = [_make_item("aaaaaaaaaaa"), _make_item("bbbbbbbbbbb")]
+    first = fetcher.fetch_transcripts_batch(items)
+    second = fetcher.fetch_transcripts_batch(items)
+
+    assert first == second == {
+        items[0].id: "transcript for aaaaaaaaaaa",
+        items[1].id: None,
+    }
+    assert sorted(calls) == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+    assert (fetcher._transcript_cache_dir / "aaaaaaaaaaa.txt.gz").exists()
+
+
+def test_fetch_all_skips_transcripts_for_known_urls(fetcher, monkeypatch):
+    items = [_make_item("aaaaaaaaaaa"), _make_item("bbbbbbbbbbb")]
+    requested = []
+
+    def fake_batch(batch):
+        requested.extend(item.id for item in batch)
+        return {item.id: f"transcript {item.id}" for item in batch}
+
+    monkeypatch.setattr(fetcher, "fetch_content_list", lambda since=None, limit=None: iter(items))
+    monkeypatch.setattr(fetcher, "fetch_transcripts_batch", fake_batch)
+
+    fetched = list(fetcher.fetch_all(is_known=lambda url: url == items[0].url))
+
+    assert requested == [items[1].id]
+    assert [item.transcript for item in fetched] == [None, f"transcript {items[1].id}"]
+
+
+# ── Transcript cleanup ────────────────────────────────────────────────────────
+
+
+def test_clean_transcript_collapses_whitespace_and_annotations(fetcher):
+    raw = "  hello\n\nworld\t[Music]  again [Applause]\n"
+    assert fetcher._clean_transcript(raw) == "hello world  again"
+
+
+# ── Video ID extraction ───────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42s", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://example.com/article", None),
+])
+def test_extract_video_id(fetcher, url, expected):
+    assert fetcher._extract_video_id(url) == expected
+
+
+# ── Data API requests ─────────────────────────────────────────────────────────
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b"{}", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode()
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+def test_api_get_retries_429_honoring_retry_after(fetcher, monkeypatch):
+    responses = [
+        _FakeResponse(429, headers={"Retry-After": "2"}),
+        _FakeResponse(200, body=b'{"items": [{"id": "UC123"}]}'),
+    ]
+    sleeps = []
+    monkeypatch.setattr(fetcher._session, "get", lambda *a, **kw: responses.pop(0))
+    monkeypatch.setattr(youtube.time, "sleep", sleeps.append)
+
+    assert fetcher._api_get("channels", {}) == {"items": [{"id": "UC123"}]}
+    assert sleeps == [2]
+
+
+def test_transcript_clients_are_reused_across_calls(fetcher, monkeypatch):
+    created = []
+
+    class FakeApi:
+        def __init__(self, http_client=None):
+            created.append(self)
+
+    monkeypatch.setattr(youtube, "YouTubeTranscriptApi", FakeApi)
+    monkeypatch.setattr(fetcher, "_fetch_best_transcript", lambda api, video_id: f"text {video_id}")
+
+    for video_id in ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"]:
+        assert fetcher.fetch_transcript(_make_item(video_id)) == f"text {video_id}"
+
+    assert len(created) == 1
+
+
+def test_conditional_get_reuses_cached_result_on_304(fetcher, monkeypatch):
+    sent_headers = []
+    responses = [
+        _FakeResponse(200, body=b"page v1", headers={"ETag": '"abc"'}),
+        _FakeResponse(304, body=b""),
+    ]
+
+    def fake_get(url, headers=None, timeout=None):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(fetcher._session, "get", fake_get)
+    parse = lambda response: {"length": len(response.text)}
+
+    assert fetcher._conditional_get("https://example.com/videos", parse) == {"length": 7}
+    assert fetcher._conditional_get("https://example.com/videos", parse) == {"length": 7}
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"abc"'
+
+
+def test_conditional_get_caches_each_parser_separately(fetcher, monkeypatch):
+    page = b'"channelId":"UC123" "videoId":"aaaaaaaaaaa"'
+    responses = [
+        _FakeResponse(200, body=page, headers={"ETag": '"abc"'}),
+        _FakeResponse(200, body=page, headers={"ETag": '"abc"'}),
+        _FakeResponse(304, body=b""),
+        _FakeResponse(304, body=b""),
+    ]
+    monkeypatch.setattr(fetcher._session, "get", lambda *a, **kw: responses.pop(0))
+    url = "https://www.youtube.com/@TestChannel/videos"
+
+    for _ in range(2):
+        assert fetcher._conditional_get(url, fetcher._parse_channel_id) == "UC123"
+        videos = fetcher._conditional_get(url, fetcher._parse_scraped_videos)
+        assert [video["video_id"] for video in videos] == ["aaaaaaaaaaa"]
+    assert responses == []